@@ -0,0 +1,102 @@
+"""Measures how many inputs per second `CoffeeMachine.process_input` dispatches.
+
+A scripted session, covering every state and action of the machine, is
+replayed many times, with the console output discarded. It is replayed by
+the current machine, whose transitions are class-level tables, and by a
+copy of the previous dispatch, which built a dictionary of bound methods
+for every input and routed the main menu through an if/elif chain.
+
+Usage:
+    python benchmarks/coffee_machine_dispatch.py [--sessions N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+from hyperskill_python_portfolio.coffee_machine.machine import CoffeeMachine
+from hyperskill_python_portfolio.coffee_machine.models import State
+
+#: The inputs of one session; it ends in the main menu with the same stock.
+SESSION = (
+    *("fill", "800", "175", "48", "3"),
+    *("buy", "1", "buy", "2", "buy", "3", "buy", "back"),
+    *("remaining", "take", "unknown"),
+)
+
+
+class PerCallDispatchMachine(CoffeeMachine):
+    """A coffee machine with the dispatch used before the transition tables."""
+
+    def process_input(self, user_input: str) -> None:
+        """Routes user input through a dictionary built for every call."""
+        state_handlers = {
+            State.MAIN_MENU: self._handle_main_menu,
+            State.CHOOSING_COFFEE: self._handle_buy_or_back,
+            State.FILLING_WATER: self._handle_fill_water,
+            State.FILLING_MILK: self._handle_fill_milk,
+            State.FILLING_BEANS: self._handle_fill_beans,
+            State.FILLING_CUPS: self._handle_fill_cups,
+        }
+        handler = state_handlers.get(self.state)
+        if handler:
+            handler(user_input)
+
+    def _handle_main_menu(self, action: str) -> None:
+        if action == "buy":
+            self.state = State.CHOOSING_COFFEE
+        elif action == "fill":
+            self.state = State.FILLING_WATER
+        elif action == "take":
+            self._take_money()
+        elif action == "remaining":
+            self._print_remaining()
+        elif action == "exit":
+            self.state = State.SHUTDOWN
+
+    def _handle_buy_or_back(self, choice: str) -> None:
+        if choice == "back":
+            self.state = State.MAIN_MENU
+        else:
+            self._handle_buy(choice)
+
+
+MACHINES = {"per_call_dict": PerCallDispatchMachine, "table": CoffeeMachine}
+
+
+def run_mode(machine_class: type[CoffeeMachine], sessions: int, repeat: int) -> float:
+    """Returns the best rate, in inputs per second, of several replays."""
+    inputs = SESSION * sessions
+    best = float("inf")
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        for _ in range(repeat):
+            machine = machine_class(water=400, milk=540, beans=120, cups=9, money=550)
+            process_input = machine.process_input
+            start = time.perf_counter()
+            for user_input in inputs:
+                process_input(user_input)
+            best = min(best, time.perf_counter() - start)
+    return len(inputs) / best
+
+
+def main() -> None:
+    """Replays the session with both dispatchers and prints the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20_000, help="Sessions per replay")
+    parser.add_argument("--repeat", type=int, default=5, help="Replays per dispatcher")
+    args = parser.parse_args()
+
+    results = {}
+    for mode, machine_class in MACHINES.items():
+        results[mode] = {"inputs_per_second": run_mode(machine_class, args.sessions, args.repeat)}
+        print(f"{mode}: {results[mode]['inputs_per_second']:.0f} inputs/s", file=sys.stderr)
+    print(json.dumps({"inputs": len(SESSION) * args.sessions, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
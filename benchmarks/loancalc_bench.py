@@ -0,0 +1,201 @@
+"""Benchmarks the loan calculator, from the core functions to the command line.
+
+Each benchmark is timed with `timeit`, repeated several times, and the best
+time per call is reported, which is the most stable figure across runs. The
+results are printed as JSON and can be saved and compared against a previous
+run to catch performance regressions between versions.
+
+Usage:
+    python benchmarks/loancalc_bench.py [--output FILE] [--compare BASELINE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import timeit
+from argparse import Namespace
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from hyperskill_python_portfolio.loancalc.core import (
+    calculate_annuity_interest,
+    calculate_annuity_payment,
+    calculate_annuity_periods,
+    calculate_annuity_principal,
+    calculate_diff,
+    calculate_diff_summary,
+    iter_diff_payments,
+)
+from hyperskill_python_portfolio.loancalc.handlers import handle_diff
+
+#: The monthly interest rate used by every benchmark (7.5% a year).
+RATE = 7.5 / 1200
+
+#: The small and huge numbers of periods to benchmark.
+PERIOD_COUNTS = {"small": 12, "huge": 100_000}
+
+#: The number of loans in the portfolio used by the batch command benchmark.
+PORTFOLIO_SIZE = 10_000
+
+#: The relative slowdown above which a benchmark counts as a regression.
+DEFAULT_THRESHOLD = 0.2
+
+
+def _time(func: Callable[[], object], repeat: int) -> dict[str, float | int]:
+    """Returns the best time per call of `func` over `repeat` timing runs."""
+    timer = timeit.Timer(func)
+    calls, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=calls))
+    return {"seconds_per_call": best / calls, "calls": calls}
+
+
+def _sum_diff_payments(interest: float, periods: int, principal: int) -> int:
+    """Consumes the lazy differentiated schedule."""
+    return sum(iter_diff_payments(interest, periods, principal))
+
+
+def _core_benchmarks() -> dict[str, Callable[[], object]]:
+    """Builds the benchmarks of the core calculation functions."""
+    benchmarks: dict[str, Callable[[], object]] = {}
+    for size, periods in PERIOD_COUNTS.items():
+        # One above the rounded payment, so even the longest loan is repaid.
+        payment = (calculate_annuity_payment(RATE, periods, 500_000).payment or 0) + 1
+        benchmarks |= {
+            f"core.annuity_payment[{size}]": partial(
+                calculate_annuity_payment, RATE, periods, 500_000
+            ),
+            f"core.annuity_principal[{size}]": partial(
+                calculate_annuity_principal, RATE, periods, payment
+            ),
+            f"core.annuity_periods[{size}]": partial(
+                calculate_annuity_periods, RATE, 500_000, payment
+            ),
+            f"core.annuity_interest[{size}]": partial(
+                calculate_annuity_interest, 500_000, periods, payment
+            ),
+            f"core.diff[{size}]": partial(calculate_diff, RATE, periods, 500_000),
+            f"core.iter_diff_payments[{size}]": partial(
+                _sum_diff_payments, RATE, periods, 500_000
+            ),
+            f"core.diff_summary[{size}]": partial(calculate_diff_summary, RATE, periods, 500_000),
+        }
+    return benchmarks
+
+
+def _run_handle_diff(periods: int) -> None:
+    """Runs the `diff` handler, discarding the formatted schedule."""
+    args = Namespace(principal=500_000, periods=periods, interest=7.5, payment=None)
+    with redirect_stdout(io.StringIO()):
+        handle_diff(args)
+
+
+def _handler_benchmarks() -> dict[str, Callable[[], object]]:
+    """Builds the benchmarks of the `diff` handler, including its formatting."""
+    return {
+        f"handlers.diff[{size}]": partial(_run_handle_diff, periods)
+        for size, periods in PERIOD_COUNTS.items()
+    }
+
+
+def _run_cli(*args: str) -> None:
+    """Runs the `loancalc` command in a fresh interpreter, discarding its output."""
+    command = [sys.executable, "-m", "hyperskill_python_portfolio.loancalc.main", *args]
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL)  # noqa: S603
+
+
+def _cli_benchmarks(workdir: Path) -> dict[str, Callable[[], object]]:
+    """Builds the end-to-end benchmarks, including interpreter startup."""
+    portfolio = workdir / "portfolio.csv"
+    with open(portfolio, "w", encoding="utf-8") as file:
+        file.write("type,principal,payment,periods,interest\n")
+        for n in range(PORTFOLIO_SIZE):
+            file.write(f"annuity,{100_000 + n},,360,7.5\n")
+
+    return {
+        "cli.annuity": partial(
+            _run_cli, "annuity", "--principal", "500000", "--periods", "360", "--interest", "7.5"
+        ),
+        "cli.diff[huge]": partial(
+            _run_cli, "diff", "--principal", "500000", "--periods", "100000", "--interest", "7.5"
+        ),
+        f"cli.batch[{PORTFOLIO_SIZE}]": partial(_run_cli, "batch", str(portfolio)),
+    }
+
+
+def run_benchmarks(repeat: int, only: str | None) -> dict[str, dict[str, float | int]]:
+    """Runs every benchmark whose name contains `only`, or all of them."""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        benchmarks = _core_benchmarks() | _handler_benchmarks() | _cli_benchmarks(Path(workdir))
+        for name, func in benchmarks.items():
+            if only and only not in name:
+                continue
+            results[name] = _time(func, repeat)
+            print(f"{name}: {results[name]['seconds_per_call']:.3e} s", file=sys.stderr)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float | int]], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Returns the names of the benchmarks that regressed against the baseline."""
+    regressions = []
+    previous = baseline.get("results", {})
+    for name, result in results.items():
+        if name not in previous:
+            continue
+        ratio = result["seconds_per_call"] / previous[name]["seconds_per_call"]
+        print(f"{name}: {ratio:.2f}x baseline", file=sys.stderr)
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main() -> None:
+    """Runs the benchmarks, prints or saves the results, and checks for regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="Save the JSON results to this file")
+    parser.add_argument(
+        "--compare", type=Path, help="Compare with the JSON results of a previous run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Relative slowdown that counts as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per benchmark")
+    parser.add_argument("--only", help="Run only the benchmarks whose name contains this text")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeat, args.only)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
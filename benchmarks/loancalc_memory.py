@@ -0,0 +1,76 @@
+"""Measures the memory used by loan calculation results produced in bulk.
+
+Compares the slotted `LoanResult` with the previous layout, a plain frozen
+dataclass that allocated an empty `payments` list for every result, and with
+the column-oriented `LoanBatchResult` of the batch API. The results are
+printed as JSON.
+
+Usage:
+    python benchmarks/loancalc_memory.py [--count N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from hyperskill_python_portfolio.loancalc.batch import batch_annuity_payment
+from hyperskill_python_portfolio.loancalc.core import _annuity_payment
+from hyperskill_python_portfolio.loancalc.models import LoanResult
+
+
+@dataclass(frozen=True)
+class LegacyLoanResult:
+    """The result layout before slots: a `__dict__` and a list per instance."""
+
+    payments: list[int] = field(default_factory=list)
+    payment: int | None = None
+    periods: int | None = None
+    principal: int | None = None
+    overpayment: int = 0
+    description: str | None = None
+
+
+def _measure(build: Callable[[], object]) -> int:
+    """Returns the bytes still allocated by the object that `build` returns."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> None:
+    """Runs the memory benchmark and prints the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="Number of results")
+    count = parser.parse_args().count
+
+    interests = [0.005 + i % 100 / 100_000 for i in range(count)]
+    periods = [360] * count
+    principals = [100_000 + i for i in range(count)]
+    values = list(map(_annuity_payment, interests, periods, principals))
+
+    def legacy() -> list[LegacyLoanResult]:
+        return [LegacyLoanResult(payment=p, overpayment=o) for p, o in values]
+
+    def slotted() -> list[LoanResult]:
+        return [LoanResult(payment=p, overpayment=o) for p, o in values]
+
+    def columns() -> object:
+        return batch_annuity_payment(interests, periods, principals)
+
+    report = {"count": count}
+    for name, build in (("legacy", legacy), ("slotted", slotted), ("columns", columns)):
+        size = _measure(build)
+        report[f"{name}_bytes"] = size
+        report[f"{name}_bytes_per_result"] = round(size / count, 1)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Measures rating file update throughput under concurrent writer processes.
+
+Every writer process saves scores for its own set of users into one shared
+rating file, either one locked rewrite per update (`save_user_score`) or in
+coalesced batches (`CoalescingRatingStore`). The benchmark reports the
+updates per second of each mode and checks that no update was lost.
+
+Usage:
+    python benchmarks/rps_rating_writers.py [--writers N] [--updates N] [--flush-every N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from hyperskill_python_portfolio.rps.file_handler import load_ratings, save_user_score
+from hyperskill_python_portfolio.rps.rating_store import CoalescingRatingStore
+
+#: The number of users already in the rating file before the writers start.
+EXISTING_USERS = 10_000
+
+
+def _write_each(rating_file: Path, updates: int, flush_every: int, writer: int) -> None:
+    """Saves every update with its own locked rewrite."""
+    for n in range(updates):
+        save_user_score(f"writer{writer}-{n}", n, rating_file)
+
+
+def _write_coalesced(rating_file: Path, updates: int, flush_every: int, writer: int) -> None:
+    """Saves the updates in batches of `flush_every`."""
+    with CoalescingRatingStore(rating_file, flush_every=flush_every) as store:
+        for n in range(updates):
+            store.set(f"writer{writer}-{n}", n)
+
+
+MODES = {"each": _write_each, "coalesced": _write_coalesced}
+
+
+def run_mode(mode: str, writers: int, updates: int, flush_every: int) -> dict[str, float | int]:
+    """Runs one mode in a fresh rating file and returns its throughput."""
+    with tempfile.TemporaryDirectory() as workdir:
+        rating_file = Path(workdir) / "rating.txt"
+        rating_file.write_text(
+            "".join(f"player{n} {n}\n" for n in range(EXISTING_USERS)), encoding="utf-8"
+        )
+        writer = partial(MODES[mode], rating_file, updates, flush_every)
+        with ProcessPoolExecutor(writers) as pool:
+            start = time.perf_counter()
+            list(pool.map(writer, range(writers)))
+            elapsed = time.perf_counter() - start
+
+        lost = EXISTING_USERS + writers * updates - len(load_ratings(rating_file))
+    return {"updates_per_second": writers * updates / elapsed, "seconds": elapsed, "lost": lost}
+
+
+def main() -> None:
+    """Runs both modes and prints the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=4, help="Concurrent writer processes")
+    parser.add_argument("--updates", type=int, default=100, help="Updates per writer")
+    parser.add_argument("--flush-every", type=int, default=100, help="Coalesced batch size")
+    args = parser.parse_args()
+
+    results = {}
+    for mode in MODES:
+        results[mode] = run_mode(mode, args.writers, args.updates, args.flush_every)
+        print(f"{mode}: {results[mode]['updates_per_second']:.0f} updates/s", file=sys.stderr)
+    print(json.dumps({"writers": args.writers, "results": results}, indent=2))
+    if any(result["lost"] for result in results.values()):
+        sys.exit("Some updates were lost.")
+
+
+if __name__ == "__main__":
+    main()
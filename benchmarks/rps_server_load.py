@@ -0,0 +1,97 @@
+"""Generates load on the Rock-Paper-Scissors server and measures its latency.
+
+A number of clients connect concurrently, and each plays several complete
+sessions: it sends a name and the default rules, plays a number of turns and
+exits. The benchmark reports the completed sessions per second and the
+median and 99th percentile latency of a turn, from sending a move to
+receiving the reply.
+
+Without `--port`, a server is started in the same process on a free port,
+with a temporary rating file.
+
+Usage:
+    python benchmarks/rps_server_load.py [--clients N] [--sessions N] [--turns N] [--port N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from hyperskill_python_portfolio.rps.game_logic import DEFAULT_OPTIONS
+from hyperskill_python_portfolio.rps.server import running_server
+
+
+async def _play_sessions(
+    host: str, port: int, client: int, sessions: int, turns: int, latencies: list[float]
+) -> None:
+    """Plays several sessions in a row, recording the latency of every turn."""
+    for session in range(sessions):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(f"player{client}-{session}\n\n".encode())
+        await reader.readline()  # Hello
+        await reader.readline()  # Okay, let's start
+        for turn in range(turns):
+            start = time.perf_counter()
+            writer.write(f"{DEFAULT_OPTIONS[turn % len(DEFAULT_OPTIONS)]}\n".encode())
+            await reader.readline()
+            latencies.append(time.perf_counter() - start)
+        writer.write(b"!exit\n")
+        await reader.readline()  # Bye!
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load(
+    host: str, port: int, clients: int, sessions: int, turns: int
+) -> dict[str, float | int]:
+    """Runs all clients concurrently and summarizes the measurements."""
+    latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(_play_sessions(host, port, n, sessions, turns, latencies) for n in range(clients))
+    )
+    elapsed = time.perf_counter() - start
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "sessions": clients * sessions,
+        "sessions_per_second": clients * sessions / elapsed,
+        "turn_p50_ms": percentiles[49] * 1000,
+        "turn_p99_ms": percentiles[98] * 1000,
+    }
+
+
+async def _run_with_local_server(args: argparse.Namespace) -> dict[str, float | int]:
+    """Starts a server on a free port, runs the load, and stops the server."""
+    with tempfile.TemporaryDirectory() as workdir:
+        async with running_server(args.host, 0, Path(workdir) / "rating.txt") as server:
+            port = server.sockets[0].getsockname()[1]
+            return await run_load(args.host, port, args.clients, args.sessions, args.turns)
+
+
+def main() -> None:
+    """Runs the load test and prints the results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="Server address")
+    parser.add_argument("--port", type=int, help="Server port; starts a local server if omitted")
+    parser.add_argument("--clients", type=int, default=500, help="Concurrent clients")
+    parser.add_argument("--sessions", type=int, default=4, help="Sessions per client")
+    parser.add_argument("--turns", type=int, default=20, help="Turns per session")
+    args = parser.parse_args()
+
+    if args.port is None:
+        results = asyncio.run(_run_with_local_server(args))
+    else:
+        results = asyncio.run(
+            run_load(args.host, args.port, args.clients, args.sessions, args.turns)
+        )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+"""This module answers capacity questions about a coffee machine's stock.
+
+`max_servings` tells how many of each drink the current stock can still
+make, and `best_mix` finds the combination of drinks that earns the most
+money from it. Both take an `Inventory`, e.g., `CoffeeMachine.inventory` or
+`Fleet.inventory(i)`. `max_servings` is a handful of divisions per recipe;
+`best_mix` is a branch and bound whose work depends on the menu rather than
+the size of the stock, and it caches its answers by stock and menu.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from itertools import combinations
+
+from .models import RECIPES, CoffeeRecipe, Inventory
+
+#: The maximum number of distinct stock levels kept by the capacity caches.
+CAPACITY_CACHE_SIZE = 4096
+
+#: The resources a recipe consumes, in the order of `_Needs`.
+_RESOURCES = ("water", "milk", "beans", "cups")
+
+#: Amounts of water, milk, beans and cups.
+_Needs = tuple[int, int, int, int]
+
+#: The slack allowed in float comparisons against revenue bounds.
+_TOLERANCE = 1e-6
+
+
+@dataclass(frozen=True, slots=True)
+class Mix:
+    """Represents a combination of drinks made from a machine's stock.
+
+    Attributes:
+        counts: The number of servings of each recipe, by menu key.
+        revenue: The money earned by selling all of them.
+    """
+
+    counts: Mapping[str, int]
+    revenue: int
+
+
+def _stock(inventory: Inventory) -> _Needs:
+    """Returns the consumable resources of an inventory."""
+    return inventory.water, inventory.milk, inventory.beans, inventory.cups
+
+
+def _needs(recipe: CoffeeRecipe) -> _Needs:
+    """Returns the resources one serving of a recipe consumes.
+
+    Raises:
+        ValueError: If the recipe consumes nothing, so its servings are unbounded.
+    """
+    needs = (recipe.water_ml, recipe.milk_ml, recipe.beans_g, recipe.cups)
+    if not any(needs):
+        raise ValueError(f"Recipe '{recipe.name}' consumes no resources.")
+    return needs
+
+
+def _servings(stock: _Needs, needs: _Needs) -> int:
+    """Returns how many servings with the given needs the stock can make."""
+    return min(amount // need for amount, need in zip(stock, needs, strict=True) if need)
+
+
+def max_servings(
+    inventory: Inventory, recipes: Mapping[str, CoffeeRecipe] = RECIPES
+) -> dict[str, int]:
+    """Returns how many servings of each recipe the stock can make on its own.
+
+    Args:
+        inventory: The stock of the machine.
+        recipes: The menu, keyed by choice.
+
+    Returns:
+        The maximum number of servings of every recipe, by menu key.
+    """
+    stock = _stock(inventory)
+    return {key: _servings(stock, _needs(recipe)) for key, recipe in recipes.items()}
+
+
+def _solve(rows: Sequence[Sequence[int]], rhs: Sequence[int]) -> list[Fraction] | None:
+    """Solves a square linear system exactly, or returns `None` if it is singular."""
+    size = len(rows)
+    matrix = [[Fraction(x) for x in row] + [Fraction(b)] for row, b in zip(rows, rhs, strict=True)]
+    for col in range(size):
+        pivot = next((r for r in range(col, size) if matrix[r][col]), None)
+        if pivot is None:
+            return None
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        for r in range(size):
+            if r != col and matrix[r][col]:
+                factor = matrix[r][col] / matrix[col][col]
+                matrix[r] = [x - factor * y for x, y in zip(matrix[r], matrix[col], strict=True)]
+    return [matrix[r][size] / matrix[r][r] for r in range(size)]
+
+
+@lru_cache(maxsize=CAPACITY_CACHE_SIZE)
+def _dual_vertices(items: tuple[tuple[_Needs, int], ...]) -> tuple[tuple[float, ...], ...]:
+    """Returns the vertices of the dual of the mix problem of the given items.
+
+    Every vector `y` of prices per unit of resource that values each serving
+    at least at its price (`y . needs >= price`) bounds the revenue of any
+    mix by `y . stock`. The smallest such bound, which is the revenue of the
+    fractional relaxation, is attained at a vertex of this region, and the
+    vertices do not depend on the stock, so they are found once per menu: by
+    solving every system of `len(_RESOURCES)` active constraints.
+    """
+    size = len(_RESOURCES)
+    constraints = [(list(needs), price) for needs, price in items]
+    constraints += [([int(r == c) for c in range(size)], 0) for r in range(size)]
+    vertices = set()
+    for active in combinations(constraints, size):
+        y = _solve([row for row, _ in active], [rhs for _, rhs in active])
+        if y is None or any(v < 0 for v in y):
+            continue
+        if all(
+            sum(n * v for n, v in zip(needs, y, strict=True)) >= price for needs, price in items
+        ):
+            vertices.add(tuple(y))
+    return tuple(tuple(float(v) for v in vertex) for vertex in vertices)
+
+
+def _count_bounds(
+    lines: Sequence[tuple[float, float]], target: int, limit: int
+) -> tuple[int, int]:
+    """Returns the interval of counts, within `[0, limit]`, where every line reaches `target`.
+
+    Each line is an `(intercept, slope)` pair, i.e., the bound
+    `intercept + slope * count`. The interval is empty if its low end is
+    above its high end.
+    """
+    low, high = 0.0, float(limit)
+    for intercept, slope in lines:
+        gap = target - _TOLERANCE - intercept
+        if slope > 0:
+            low = max(low, gap / slope)
+        elif slope < 0:
+            high = min(high, gap / slope)
+        elif gap > 0:
+            return 1, 0
+    return math.ceil(low), math.floor(high)
+
+
+def _peak(lines: Sequence[tuple[float, float]], low: int, high: int) -> int:
+    """Returns the count within `[low, high]` where the lowest of the lines is highest.
+
+    The lowest line is concave in the count, so its maximum is at an end of
+    the interval or next to a crossing of two lines.
+    """
+    points = {low, high}
+    for (intercept_1, slope_1), (intercept_2, slope_2) in combinations(lines, 2):
+        if slope_1 != slope_2:
+            crossing = (intercept_2 - intercept_1) / (slope_1 - slope_2)
+            if low < crossing < high:
+                points.update((math.floor(crossing), math.ceil(crossing)))
+    return max(
+        sorted(points, reverse=True),
+        key=lambda count: min(intercept + slope * count for intercept, slope in lines),
+    )
+
+
+@lru_cache(maxsize=CAPACITY_CACHE_SIZE)
+def _best_mix(stock: _Needs, items: tuple[tuple[_Needs, int], ...]) -> tuple[tuple[int, ...], int]:
+    """Finds the servings of every item that maximize the revenue.
+
+    A depth-first branch and bound: each level fixes the servings of one
+    item, and the last item takes everything left. The bound of a count is
+    the revenue of that count plus the fractional relaxation of the items
+    still open: the minimum over the dual vertices `y` of
+    `y . (stock - count * needs)`. As a function of the count, each vertex
+    gives a line, so the counts whose bound can still beat the best mix
+    found so far form an interval. Only that interval is searched, starting
+    at the best count of the relaxation, and it narrows as the best mix
+    improves, so the work does not grow with the size of the stock.
+    """
+    best_counts, best_revenue = (0,) * len(items), 0
+    counts = [0] * len(items)
+    # For each level, every dual vertex of the items after it, with the
+    # slope of its bound in the count of the level's own item.
+    duals = [
+        [
+            (vertex, price - sum(v * n for v, n in zip(vertex, needs, strict=True)))
+            for vertex in _dual_vertices(items[index + 1 :])
+        ]
+        for index, (needs, price) in enumerate(items[:-1])
+    ]
+
+    def search(index: int, stock: _Needs, revenue: int) -> None:
+        nonlocal best_counts, best_revenue
+        needs, price = items[index]
+        limit = _servings(stock, needs)
+        if index == len(items) - 1:
+            if revenue + limit * price > best_revenue:
+                counts[index] = limit
+                best_counts, best_revenue = tuple(counts), revenue + limit * price
+            return
+        water, milk, beans, cups = stock
+        water_ml, milk_ml, beans_g, cups_needed = needs
+        lines = [
+            (revenue + y_water * water + y_milk * milk + y_beans * beans + y_cups * cups, slope)
+            for (y_water, y_milk, y_beans, y_cups), slope in duals[index]
+        ]
+
+        def visit(count: int) -> tuple[int, int]:
+            """Searches the mix with `count` servings and returns the counts still open."""
+            counts[index] = count
+            left = (
+                water - count * water_ml,
+                milk - count * milk_ml,
+                beans - count * beans_g,
+                cups - count * cups_needed,
+            )
+            search(index + 1, left, revenue + count * price)
+            return _count_bounds(lines, best_revenue + 1, limit)
+
+        low, high = _count_bounds(lines, best_revenue + 1, limit)
+        if low > high:
+            return
+        # Start from the best count of the relaxation and move away from it
+        # in both directions, while the narrowing interval allows.
+        peak = count = _peak(lines, low, high)
+        while count >= low:
+            low, high = visit(count)
+            count = min(count - 1, high)
+        count = peak + 1
+        while count <= high:
+            low, high = visit(count)
+            count = max(count + 1, low)
+
+    if items:
+        search(0, stock, 0)
+    return best_counts, best_revenue
+
+
+def best_mix(inventory: Inventory, recipes: Mapping[str, CoffeeRecipe] = RECIPES) -> Mix:
+    """Finds the combination of drinks that earns the most from the stock.
+
+    This is a small integer program: maximize the revenue of the servings of
+    every recipe, subject to the stock of each resource. It is solved
+    exactly by branch and bound, and cached by stock and menu.
+
+    Args:
+        inventory: The stock of the machine.
+        recipes: The menu, keyed by choice.
+
+    Returns:
+        The servings of every recipe in the best mix and its revenue.
+    """
+    # The most expensive drinks first, so good mixes are found early.
+    ranked = sorted(recipes.items(), key=lambda item: -item[1].price_usd)
+    items = tuple((_needs(recipe), recipe.price_usd) for _, recipe in ranked)
+    counts, revenue = _best_mix(_stock(inventory), items)
+    by_key = {key: count for (key, _), count in zip(ranked, counts, strict=True)}
+    return Mix({key: by_key[key] for key in recipes}, revenue)
@@ -0,0 +1,146 @@
+"""This module provides a headless engine for scripted coffee machine sessions.
+
+Instead of keystrokes and printed messages, the engine takes typed commands
+(`Buy`, `Fill`, `Take`) and answers each of them with a typed event, using
+the non-printing operations of `CoffeeMachine`. This makes it possible to
+replay whole days of vending transactions, e.g., for reconciliation.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+
+from .machine import CoffeeMachine
+from .models import CoffeeRecipe
+
+# --- Commands ---
+
+
+@dataclass(frozen=True, slots=True)
+class Buy:
+    """Buys one coffee, chosen by its menu key (e.g., "1" for espresso)."""
+
+    choice: str
+
+
+@dataclass(frozen=True, slots=True)
+class Fill:
+    """Adds supplies to the machine."""
+
+    water: int = 0
+    milk: int = 0
+    beans: int = 0
+    cups: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Take:
+    """Takes all the money out of the machine."""
+
+
+Command = Buy | Fill | Take
+
+# --- Events ---
+
+
+@dataclass(frozen=True, slots=True)
+class Sold:
+    """A coffee was made and paid for."""
+
+    recipe: str
+    price: int
+
+
+@dataclass(frozen=True, slots=True)
+class OutOfStock:
+    """A coffee could not be made because a resource ran short."""
+
+    recipe: str
+    missing: str
+
+
+@dataclass(frozen=True, slots=True)
+class Filled:
+    """Supplies were added to the machine."""
+
+    water: int
+    milk: int
+    beans: int
+    cups: int
+
+
+@dataclass(frozen=True, slots=True)
+class Withdrawn:
+    """The money was taken out of the machine."""
+
+    amount: int
+
+
+@dataclass(frozen=True, slots=True)
+class Rejected:
+    """A command could not be applied at all."""
+
+    command: Command
+    reason: str
+
+
+Event = Sold | OutOfStock | Filled | Withdrawn | Rejected
+
+
+class CoffeeEngine:
+    """Applies typed commands to a coffee machine and reports typed events."""
+
+    def __init__(
+        self, machine: CoffeeMachine, recipes: Mapping[str, CoffeeRecipe] | None = None
+    ) -> None:
+        """Creates an engine that drives the given machine.
+
+        Args:
+            machine: The machine whose resources the commands change.
+            recipes: The menu, keyed by the choice of a `Buy` command;
+                defaults to the menu of the machine.
+        """
+        self.machine = machine
+        self.recipes = machine.recipes if recipes is None else recipes
+
+    def apply(self, command: Command) -> Event:
+        """Applies a single command and returns its outcome."""
+        match command:
+            case Buy(choice):
+                recipe = self.recipes.get(choice)
+                if recipe is None:
+                    return Rejected(command, f"Unknown recipe: {choice!r}")
+                missing = self.machine.buy(recipe)
+                if missing is None:
+                    return Sold(recipe.name, recipe.price_usd)
+                return OutOfStock(recipe.name, missing)
+            case Fill(water, milk, beans, cups):
+                self.machine.fill(water, milk, beans, cups)
+                return Filled(water, milk, beans, cups)
+            case Take():
+                return Withdrawn(self.machine.take())
+        return Rejected(command, f"Unknown command: {command!r}")
+
+    def run(self, commands: Iterable[Command]) -> Iterator[Event]:
+        """Lazily applies a stream of commands in order, yielding one event each."""
+        return map(self.apply, commands)
+
+
+def parse_command(line: str) -> Command:
+    """Parses a command from a line of a transaction log.
+
+    The formats are `buy <choice>`, `fill <water> <milk> <beans> <cups>`
+    and `take`, separated by whitespace.
+
+    Raises:
+        ValueError: If the line is not a valid command.
+    """
+    match line.split():
+        case ["buy", choice]:
+            return Buy(choice)
+        case ["fill", water, milk, beans, cups]:
+            return Fill(int(water), int(milk), int(beans), int(cups))
+        case ["take"]:
+            return Take()
+    raise ValueError(f"Invalid command: {line.strip()!r}")
@@ -0,0 +1,160 @@
+"""This module simulates a fleet of coffee machines.
+
+Instead of one `CoffeeMachine` object per machine, the inventories of the
+whole fleet are stored column by column in compact `array` buffers, one
+element per machine. A batch of orders is then applied in a single tight
+loop over plain integers, with the same resource checks as a single
+machine, and the stockouts are reported per machine, e.g., to plan refill
+routes.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, fields
+
+from .models import RECIPES, CoffeeRecipe, Inventory
+
+#: The typecode of the inventory columns (signed 64-bit integers).
+TYPECODE = "q"
+
+
+def _zeros(size: int) -> array[int]:
+    """Returns a column of `size` zeros."""
+    return array(TYPECODE, bytes(size * array(TYPECODE).itemsize))
+
+
+@dataclass(frozen=True)
+class FleetReport:
+    """Represents the outcome of a batch of orders, per machine.
+
+    Attributes:
+        served: The number of orders each machine served.
+        refused: The number of orders each machine refused for lack of a resource.
+        shortages: The first resource that ran short, for every machine that
+            refused an order, named as in the console messages.
+    """
+
+    served: array[int]
+    refused: array[int]
+    shortages: dict[int, str] = field(default_factory=dict)
+
+    def stocked_out(self) -> list[int]:
+        """Returns the machines that refused at least one order, in order."""
+        return sorted(self.shortages)
+
+
+@dataclass(frozen=True)
+class Fleet:
+    """Represents the inventories of many coffee machines, stored as columns.
+
+    All columns have the same length: one element per machine, so machine
+    `i` is described by `water[i]`, `milk[i]`, and so on.
+
+    Attributes:
+        water: The water of every machine, in ml.
+        milk: The milk of every machine, in ml.
+        beans: The coffee beans of every machine, in grams.
+        cups: The disposable cups of every machine.
+        money: The cash of every machine, in dollars.
+    """
+
+    water: array[int]
+    milk: array[int]
+    beans: array[int]
+    cups: array[int]
+    money: array[int]
+
+    @classmethod
+    def uniform(cls, size: int, inventory: Inventory) -> Fleet:
+        """Creates a fleet of `size` machines that all hold the same inventory."""
+        return cls(
+            *(array(TYPECODE, [getattr(inventory, column.name)]) * size for column in fields(cls))
+        )
+
+    def __len__(self) -> int:
+        """Returns the number of machines in the fleet."""
+        return len(self.water)
+
+    def inventory(self, machine: int) -> Inventory:
+        """Returns the inventory of a single machine."""
+        return Inventory(
+            self.water[machine],
+            self.milk[machine],
+            self.beans[machine],
+            self.cups[machine],
+            self.money[machine],
+        )
+
+    def fill(self, machine: int, supplies: Inventory) -> None:
+        """Adds supplies to a single machine."""
+        self.water[machine] += supplies.water
+        self.milk[machine] += supplies.milk
+        self.beans[machine] += supplies.beans
+        self.cups[machine] += supplies.cups
+        self.money[machine] += supplies.money
+
+    def apply_orders(
+        self,
+        machines: Sequence[int],
+        choices: Sequence[str],
+        recipes: Mapping[str, CoffeeRecipe] = RECIPES,
+    ) -> FleetReport:
+        """Applies a batch of orders, in order, to the machines of the fleet.
+
+        Each order is served like `CoffeeMachine.buy`: the machine must have
+        enough water, milk, coffee beans and cups, checked in that order;
+        otherwise the order is refused and the inventory left unchanged.
+
+        Args:
+            machines: The machine of every order.
+            choices: The recipe key of every order, e.g., "1" for espresso.
+            recipes: The menu of the fleet.
+
+        Returns:
+            The orders served and refused by every machine.
+
+        Raises:
+            ValueError: If the sequences differ in length, or an order names
+                an unknown recipe or a machine outside the fleet. Nothing
+                is applied then.
+        """
+        if len(machines) != len(choices):
+            raise ValueError("Machines and choices must have the same length.")
+        unknown = set(choices) - recipes.keys()
+        if unknown:
+            raise ValueError(f"Unknown recipes: {', '.join(sorted(unknown))}")
+        if machines and not 0 <= min(machines) <= max(machines) < len(self):
+            raise ValueError(f"Machines must be between 0 and {len(self) - 1}.")
+
+        needs = {
+            key: (recipe.water_ml, recipe.milk_ml, recipe.beans_g, recipe.cups, recipe.price_usd)
+            for key, recipe in recipes.items()
+        }
+        report = FleetReport(_zeros(len(self)), _zeros(len(self)))
+        served, refused, shortages = report.served, report.refused, report.shortages
+        water, milk, beans, cups, money = self.water, self.milk, self.beans, self.cups, self.money
+
+        for machine, choice in zip(machines, choices, strict=True):
+            water_ml, milk_ml, beans_g, cups_needed, price = needs[choice]
+            if water[machine] < water_ml:
+                missing = "water"
+            elif milk[machine] < milk_ml:
+                missing = "milk"
+            elif beans[machine] < beans_g:
+                missing = "coffee beans"
+            elif cups[machine] < cups_needed:
+                missing = "disposable cups"
+            else:
+                water[machine] -= water_ml
+                milk[machine] -= milk_ml
+                beans[machine] -= beans_g
+                cups[machine] -= cups_needed
+                money[machine] += price
+                served[machine] += 1
+                continue
+            refused[machine] += 1
+            shortages.setdefault(machine, missing)
+
+        return report
@@ -0,0 +1,258 @@
+"""This module provides an event-sourced ledger of a coffee machine's state.
+
+Every change to the machine's resources or cash is appended to a JSONL log
+as an entry holding the change itself, so the state at any point is the sum
+of all entries up to that point. Every `snapshot_every` entries, the state
+is also appended to a snapshot file, together with the byte offset of the
+log at that point.
+
+On restart, only the last snapshot and the log tail behind its offset are
+read, so recovery time does not grow with the age of the log. For audits,
+`state_at` reconstructs the state at any earlier time the same way, from
+the last snapshot taken before it.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Self
+
+from .models import Inventory
+
+logger = logging.getLogger(__name__)
+
+#: The default number of log entries between two snapshots.
+DEFAULT_SNAPSHOT_EVERY = 1000
+
+#: The number of bytes read at a time when reading a file backwards.
+_BLOCK_SIZE = 4096
+
+
+def _lines_from_end(file: BinaryIO) -> Iterator[bytes]:
+    """Yields the lines of a file, last first, reading it backwards in blocks.
+
+    The first line yielded is whatever follows the final newline: empty for
+    a complete file, or the torn remains of an interrupted write.
+    """
+    position = file.seek(0, os.SEEK_END)
+    head = b""
+    while position > 0:
+        size = min(_BLOCK_SIZE, position)
+        position -= size
+        file.seek(position)
+        head, *lines = (file.read(size) + head).split(b"\n")
+        yield from reversed(lines)
+    yield head
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerEntry:
+    """A single change to the state of a coffee machine.
+
+    Attributes:
+        seq: The position of the entry in the log, starting from 1.
+        time: When the change happened, in seconds since the epoch.
+        kind: What caused the change, e.g., "open", "sold:latte", "fill" or "take".
+        delta: The change to the resources and cash.
+    """
+
+    seq: int
+    time: float
+    kind: str
+    delta: Inventory
+
+    def to_json(self) -> str:
+        """Serializes the entry to a single JSON line."""
+        return json.dumps(
+            {"seq": self.seq, "time": self.time, "kind": self.kind, "delta": asdict(self.delta)}
+        )
+
+    @classmethod
+    def from_json(cls, line: str | bytes) -> LedgerEntry:
+        """Deserializes an entry written by `to_json`."""
+        data = json.loads(line)
+        return cls(data["seq"], data["time"], data["kind"], Inventory(**data["delta"]))
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """The full state of a machine after a given log entry.
+
+    Attributes:
+        seq: The last log entry included in the state.
+        time: The time of that entry.
+        offset: The byte offset of the log right after that entry.
+        state: The resources and cash at that point.
+    """
+
+    seq: int = 0
+    time: float = 0.0
+    offset: int = 0
+    state: Inventory = field(default_factory=Inventory)
+
+
+class Ledger:
+    """An append-only log of state changes with periodic snapshots.
+
+    The log lives in `ledger.jsonl` and the snapshots in `snapshots.jsonl`,
+    both inside the given directory.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        snapshot_every: int | None = DEFAULT_SNAPSHOT_EVERY,
+        sync: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Recovers the current state and opens the log for appending.
+
+        Args:
+            directory: The directory of the log and snapshot files.
+            snapshot_every: Take a snapshot after this many entries, or only
+                on demand if `None`.
+            sync: Whether to `fsync` the log after every entry.
+            clock: The source of entry timestamps.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        self.log_path = directory / "ledger.jsonl"
+        self.snapshot_path = directory / "snapshots.jsonl"
+        self.snapshot_every = snapshot_every
+        self.sync = sync
+        self.clock = clock
+
+        last = self._last_snapshot()
+        self.seq, self.time, self.state = last.seq, last.time, last.state
+        for entry in self._read_log(last.offset):
+            self.seq, self.time, self.state = entry.seq, entry.time, self.state + entry.delta
+        self.pending = self.seq - last.seq
+        self._log = open(self.log_path, "ab")
+
+    def _last_snapshot(self) -> Snapshot:
+        """Returns the last complete snapshot, or an empty one.
+
+        The snapshot file is read backwards from its end, so only the last
+        snapshots are parsed, however long the history.
+        """
+        try:
+            file = open(self.snapshot_path, "rb")
+        except FileNotFoundError:
+            return Snapshot()
+        with file:
+            lines = _lines_from_end(file)
+            if next(lines):
+                logger.warning("Skipping torn snapshot in %s", self.snapshot_path)
+            for line in lines:
+                try:
+                    return self._parse_snapshot(line)
+                except json.JSONDecodeError:
+                    logger.warning("Skipping torn snapshot in %s", self.snapshot_path)
+        return Snapshot()
+
+    @staticmethod
+    def _parse_snapshot(line: str | bytes) -> Snapshot:
+        """Deserializes a snapshot written by `snapshot`."""
+        data = json.loads(line)
+        data["state"] = Inventory(**data["state"])
+        return Snapshot(**data)
+
+    def snapshots(self) -> Iterator[Snapshot]:
+        """Yields every complete snapshot, oldest first."""
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        yield self._parse_snapshot(line)
+                    except json.JSONDecodeError:
+                        logger.warning("Skipping torn snapshot in %s", self.snapshot_path)
+        except FileNotFoundError:
+            return
+
+    def _read_log(self, offset: int) -> Iterator[LedgerEntry]:
+        """Yields the log entries from a byte offset, dropping a torn final entry."""
+        try:
+            file = open(self.log_path, "r+b")
+        except FileNotFoundError:
+            return
+        with file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    # A crash interrupted the last append; drop the partial entry.
+                    logger.warning("Truncating torn entry at the end of %s", self.log_path)
+                    file.truncate(offset)
+                    return
+                offset += len(line)
+                yield LedgerEntry.from_json(line)
+
+    def entries(self) -> Iterator[LedgerEntry]:
+        """Yields every entry of the log, oldest first."""
+        self._log.flush()
+        yield from self._read_log(0)
+
+    def record(self, kind: str, delta: Inventory) -> LedgerEntry:
+        """Appends a state change to the log, taking a snapshot if one is due."""
+        entry = LedgerEntry(self.seq + 1, self.clock(), kind, delta)
+        self._log.write(entry.to_json().encode() + b"\n")
+        self._log.flush()
+        if self.sync:
+            os.fsync(self._log.fileno())
+        self.seq, self.time, self.state = entry.seq, entry.time, self.state + delta
+        self.pending += 1
+        if self.snapshot_every is not None and self.pending >= self.snapshot_every:
+            self.snapshot()
+        return entry
+
+    def snapshot(self) -> Snapshot:
+        """Appends the current state to the snapshot file."""
+        self._log.flush()
+        os.fsync(self._log.fileno())  # The snapshot must never be ahead of the log.
+        snapshot = Snapshot(self.seq, self.time, self._log.tell(), self.state)
+        with open(self.snapshot_path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(asdict(snapshot)) + "\n")
+        self.pending = 0
+        return snapshot
+
+    def state_at(self, when: float) -> Inventory:
+        """Reconstructs the state at a point in time.
+
+        The replay starts from the last snapshot taken at or before `when`
+        and applies the log entries up to and including `when`.
+        """
+        start = Snapshot()
+        for snapshot in self.snapshots():
+            if snapshot.time > when:
+                break
+            start = snapshot
+
+        self._log.flush()
+        state = start.state
+        for entry in self._read_log(start.offset):
+            if entry.time > when:
+                break
+            state += entry.delta
+        return state
+
+    def close(self) -> None:
+        """Closes the log."""
+        self._log.close()
+
+    def __enter__(self) -> Self:
+        """Returns the ledger itself for use in a `with` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Closes the log when leaving a `with` block."""
+        self.close()
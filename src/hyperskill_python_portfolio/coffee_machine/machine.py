@@ -1,14 +1,32 @@
 """This module defines the core CoffeeMachine class.
 
 It contains the state machine logic, resource management, and all the
-operations the coffee machine can perform.
+operations the coffee machine can perform. The operations themselves
+(`buy`, `fill` and `take`) never print, so they can also be driven
+headlessly; the state handlers add the console messages around them.
+
+The transitions are class-level tables built once, when the class is
+defined: `_ACTIONS` maps a state and an exact input, such as a main menu
+command, to an action, and `_HANDLERS` maps a state to the handler of any
+other input in it, such as an amount or a recipe choice.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
 from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar
+
+from .models import RECIPES, CoffeeRecipe, Inventory, State
+
+if TYPE_CHECKING:
+    from .ledger import Ledger
 
-from .models import RECIPES, CoffeeRecipe, State
+
+def _menu_prompt(recipes: Mapping[str, CoffeeRecipe]) -> str:
+    """Returns the prompt that offers the recipes of a menu."""
+    choices = ", ".join(f"{choice} - {recipe.name}" for choice, recipe in recipes.items())
+    return f"What do you want to buy? {choices}, back - to main menu: "
 
 
 class CoffeeMachine:
@@ -17,8 +35,6 @@ class CoffeeMachine:
     _PROMPTS = MappingProxyType(
         {
             State.MAIN_MENU: "Write action (buy, fill, take, remaining, exit): ",
-            State.CHOOSING_COFFEE: "What do you want to buy? "
-            "1 - espresso, 2 - latte, 3 - cappuccino, back - to main menu: ",
             State.FILLING_WATER: "Write how many ml of water you want to add:",
             State.FILLING_MILK: "Write how many ml of milk you want to add:",
             State.FILLING_BEANS: "Write how many grams of coffee beans you want to add:",
@@ -26,14 +42,63 @@ class CoffeeMachine:
         }
     )
 
-    def __init__(self, water: int, milk: int, beans: int, cups: int, money: int) -> None:
-        """Initializes the coffee machine with the given resources."""
+    def __init__(
+        self,
+        water: int,
+        milk: int,
+        beans: int,
+        cups: int,
+        money: int,
+        ledger: Ledger | None = None,
+        recipes: Mapping[str, CoffeeRecipe] = RECIPES,
+    ) -> None:
+        """Initializes the coffee machine with the given resources.
+
+        Args:
+            water: The water in ml.
+            milk: The milk in ml.
+            beans: The coffee beans in grams.
+            cups: The number of disposable cups.
+            money: The cash in dollars.
+            ledger: An optional ledger that records every change to the
+                resources and cash. A new ledger starts with an "open" entry
+                for the initial resources; an existing one must match them
+                (see `from_ledger`).
+            recipes: The menu, keyed by the choice typed at the prompt, e.g.,
+                loaded with `load_recipes`.
+
+        Raises:
+            ValueError: If the resources do not match an existing ledger.
+        """
         self.water = water
         self.milk = milk
         self.beans = beans
         self.cups = cups
         self.money = money
         self.state = State.MAIN_MENU
+        self.ledger = ledger
+        self.recipes = recipes
+        self._prompts = MappingProxyType(
+            {**self._PROMPTS, State.CHOOSING_COFFEE: _menu_prompt(recipes)}
+        )
+        if ledger is not None:
+            if not ledger.seq:
+                ledger.record("open", self.inventory)
+            elif ledger.state != self.inventory:
+                raise ValueError("The resources do not match the ledger.")
+
+    @classmethod
+    def from_ledger(
+        cls, ledger: Ledger, recipes: Mapping[str, CoffeeRecipe] = RECIPES
+    ) -> CoffeeMachine:
+        """Restores a coffee machine from the current state of its ledger."""
+        state = ledger.state
+        return cls(state.water, state.milk, state.beans, state.cups, state.money, ledger, recipes)
+
+    @property
+    def inventory(self) -> Inventory:
+        """Returns the current resources and cash."""
+        return Inventory(self.water, self.milk, self.beans, self.cups, self.money)
 
     @property
     def is_running(self) -> bool:
@@ -43,46 +108,35 @@ class CoffeeMachine:
     @property
     def prompt(self) -> str:
         """Returns the appropriate user prompt for the current state."""
-        return self._PROMPTS.get(self.state, "")
+        return self._prompts.get(self.state, "")
 
     def process_input(self, user_input: str) -> None:
         """Routes user input to the correct handler based on the current state."""
-        # A mapping of states to the methods that handle them.
-        # This is a clean alternative to a large if/elif/else block.
-        state_handlers = {
-            State.MAIN_MENU: self._handle_main_menu,
-            State.CHOOSING_COFFEE: self._handle_buy,
-            State.FILLING_WATER: self._handle_fill_water,
-            State.FILLING_MILK: self._handle_fill_milk,
-            State.FILLING_BEANS: self._handle_fill_beans,
-            State.FILLING_CUPS: self._handle_fill_cups,
-        }
-        handler = state_handlers.get(self.state)
-        if handler:
-            handler(user_input)
+        action = self._ACTIONS.get((self.state, user_input))
+        if action is not None:
+            action(self)
+            return
+        handler = self._HANDLERS.get(self.state)
+        if handler is not None:
+            handler(self, user_input)
 
     # --- State Handler Methods ---
 
-    def _handle_main_menu(self, action: str) -> None:
-        """Handles user actions from the main menu."""
-        if action == "buy":
-            self.state = State.CHOOSING_COFFEE
-        elif action == "fill":
-            self.state = State.FILLING_WATER
-        elif action == "take":
-            self._take_money()
-        elif action == "remaining":
-            self._print_remaining()
-        elif action == "exit":
-            self.state = State.SHUTDOWN
+    def _choose_coffee(self) -> None:
+        self.state = State.CHOOSING_COFFEE
+
+    def _start_filling(self) -> None:
+        self.state = State.FILLING_WATER
+
+    def _return_to_menu(self) -> None:
+        self.state = State.MAIN_MENU
+
+    def _shut_down(self) -> None:
+        self.state = State.SHUTDOWN
 
     def _handle_buy(self, choice: str) -> None:
         """Handles the user's coffee selection."""
-        if choice == "back":
-            self.state = State.MAIN_MENU
-            return
-
-        recipe = RECIPES.get(choice)
+        recipe = self.recipes.get(choice)
         if recipe:
             self._make_coffee(recipe)
         else:
@@ -92,21 +146,62 @@ class CoffeeMachine:
         self.state = State.MAIN_MENU
 
     def _handle_fill_water(self, amount_str: str) -> None:
-        self.water += int(amount_str)
+        self.fill(water=int(amount_str))
         self.state = State.FILLING_MILK
 
     def _handle_fill_milk(self, amount_str: str) -> None:
-        self.milk += int(amount_str)
+        self.fill(milk=int(amount_str))
         self.state = State.FILLING_BEANS
 
     def _handle_fill_beans(self, amount_str: str) -> None:
-        self.beans += int(amount_str)
+        self.fill(beans=int(amount_str))
         self.state = State.FILLING_CUPS
 
     def _handle_fill_cups(self, amount_str: str) -> None:
-        self.cups += int(amount_str)
+        self.fill(cups=int(amount_str))
         self.state = State.MAIN_MENU  # Return to main menu after the last fill step
 
+    # --- Operations ---
+
+    def buy(self, recipe: CoffeeRecipe) -> str | None:
+        """Makes a coffee if resources are sufficient, without any output.
+
+        Returns:
+            The name of the first missing resource, or `None` if the coffee
+            was made and paid for.
+        """
+        can_make, missing_resource = self._check_resources(recipe)
+        if not can_make:
+            return missing_resource
+
+        self.water -= recipe.water_ml
+        self.milk -= recipe.milk_ml
+        self.beans -= recipe.beans_g
+        self.cups -= recipe.cups
+        self.money += recipe.price_usd
+        if self.ledger is not None:
+            delta = Inventory(
+                -recipe.water_ml, -recipe.milk_ml, -recipe.beans_g, -recipe.cups, recipe.price_usd
+            )
+            self.ledger.record(f"sold:{recipe.name}", delta)
+        return None
+
+    def fill(self, water: int = 0, milk: int = 0, beans: int = 0, cups: int = 0) -> None:
+        """Adds supplies to the machine."""
+        self.water += water
+        self.milk += milk
+        self.beans += beans
+        self.cups += cups
+        if self.ledger is not None:
+            self.ledger.record("fill", Inventory(water, milk, beans, cups))
+
+    def take(self) -> int:
+        """Empties the cash box and returns the amount taken."""
+        amount, self.money = self.money, 0
+        if self.ledger is not None:
+            self.ledger.record("take", Inventory(money=-amount))
+        return amount
+
     # --- Private Action Methods ---
 
     def _print_remaining(self) -> None:
@@ -120,8 +215,7 @@ class CoffeeMachine:
 
     def _take_money(self) -> None:
         """Dispenses all the money from the machine."""
-        print(f"\nI gave you ${self.money}\n")
-        self.money = 0
+        print(f"\nI gave you ${self.take()}\n")
 
     def _check_resources(self, recipe: CoffeeRecipe) -> tuple[bool, str | None]:
         """Checks if there are enough resources to make a coffee."""
@@ -136,15 +230,36 @@ class CoffeeMachine:
         return True, None
 
     def _make_coffee(self, recipe: CoffeeRecipe) -> None:
-        """Makes a coffee if resources are sufficient."""
-        can_make, missing_resource = self._check_resources(recipe)
-
-        if can_make:
+        """Makes a coffee if resources are sufficient, reporting the outcome."""
+        missing_resource = self.buy(recipe)
+        if missing_resource is None:
             print("I have enough resources, making you a coffee!")
-            self.water -= recipe.water_ml
-            self.milk -= recipe.milk_ml
-            self.beans -= recipe.beans_g
-            self.cups -= recipe.cups
-            self.money += recipe.price_usd
         else:
             print(f"Sorry, not enough {missing_resource}!")
+
+    # --- Transition Tables ---
+
+    # Inputs with a fixed meaning in a state; any other input in the main menu is ignored.
+    _ACTIONS: ClassVar[Mapping[tuple[State, str], Callable[[CoffeeMachine], None]]] = (
+        MappingProxyType(
+            {
+                (State.MAIN_MENU, "buy"): _choose_coffee,
+                (State.MAIN_MENU, "fill"): _start_filling,
+                (State.MAIN_MENU, "take"): _take_money,
+                (State.MAIN_MENU, "remaining"): _print_remaining,
+                (State.MAIN_MENU, "exit"): _shut_down,
+                (State.CHOOSING_COFFEE, "back"): _return_to_menu,
+            }
+        )
+    )
+
+    # The handlers of free-form input, such as recipe choices and amounts.
+    _HANDLERS: ClassVar[Mapping[State, Callable[[CoffeeMachine, str], None]]] = MappingProxyType(
+        {
+            State.CHOOSING_COFFEE: _handle_buy,
+            State.FILLING_WATER: _handle_fill_water,
+            State.FILLING_MILK: _handle_fill_milk,
+            State.FILLING_BEANS: _handle_fill_beans,
+            State.FILLING_CUPS: _handle_fill_cups,
+        }
+    )
@@ -5,13 +5,28 @@ It creates a CoffeeMachine instance and runs the user interaction loop.
 
 from __future__ import annotations
 
+import argparse
+from pathlib import Path
+
 from .machine import CoffeeMachine
+from .models import DEFAULT_RECIPES_FILE, load_recipes
 
 
 def main() -> None:
     """Initializes the coffee machine and runs the user interaction loop."""
+    parser = argparse.ArgumentParser(description="An interactive coffee machine simulator.")
+    parser.add_argument(
+        "--recipes",
+        type=Path,
+        default=DEFAULT_RECIPES_FILE,
+        help="A TOML file with the menu of the machine (default: the built-in menu)",
+    )
+    args = parser.parse_args()
+
     # Create an instance with the project's required starting inventory
-    machine = CoffeeMachine(water=400, milk=540, beans=120, cups=9, money=550)
+    machine = CoffeeMachine(
+        water=400, milk=540, beans=120, cups=9, money=550, recipes=load_recipes(args.recipes)
+    )
 
     # The machine's state controls the loop's condition entirely.
     while machine.is_running:
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import tomllib
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
 from enum import Enum, auto
+from pathlib import Path
+from types import MappingProxyType
+
+#: The menu shipped with the package.
+DEFAULT_RECIPES_FILE = Path(__file__).with_name("recipes.toml")
 
 
 class State(Enum):
@@ -30,9 +37,57 @@ class CoffeeRecipe:
     cups: int = 1
 
 
+@dataclass(frozen=True, slots=True)
+class Inventory:
+    """The resources and cash of a coffee machine, or a change to them."""
+
+    water: int = 0
+    milk: int = 0
+    beans: int = 0
+    cups: int = 0
+    money: int = 0
+
+    def __add__(self, other: Inventory) -> Inventory:
+        """Returns the inventory after applying a change."""
+        return Inventory(
+            self.water + other.water,
+            self.milk + other.milk,
+            self.beans + other.beans,
+            self.cups + other.cups,
+            self.money + other.money,
+        )
+
+
+def load_recipes(file_path: Path = DEFAULT_RECIPES_FILE) -> Mapping[str, CoffeeRecipe]:
+    """Loads a menu of recipes from a TOML file.
+
+    Every recipe is a `[recipes."<choice>"]` table with the fields of
+    `CoffeeRecipe`; `cups` may be omitted. The menu keeps the order of the
+    file, which is also the order in which the choices are offered.
+
+    Raises:
+        ValueError: If the file has no recipes or a recipe has missing,
+            unknown or non-integer fields.
+    """
+    with open(file_path, "rb") as file:
+        tables = tomllib.load(file).get("recipes", {})
+    if not tables:
+        raise ValueError(f"No recipes in {file_path}")
+
+    amounts = {field.name for field in fields(CoffeeRecipe)} - {"name"}
+    recipes = {}
+    for choice, table in tables.items():
+        try:
+            recipe = CoffeeRecipe(**table)
+        except TypeError as error:
+            raise ValueError(f"Invalid recipe {choice!r} in {file_path}: {error}") from None
+        if not isinstance(recipe.name, str) or any(
+            type(getattr(recipe, amount)) is not int for amount in amounts
+        ):
+            raise ValueError(f"Invalid recipe {choice!r} in {file_path}: wrong field types")
+        recipes[choice] = recipe
+    return MappingProxyType(recipes)
+
+
 # A single, unified source of truth for all recipes, keyed by user input.
-RECIPES = {
-    "1": CoffeeRecipe(name="espresso", water_ml=250, milk_ml=0, beans_g=16, price_usd=4),
-    "2": CoffeeRecipe(name="latte", water_ml=350, milk_ml=75, beans_g=20, price_usd=7),
-    "3": CoffeeRecipe(name="cappuccino", water_ml=200, milk_ml=100, beans_g=12, price_usd=6),
-}
+RECIPES = load_recipes()
@@ -0,0 +1,178 @@
+"""Batch versions of the loan calculations for pricing whole portfolios.
+
+Each function takes equally sized sequences of loan parameters (one element
+per loan) and computes every loan in a single pass, collecting the results
+into compact `array` columns instead of one `LoanResult` per loan. The
+per-loan arithmetic is shared with the scalar functions in the core module,
+so the batch results are bit-identical to calling them one by one.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Sequence
+from math import nan
+
+from .core import (
+    _annuity_payment,
+    _annuity_periods,
+    _annuity_principal,
+    _diff_overpayment,
+    solve_annuity_interest,
+)
+from .models import LoanBatchResult
+
+#: The `array` typecode used for all integer result columns.
+INT_TYPECODE = "q"
+
+#: The `array` typecode used for all floating-point result columns.
+FLOAT_TYPECODE = "d"
+
+
+def _run_pairs(
+    kernel: Callable[[float, int, int], tuple[int, int]],
+    interests: Sequence[float],
+    first: Sequence[int],
+    second: Sequence[int],
+) -> tuple[array[int], array[int]]:
+    """Applies a two-valued kernel to every loan and splits the results into columns."""
+    values: array[int] = array(INT_TYPECODE)
+    overpayments: array[int] = array(INT_TYPECODE)
+    add_value = values.append
+    add_overpayment = overpayments.append
+    for value, overpayment in map(kernel, interests, first, second):
+        add_value(value)
+        add_overpayment(overpayment)
+    return values, overpayments
+
+
+def _check_lengths(*columns: Sequence[float]) -> None:
+    """Ensures that all input columns describe the same number of loans."""
+    if len({len(column) for column in columns}) > 1:
+        raise ValueError("All input sequences must have the same length.")
+
+
+def batch_annuity_payment(
+    interests: Sequence[float], periods: Sequence[int], principals: Sequence[int]
+) -> LoanBatchResult:
+    """Calculates the annuity payment for every loan in the batch.
+
+    Args:
+        interests: The monthly interest rate of each loan.
+        periods: The number of periods (months) of each loan.
+        principals: The principal of each loan.
+
+    Returns:
+        A batch result with the `payment` and `overpayment` columns set.
+
+    Raises:
+        ValueError: If the input sequences differ in length.
+    """
+    _check_lengths(interests, periods, principals)
+    payment, overpayment = _run_pairs(_annuity_payment, interests, periods, principals)
+    return LoanBatchResult(payment=payment, overpayment=overpayment)
+
+
+def batch_annuity_principal(
+    interests: Sequence[float], periods: Sequence[int], payments: Sequence[int]
+) -> LoanBatchResult:
+    """Calculates the loan principal for every loan in the batch.
+
+    Args:
+        interests: The monthly interest rate of each loan.
+        periods: The number of periods (months) of each loan.
+        payments: The monthly annuity payment of each loan.
+
+    Returns:
+        A batch result with the `principal` and `overpayment` columns set.
+
+    Raises:
+        ValueError: If the input sequences differ in length.
+    """
+    _check_lengths(interests, periods, payments)
+    principal, overpayment = _run_pairs(_annuity_principal, interests, periods, payments)
+    return LoanBatchResult(principal=principal, overpayment=overpayment)
+
+
+def batch_annuity_periods(
+    interests: Sequence[float], principals: Sequence[int], payments: Sequence[int]
+) -> LoanBatchResult:
+    """Calculates the number of periods to repay every loan in the batch.
+
+    Args:
+        interests: The monthly interest rate of each loan.
+        principals: The principal of each loan.
+        payments: The monthly annuity payment of each loan.
+
+    Returns:
+        A batch result with the `periods` and `overpayment` columns set.
+
+    Raises:
+        ValueError: If the input sequences differ in length.
+    """
+    _check_lengths(interests, principals, payments)
+    periods, overpayment = _run_pairs(_annuity_periods, interests, principals, payments)
+    return LoanBatchResult(periods=periods, overpayment=overpayment)
+
+
+def batch_diff(
+    interests: Sequence[float], periods: Sequence[int], principals: Sequence[int]
+) -> LoanBatchResult:
+    """Calculates the overpayment of every differentiated loan in the batch.
+
+    The individual monthly payments are summed on the fly and not kept.
+
+    Args:
+        interests: The monthly interest rate of each loan.
+        periods: The number of periods (months) of each loan.
+        principals: The principal of each loan.
+
+    Returns:
+        A batch result with the `overpayment` column set.
+
+    Raises:
+        ValueError: If the input sequences differ in length.
+    """
+    _check_lengths(interests, periods, principals)
+    overpayment = array(INT_TYPECODE, map(_diff_overpayment, interests, periods, principals))
+    return LoanBatchResult(overpayment=overpayment)
+
+
+def batch_annuity_interest(
+    principals: Sequence[int], periods: Sequence[int], payments: Sequence[int]
+) -> LoanBatchResult:
+    """Calculates the monthly interest rate of every loan in the batch.
+
+    Each rate is found with the bracketed Newton solver of the core module.
+    Loans whose payments cannot repay the principal get a NaN rate and zero
+    iterations, so one bad quote does not abort the batch.
+
+    Args:
+        principals: The principal of each loan.
+        periods: The number of periods (months) of each loan.
+        payments: The monthly annuity payment of each loan.
+
+    Returns:
+        A batch result with the `interest`, `iterations` and `overpayment`
+        columns set.
+
+    Raises:
+        ValueError: If the input sequences differ in length.
+    """
+    _check_lengths(principals, periods, payments)
+    interest: array[float] = array(FLOAT_TYPECODE)
+    iterations: array[int] = array(INT_TYPECODE)
+    overpayment: array[int] = array(INT_TYPECODE)
+
+    for principal, term, payment in zip(principals, periods, payments, strict=True):
+        try:
+            solution = solve_annuity_interest(principal, term, payment)
+        except ValueError:
+            interest.append(nan)
+            iterations.append(0)
+        else:
+            interest.append(solution.rate if solution.converged else nan)
+            iterations.append(solution.iterations)
+        overpayment.append(payment * term - principal)
+
+    return LoanBatchResult(overpayment=overpayment, interest=interest, iterations=iterations)
@@ -0,0 +1,122 @@
+"""Memoizes loan calculations for portfolios with many identical loans.
+
+Real portfolios are dominated by a few standard products, so the same
+(interest, periods, principal) combinations come up again and again. A
+`LoanCache` keeps bounded, least-recently-used caches of the per-loan results
+and of the compound factors they are built from, so that repeated loans are
+looked up instead of recalculated.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache, partial
+from typing import NamedTuple, Protocol
+
+from .core import (
+    LoanKernels,
+    _annuity_payment,
+    _annuity_periods,
+    _annuity_principal,
+    _diff_overpayment,
+    compound_factor,
+    describe_periods,
+    solve_annuity_interest,
+)
+from .models import LoanResult
+
+#: The default maximum number of entries kept by each cache.
+DEFAULT_CACHE_SIZE = 4096
+
+
+class CacheStats(NamedTuple):
+    """Represents the hit and miss counters of a single cache."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int | None
+
+
+class _Cache(Protocol):
+    """The introspection interface of a function wrapped by `lru_cache`."""
+
+    def cache_info(self) -> tuple[int, int, int | None, int]: ...
+
+    def cache_clear(self) -> None: ...
+
+
+class LoanCache:
+    """Bounded LRU caches around the loan calculations.
+
+    The cached functions return exactly the same values as the functions in
+    the core module. Use `kernels` to price loans in bulk, e.g., with the
+    portfolio module, or the `calculate_*` methods as drop-in replacements
+    for the core functions.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE) -> None:
+        """Creates empty caches, each holding at most `maxsize` entries."""
+        lru = lru_cache(maxsize=maxsize)
+        self.compound_factor = lru(compound_factor)
+        annuity_payment = lru(partial(_annuity_payment, compound_of=self.compound_factor))
+        annuity_principal = lru(partial(_annuity_principal, compound_of=self.compound_factor))
+        annuity_periods = lru(_annuity_periods)
+        diff_overpayment = lru(_diff_overpayment)
+        annuity_interest = lru(solve_annuity_interest)
+
+        self.kernels = LoanKernels(
+            annuity_payment,
+            annuity_principal,
+            annuity_periods,
+            diff_overpayment,
+            annuity_interest,
+        )
+        self._caches: dict[str, _Cache] = {
+            "compound_factor": self.compound_factor,
+            "annuity_payment": annuity_payment,
+            "annuity_principal": annuity_principal,
+            "annuity_periods": annuity_periods,
+            "diff_overpayment": diff_overpayment,
+            "annuity_interest": annuity_interest,
+        }
+
+    def calculate_annuity_payment(
+        self, interest: float, periods: int, principal: int
+    ) -> LoanResult:
+        """Calculates the fixed monthly annuity payment, using the cache."""
+        payment, overpayment = self.kernels.annuity_payment(interest, periods, principal)
+        return LoanResult(payment=payment, overpayment=overpayment)
+
+    def calculate_annuity_principal(
+        self, interest: float, periods: int, payment: int
+    ) -> LoanResult:
+        """Calculates the loan principal based on an annuity payment, using the cache."""
+        principal, overpayment = self.kernels.annuity_principal(interest, periods, payment)
+        return LoanResult(principal=principal, overpayment=overpayment)
+
+    def calculate_annuity_periods(
+        self, interest: float, principal: int, payment: int
+    ) -> LoanResult:
+        """Calculates the number of periods to repay an annuity loan, using the cache."""
+        periods, overpayment = self.kernels.annuity_periods(interest, principal, payment)
+        return LoanResult(
+            periods=periods, overpayment=overpayment, description=describe_periods(periods)
+        )
+
+    def calculate_annuity_interest(self, principal: int, periods: int, payment: int) -> LoanResult:
+        """Calculates the monthly interest rate of an annuity loan, using the cache."""
+        solution = self.kernels.annuity_interest(principal, periods, payment)
+        return LoanResult(interest=solution.rate, overpayment=payment * periods - principal)
+
+    def stats(self) -> dict[str, CacheStats]:
+        """Returns the hit and miss counters of every cache by name."""
+        stats = {}
+        for name, cache in self._caches.items():
+            hits, misses, maxsize, size = cache.cache_info()
+            stats[name] = CacheStats(hits, misses, size, maxsize)
+        return stats
+
+    def clear(self) -> None:
+        """Empties every cache and resets the counters."""
+        for cache in self._caches.values():
+            cache.cache_clear()
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import argparse
 
-from .handlers import handle_annuity, handle_diff
+from .handlers import handle_annuity, handle_batch, handle_diff
+from .portfolio import DEFAULT_CHUNK_SIZE, FORMATS
 
 
 def non_negative_int(value: str) -> int:
@@ -20,6 +21,17 @@ def non_negative_int(value: str) -> int:
         ) from None
 
 
+def positive_int(value: str) -> int:
+    """Custom argparse type for a positive integer."""
+    try:
+        ivalue = int(value)
+        if ivalue < 1:
+            raise ValueError
+        return ivalue
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Value must be a positive integer: '{value}'") from None
+
+
 def non_negative_float(value: str) -> float:
     """Custom argparse type for a non-negative float."""
     try:
@@ -67,12 +79,17 @@ def build_parser() -> argparse.ArgumentParser:
         required=True,
         help="Annual interest rate (%%)",
     )
+    parser_diff.add_argument(
+        "--summary-only",
+        action="store_true",
+        help="Print only the overpayment, calculated without the monthly schedule",
+    )
     parser_diff.set_defaults(func=handle_diff)
 
     # --- 'annuity' command parser ---
     parser_annuity = subparsers.add_parser(
         "annuity",
-        help="Calculate annuity payment, principal, or periods",
+        help="Calculate annuity payment, principal, periods, or interest rate",
     )
     parser_annuity.add_argument(
         "--principal",
@@ -92,9 +109,44 @@ def build_parser() -> argparse.ArgumentParser:
     parser_annuity.add_argument(
         "--interest",
         type=non_negative_float,
-        required=True,
         help="Annual interest rate (%%)",
     )
     parser_annuity.set_defaults(func=handle_annuity)
 
+    # --- 'batch' command parser ---
+    parser_batch = subparsers.add_parser(
+        "batch",
+        help="Calculate every loan of a CSV or JSONL portfolio",
+    )
+    parser_batch.add_argument(
+        "path",
+        nargs="?",
+        default="-",
+        help="Portfolio file to read, or '-' for standard input (default)",
+    )
+    parser_batch.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="Portfolio format (default: guessed from the file name, else csv)",
+    )
+    parser_batch.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="Number of worker processes (default: 1, no pool)",
+    )
+    parser_batch.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f"Loans sent to a worker at a time (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser_batch.add_argument(
+        "--cache-size",
+        type=non_negative_int,
+        default=0,
+        help="Cache up to this many distinct loans per process (default: 0, no cache)",
+    )
+    parser_batch.set_defaults(func=handle_batch)
+
     return parser
@@ -2,32 +2,175 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
 from math import ceil, log, pow
+from typing import NamedTuple
 
-from .models import LoanResult
+from .models import LoanResult, RateSolution
 
 MONTHS_IN_YEAR = 12
 
+#: The relative change of the rate below which the rate solver stops.
+RATE_TOLERANCE = 1e-12
 
-def calculate_annuity_payment(interest: float, periods: int, principal: int) -> LoanResult:
-    """Calculates the fixed monthly annuity payment."""
-    compound = pow(1 + interest, periods)
+#: The maximum number of iterations of the rate solver per loan.
+MAX_RATE_ITERATIONS = 100
+
+
+def monthly_interest(annual_interest: float) -> float:
+    """Calculates the monthly interest rate from the annual interest rate."""
+    return annual_interest / (MONTHS_IN_YEAR * 100)
+
+
+def annual_interest(monthly_interest: float) -> float:
+    """Calculates the annual interest rate in percent from the monthly interest rate."""
+    return monthly_interest * MONTHS_IN_YEAR * 100
+
+
+def compound_factor(interest: float, periods: int) -> float:
+    """Calculates the compound growth factor `(1 + interest) ** periods`."""
+    return pow(1 + interest, periods)
+
+
+#: A function that calculates the compound factor for a rate and number of periods.
+CompoundFactor = Callable[[float, int], float]
+
+
+def _annuity_payment(
+    interest: float, periods: int, principal: int, compound_of: CompoundFactor = compound_factor
+) -> tuple[int, int]:
+    """Returns the annuity payment and overpayment for a single loan."""
+    compound = compound_of(interest, periods)
     payment = ceil(principal * (interest * compound) / (compound - 1))
-    overpayment = payment * periods - principal
-    return LoanResult(payment=payment, overpayment=overpayment)
+    return payment, payment * periods - principal
 
 
-def calculate_annuity_principal(interest: float, periods: int, payment: int) -> LoanResult:
-    """Calculates the loan principal based on an annuity payment."""
-    compound = pow(1 + interest, periods)
+def _annuity_principal(
+    interest: float, periods: int, payment: int, compound_of: CompoundFactor = compound_factor
+) -> tuple[int, int]:
+    """Returns the annuity principal and overpayment for a single loan."""
+    compound = compound_of(interest, periods)
     principal = payment / ((interest * compound) / (compound - 1))
-    overpayment = payment * periods - principal
-    return LoanResult(principal=int(principal), overpayment=ceil(overpayment))
+    return int(principal), ceil(payment * periods - principal)
 
 
-def calculate_annuity_periods(interest: float, principal: int, payment: int) -> LoanResult:
-    """Calculates the number of periods to repay an annuity loan."""
+def _annuity_periods(interest: float, principal: int, payment: int) -> tuple[int, int]:
+    """Returns the number of periods and overpayment for a single loan."""
     periods = ceil(log(payment / (payment - interest * principal), 1 + interest))
+    return periods, payment * periods - principal
+
+
+def iter_diff_payments(interest: float, periods: int, principal: int) -> Iterator[int]:
+    """Lazily yields the monthly payments of a differentiated loan.
+
+    Unlike `calculate_diff`, the schedule is never materialized, so long
+    loans can be streamed in constant memory.
+    """
+    return (
+        ceil((principal / periods) + (interest * (principal - (principal * (m - 1) / periods))))
+        for m in range(1, periods + 1)
+    )
+
+
+def _diff_overpayment(interest: float, periods: int, principal: int) -> int:
+    """Returns the overpayment of a differentiated loan."""
+    return sum(iter_diff_payments(interest, periods, principal)) - principal
+
+
+def _present_value(rate: float, periods: int, payment: int) -> tuple[float, float]:
+    """Returns the present value of an annuity and its derivative by the rate."""
+    discount = pow(1 + rate, -periods)
+    value = payment * (1 - discount) / rate
+    derivative = payment * (periods * discount / (1 + rate) - (1 - discount) / rate) / rate
+    return value, derivative
+
+
+def solve_annuity_interest(
+    principal: int,
+    periods: int,
+    payment: int,
+    tolerance: float = RATE_TOLERANCE,
+    max_iterations: int = MAX_RATE_ITERATIONS,
+) -> RateSolution:
+    """Finds the monthly interest rate of an annuity loan.
+
+    Solves `present_value(rate) == principal` with Newton's method. The root
+    is kept bracketed between a rate that is too low and one that is too
+    high, and a step that would leave the bracket is replaced by bisection,
+    so the solver always converges and usually needs only a few iterations.
+
+    Args:
+        principal: The loan principal.
+        periods: The number of periods (months) of the loan.
+        payment: The monthly annuity payment.
+        tolerance: The relative change of the rate at which to stop.
+        max_iterations: The maximum number of iterations.
+
+    Returns:
+        The rate found, with the iteration count and convergence flag.
+
+    Raises:
+        ValueError: If the payments cannot repay the principal at a
+            non-negative interest rate.
+    """
+    if principal <= 0 or periods <= 0 or payment * periods < principal:
+        raise ValueError("The payments do not repay the principal at a non-negative rate.")
+    if payment * periods == principal:
+        return RateSolution(rate=0.0, iterations=0, converged=True)
+
+    # The present value decreases with the rate: it is `payment * periods` at
+    # zero and below the principal at `payment / principal`.
+    low, high = 0.0, payment / principal
+    # Start from the first-order expansion of the present value around zero.
+    total = payment * periods
+    rate = min(2 * (total - principal) / (total * (periods + 1)), high / 2)
+
+    for iteration in range(1, max_iterations + 1):
+        value, derivative = _present_value(rate, periods, payment)
+        excess = value - principal
+        if excess == 0:
+            return RateSolution(rate=rate, iterations=iteration, converged=True)
+        if excess > 0:
+            low = rate
+        else:
+            high = rate
+
+        candidate = rate - excess / derivative
+        if not low < candidate < high:
+            candidate = (low + high) / 2
+        if abs(candidate - rate) <= tolerance * candidate:
+            return RateSolution(rate=candidate, iterations=iteration, converged=True)
+        rate = candidate
+
+    return RateSolution(rate=rate, iterations=max_iterations, converged=False)
+
+
+class LoanKernels(NamedTuple):
+    """Bundles the per-loan calculations used to price loans in bulk.
+
+    The default `KERNELS` compute every loan from scratch; a `LoanCache`
+    provides a memoized set with the same signatures.
+    """
+
+    annuity_payment: Callable[[float, int, int], tuple[int, int]]
+    annuity_principal: Callable[[float, int, int], tuple[int, int]]
+    annuity_periods: Callable[[float, int, int], tuple[int, int]]
+    diff_overpayment: Callable[[float, int, int], int]
+    annuity_interest: Callable[[int, int, int], RateSolution]
+
+
+#: The uncached per-loan calculations.
+KERNELS = LoanKernels(
+    _annuity_payment,
+    _annuity_principal,
+    _annuity_periods,
+    _diff_overpayment,
+    solve_annuity_interest,
+)
+
+
+def describe_periods(periods: int) -> str:
+    """Describes a number of months in years and months, e.g., "2 years and 1 month"."""
     years, months = divmod(periods, MONTHS_IN_YEAR)
 
     parts = []
@@ -36,19 +179,61 @@ def calculate_annuity_periods(interest: float, principal: int, payment: int) ->
     if months:
         parts.append(f"{months} month{'s' if months != 1 else ''}")
 
-    description = " and ".join(parts)
-    overpayment = payment * periods - principal
-    return LoanResult(periods=periods, overpayment=overpayment, description=description)
+    return " and ".join(parts)
 
 
-def calculate_diff(interest: float, periods: int, principal: int) -> LoanResult:
-    """Calculates all monthly payments for a differentiated loan."""
-    payments_generator = (
-        ceil((principal / periods) + (interest * (principal - (principal * (m - 1) / periods))))
-        for m in range(1, periods + 1)
+def calculate_annuity_payment(interest: float, periods: int, principal: int) -> LoanResult:
+    """Calculates the fixed monthly annuity payment."""
+    payment, overpayment = _annuity_payment(interest, periods, principal)
+    return LoanResult(payment=payment, overpayment=overpayment)
+
+
+def calculate_annuity_principal(interest: float, periods: int, payment: int) -> LoanResult:
+    """Calculates the loan principal based on an annuity payment."""
+    principal, overpayment = _annuity_principal(interest, periods, payment)
+    return LoanResult(principal=principal, overpayment=overpayment)
+
+
+def calculate_annuity_periods(interest: float, principal: int, payment: int) -> LoanResult:
+    """Calculates the number of periods to repay an annuity loan."""
+    periods, overpayment = _annuity_periods(interest, principal, payment)
+    return LoanResult(
+        periods=periods, overpayment=overpayment, description=describe_periods(periods)
     )
 
-    payments = list(payments_generator)
+
+def calculate_annuity_interest(principal: int, periods: int, payment: int) -> LoanResult:
+    """Calculates the monthly interest rate of an annuity loan.
+
+    Raises:
+        ValueError: If the payments cannot repay the principal at a
+            non-negative interest rate, or the rate did not converge.
+    """
+    solution = solve_annuity_interest(principal, periods, payment)
+    if not solution.converged:
+        raise ValueError("The interest rate did not converge.")
+    return LoanResult(interest=solution.rate, overpayment=payment * periods - principal)
+
+
+def calculate_diff(interest: float, periods: int, principal: int) -> LoanResult:
+    """Calculates all monthly payments for a differentiated loan."""
+    payments = list(iter_diff_payments(interest, periods, principal))
     overpayment = sum(payments) - principal
 
     return LoanResult(payments=payments, overpayment=overpayment)
+
+
+def calculate_diff_summary(interest: float, periods: int, principal: int) -> LoanResult:
+    """Calculates the overpayment of a differentiated loan in constant time.
+
+    The principal is repaid in equal parts, so the interest charged shrinks
+    linearly and sums up to `interest * principal * (periods + 1) / 2`. This
+    closed form is the exact total interest, rounded up once.
+
+    Note:
+        The schedule from `calculate_diff` rounds up every monthly payment,
+        so its overpayment can exceed this exact value by at most
+        `periods - 1`.
+    """
+    overpayment = ceil(interest * principal * (periods + 1) / 2)
+    return LoanResult(periods=periods, principal=principal, overpayment=overpayment)
@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
 import sys
 from argparse import Namespace
+from functools import partial
 
+from hyperskill_python_portfolio.loancalc.cache import LoanCache
 from hyperskill_python_portfolio.loancalc.core import (
-    MONTHS_IN_YEAR,
+    annual_interest,
+    calculate_annuity_interest,
     calculate_annuity_payment,
     calculate_annuity_periods,
     calculate_annuity_principal,
-    calculate_diff,
+    calculate_diff_summary,
+    iter_diff_payments,
+    monthly_interest,
 )
+from hyperskill_python_portfolio.loancalc.portfolio import (
+    Pricer,
+    detect_format,
+    price_loans,
+    price_loans_parallel,
+    run_portfolio,
+)
+
 
+def _handle_annuity_interest(args: Namespace) -> str:
+    """Solves an annuity loan for its interest rate and formats the result."""
+    try:
+        result = calculate_annuity_interest(args.principal, args.periods, args.payment)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
-def monthly_interest(annual_interest: float) -> float:
-    """Calculates the monthly interest rate from the annual interest rate."""
-    return annual_interest / (MONTHS_IN_YEAR * 100)
+    rate = annual_interest(result.interest or 0.0)
+    return f"Your annual interest rate = {rate:.2f}%!\nOverpayment = {result.overpayment}"
 
 
 def handle_annuity(args: Namespace) -> str:
@@ -25,14 +46,18 @@ def handle_annuity(args: Namespace) -> str:
     Validates arguments, dispatches to the correct annuity calculation function,
     and formats the result for printing.
     """
-    known = [args.principal, args.payment, args.periods]
+    known = [args.principal, args.payment, args.periods, args.interest]
     if known.count(None) != 1:
         print(
-            "Error: Exactly one of --principal, --payment, or --periods must be omitted.",
+            "Error: Exactly one of --principal, --payment, --periods, or --interest "
+            "must be omitted.",
             file=sys.stderr,
         )
         sys.exit(1)
 
+    if args.interest is None:
+        return _handle_annuity_interest(args)
+
     interest = monthly_interest(args.interest)
     if args.payment is None:
         result = calculate_annuity_payment(interest, args.periods, args.principal)
@@ -50,8 +75,11 @@ def handle_annuity(args: Namespace) -> str:
 def handle_diff(args: Namespace) -> str:
     """Handles the 'diff' (differentiated) command.
 
-    Validates arguments, calls the differentiated calculation function,
-    and formats the result for printing.
+    Validates arguments and streams the monthly payments to standard output
+    as they are calculated, accumulating the overpayment along the way. The
+    returned overpayment summary is printed after the schedule. With
+    `--summary-only`, the schedule is skipped and the overpayment is
+    calculated in closed form.
     """
     if hasattr(args, "payment") and args.payment is not None:
         print(
@@ -61,12 +89,68 @@ def handle_diff(args: Namespace) -> str:
         sys.exit(1)
 
     interest = monthly_interest(args.interest)
-    result = calculate_diff(interest, args.periods, args.principal)
+    if getattr(args, "summary_only", False):
+        result = calculate_diff_summary(interest, args.periods, args.principal)
+        return f"Overpayment = {result.overpayment}"
+
+    write = sys.stdout.write
+    total = 0
+    payments = iter_diff_payments(interest, args.periods, args.principal)
+    for month, payment in enumerate(payments, start=1):
+        write(f"Month {month}: payment is {payment}\n")
+        total += payment
+
+    return f"\nOverpayment = {total - args.principal}"
+
+
+def _batch_pricer(args: Namespace) -> tuple[Pricer, LoanCache | None]:
+    """Selects the pricing strategy for the 'batch' command."""
+    if args.workers > 1:
+        pricer = partial(
+            price_loans_parallel,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            cache_size=args.cache_size,
+        )
+        return pricer, None
+    if args.cache_size:
+        cache = LoanCache(args.cache_size)
+        return partial(price_loans, kernels=cache.kernels), cache
+    return price_loans, None
+
+
+def handle_batch(args: Namespace) -> str:
+    """Handles the 'batch' command.
+
+    Streams a portfolio of loans from a file or standard input, prices every
+    loan, and writes the results to standard output as they are produced.
+    With more than one worker, the loans are priced in a process pool. With
+    a cache in a single process, its counters are reported on standard error.
+    """
+    file_format = args.format or detect_format(args.path)
+    pricer, cache = _batch_pricer(args)
 
-    return (
-        "\n".join(
-            f"Month {month}: payment is {payment}"
-            for month, payment in enumerate(result.payments, start=1)
+    try:
+        source = (
+            contextlib.nullcontext(sys.stdin)
+            if args.path == "-"
+            else open(args.path, encoding="utf-8", newline="")
         )
-        + f"\n\nOverpayment = {result.overpayment}"
-    )
+    except OSError as e:
+        print(f"Error: Cannot read portfolio '{args.path}': {e.strerror}", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        with source as stream:
+            run_portfolio(stream, sys.stdout, file_format, pricer)
+            sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader of the output has gone, e.g., `loancalc batch big.csv | head`.
+        # Point stdout at devnull so that the flush at exit does not fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+    if cache is not None:
+        for name, stats in cache.stats().items():
+            print(f"Cache {name}: {stats.hits} hits, {stats.misses} misses", file=sys.stderr)
+    return ""
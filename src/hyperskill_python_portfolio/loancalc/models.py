@@ -2,28 +2,75 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoanResult:
     """Represents the results of a loan calculation.
 
     This is an immutable data container. Each calculation function in the
-    core module will return an instance of this class.
+    core module will return an instance of this class. It uses `__slots__`
+    and shares a single empty tuple as the default `payments`, so results
+    without a payment schedule stay small when produced in bulk.
 
     Attributes:
-        payments: A list of monthly payments for differentiated loans.
+        payments: The monthly payments for differentiated loans.
         payment: The single monthly payment for an annuity loan.
         periods: The total number of periods (months) for the loan.
         principal: The calculated loan principal.
+        interest: The calculated monthly interest rate.
         overpayment: The total amount paid over the loan principal.
         description: A human-readable description, e.g., for loan duration.
     """
 
-    payments: list[int] = field(default_factory=list)
+    payments: Sequence[int] = ()
     payment: int | None = None
     periods: int | None = None
     principal: int | None = None
+    interest: float | None = None
     overpayment: int = 0
     description: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RateSolution:
+    """Represents the outcome of solving an annuity loan for its interest rate.
+
+    Attributes:
+        rate: The monthly interest rate found, or the last estimate if the
+            solver did not converge.
+        iterations: The number of root-finding iterations performed.
+        converged: Whether the rate met the tolerance within the iteration limit.
+    """
+
+    rate: float
+    iterations: int
+    converged: bool
+
+
+@dataclass(frozen=True)
+class LoanBatchResult:
+    """Represents the column-oriented results of a batch loan calculation.
+
+    Each attribute is a compact integer array where position `i` holds the
+    value for the `i`-th loan of the batch. Only the columns produced by the
+    batch function are set; the others remain `None`.
+
+    Attributes:
+        overpayment: The total amount paid over the principal, per loan.
+        payment: The monthly annuity payment, per loan.
+        periods: The number of periods (months) to repay, per loan.
+        principal: The loan principal, per loan.
+        interest: The monthly interest rate, per loan; NaN where it has no solution.
+        iterations: The root-finding iterations used to find `interest`, per loan.
+    """
+
+    overpayment: array[int]
+    payment: array[int] | None = None
+    periods: array[int] | None = None
+    principal: array[int] | None = None
+    interest: array[float] | None = None
+    iterations: array[int] | None = None
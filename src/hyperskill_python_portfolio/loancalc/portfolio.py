@@ -0,0 +1,274 @@
+"""Streams loan portfolios from CSV or JSONL files through the loan calculator.
+
+A portfolio is a sequence of loan records, one per CSV row or JSONL line.
+Every record has a `type` (`annuity` or `diff`) and the same `principal`,
+`payment`, `periods` and annual `interest` (in percent) fields as the
+command-line flags; the field left empty is the one to calculate.
+
+Records are read, priced and written one at a time, so memory use does not
+depend on the size of the portfolio. A record that cannot be priced does not
+stop the run: its output record carries an `error` field instead.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import batched
+from pathlib import Path
+from typing import Any, TextIO
+
+from .cache import LoanCache
+from .core import KERNELS, LoanKernels, annual_interest, monthly_interest
+
+#: A single loan record, as read from or written to a portfolio file.
+Loan = dict[str, Any]
+
+#: A function that prices a stream of loan records, preserving their order.
+Pricer = Callable[[Iterable[Loan]], Iterator[Loan]]
+
+#: The supported portfolio file formats.
+FORMATS = ("csv", "jsonl")
+
+#: The fields added to every output record.
+RESULT_FIELDS = ("payment", "principal", "periods", "interest", "overpayment", "error")
+
+#: The default number of records sent to a worker process at a time.
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def detect_format(path: str) -> str:
+    """Guesses the portfolio format from a file name, defaulting to CSV."""
+    suffix = Path(path).suffix.lower()
+    return "jsonl" if suffix in {".jsonl", ".ndjson"} else "csv"
+
+
+def _parse_number[T: (int, float)](loan: Mapping[str, Any], name: str, kind: type[T]) -> T | None:
+    """Reads an optional non-negative number from a loan record."""
+    value = loan.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        number = kind(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Value of '{name}' must be a number: {value!r}") from None
+    if number < 0:
+        raise ValueError(f"Value of '{name}' must be non-negative: {value!r}")
+    return number
+
+
+_ANNUITY_FIELDS_ERROR = "Exactly one of principal, payment, periods, or interest must be omitted."
+
+
+def _price_annuity_interest(
+    kernels: LoanKernels, principal: int | None, payment: int | None, periods: int | None
+) -> Loan:
+    """Calculates the annual interest rate of an annuity loan."""
+    if principal is None or payment is None or periods is None:
+        raise ValueError(_ANNUITY_FIELDS_ERROR)
+    solution = kernels.annuity_interest(principal, periods, payment)
+    if not solution.converged:
+        raise ValueError("The interest rate did not converge.")
+    return {
+        "interest": annual_interest(solution.rate),
+        "overpayment": payment * periods - principal,
+    }
+
+
+def _price_annuity(
+    kernels: LoanKernels,
+    interest: float | None,
+    principal: int | None,
+    payment: int | None,
+    periods: int | None,
+) -> Loan:
+    """Calculates the missing parameter of an annuity loan."""
+    if interest is None:
+        return _price_annuity_interest(kernels, principal, payment, periods)
+
+    rate = monthly_interest(interest)
+    if payment is None and principal is not None and periods is not None:
+        payment, overpayment = kernels.annuity_payment(rate, periods, principal)
+    elif principal is None and payment is not None and periods is not None:
+        principal, overpayment = kernels.annuity_principal(rate, periods, payment)
+    elif periods is None and principal is not None and payment is not None:
+        periods, overpayment = kernels.annuity_periods(rate, principal, payment)
+    else:
+        raise ValueError(_ANNUITY_FIELDS_ERROR)
+    return {
+        "payment": payment,
+        "principal": principal,
+        "periods": periods,
+        "overpayment": overpayment,
+    }
+
+
+def _price_diff(
+    kernels: LoanKernels,
+    interest: float | None,
+    principal: int | None,
+    payment: int | None,
+    periods: int | None,
+) -> Loan:
+    """Calculates the overpayment of a differentiated loan."""
+    if payment is not None:
+        raise ValueError("Payment is not allowed for a differentiated loan.")
+    if principal is None or periods is None or interest is None:
+        raise ValueError(
+            "Principal, periods, and interest are required for a differentiated loan."
+        )
+    return {
+        "overpayment": kernels.diff_overpayment(monthly_interest(interest), periods, principal)
+    }
+
+
+_PRICERS = {"annuity": _price_annuity, "diff": _price_diff}
+
+
+def price_loan(loan: Mapping[str, Any], kernels: LoanKernels = KERNELS) -> Loan:
+    """Prices a single loan record.
+
+    Args:
+        loan: The loan record to price.
+        kernels: The per-loan calculations to use, e.g., from a `LoanCache`.
+
+    Returns:
+        A copy of the record extended with the calculated fields, or with an
+        `error` field if the record is invalid or cannot be priced.
+    """
+    result = dict(loan)
+    if loan.get("error"):
+        return result  # The record could not even be read.
+    try:
+        pricer = _PRICERS.get(loan.get("type", ""))
+        if pricer is None:
+            raise ValueError(f"Unknown loan type: {loan.get('type')!r}")
+        result.update(
+            pricer(
+                kernels,
+                _parse_number(loan, "interest", float),
+                _parse_number(loan, "principal", int),
+                _parse_number(loan, "payment", int),
+                _parse_number(loan, "periods", int),
+            )
+        )
+    except (ArithmeticError, ValueError) as e:
+        result["error"] = str(e) or type(e).__name__
+    return result
+
+
+def price_loans(loans: Iterable[Loan], kernels: LoanKernels = KERNELS) -> Iterator[Loan]:
+    """Lazily prices a stream of loan records in order."""
+    return (price_loan(loan, kernels) for loan in loans)
+
+
+#: The per-loan calculations of the current worker process.
+_worker_kernels = KERNELS
+
+
+def _init_worker(cache_size: int) -> None:
+    """Sets up the per-process cache of a worker, if caching is enabled."""
+    global _worker_kernels
+    if cache_size:
+        _worker_kernels = LoanCache(cache_size).kernels
+
+
+def _price_chunk(chunk: tuple[Loan, ...]) -> list[Loan]:
+    """Prices a chunk of loan records inside a worker process."""
+    return [price_loan(loan, _worker_kernels) for loan in chunk]
+
+
+def price_loans_parallel(
+    loans: Iterable[Loan],
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache_size: int = 0,
+) -> Iterator[Loan]:
+    """Lazily prices a stream of loan records in a pool of worker processes.
+
+    The stream is split into chunks that are priced concurrently. Results are
+    yielded in input order, and only a bounded number of chunks is in flight
+    at any time, so memory use stays independent of the portfolio size.
+
+    Args:
+        loans: The loan records to price.
+        workers: The number of worker processes.
+        chunk_size: The number of records per chunk.
+        cache_size: The size of the `LoanCache` of each worker, or 0 for none.
+
+    Yields:
+        The priced loan records, in the same order as the input.
+    """
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(cache_size,)) as pool:
+        pending: deque[Future[list[Loan]]] = deque()
+        for chunk in batched(loans, chunk_size):
+            pending.append(pool.submit(_price_chunk, chunk))
+            if len(pending) > 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _run_csv(source: TextIO, target: TextIO, pricer: Pricer) -> int:
+    """Prices a CSV portfolio, writing one output row per input row."""
+    reader = csv.DictReader(source)
+    fieldnames = list(reader.fieldnames or [])
+    fieldnames += [field for field in RESULT_FIELDS if field not in fieldnames]
+    writer = csv.DictWriter(
+        target, fieldnames=fieldnames, restval="", extrasaction="ignore", lineterminator="\n"
+    )
+    writer.writeheader()
+
+    count = 0
+    for result in pricer(reader):
+        writer.writerow(result)
+        count += 1
+    return count
+
+
+def _read_jsonl(source: TextIO) -> Iterator[Loan]:
+    """Yields the loan records of a JSONL stream, skipping blank lines."""
+    for line_number, line in enumerate(source, start=1):
+        if not line.strip():
+            continue
+        try:
+            loan = json.loads(line)
+        except json.JSONDecodeError as e:
+            loan = {"error": f"Line {line_number}: {e.msg}"}
+        yield loan if isinstance(loan, dict) else {"error": f"Line {line_number}: not an object"}
+
+
+def _run_jsonl(source: TextIO, target: TextIO, pricer: Pricer) -> int:
+    """Prices a JSONL portfolio, writing one output line per input line."""
+    count = 0
+    for result in pricer(_read_jsonl(source)):
+        target.write(json.dumps(result) + "\n")
+        count += 1
+    return count
+
+
+def run_portfolio(
+    source: TextIO, target: TextIO, file_format: str, pricer: Pricer = price_loans
+) -> int:
+    """Prices every loan of a portfolio, streaming the results to the target.
+
+    Args:
+        source: The stream to read loan records from.
+        target: The stream to write the priced records to.
+        file_format: The portfolio format, one of `FORMATS`.
+        pricer: The function that prices the stream of records.
+
+    Returns:
+        The number of records processed.
+
+    Raises:
+        ValueError: If the file format is not supported.
+    """
+    if file_format == "csv":
+        return _run_csv(source, target, pricer)
+    if file_format == "jsonl":
+        return _run_jsonl(source, target, pricer)
+    raise ValueError(f"Unsupported portfolio format: '{file_format}'")
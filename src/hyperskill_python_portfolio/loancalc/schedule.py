@@ -0,0 +1,145 @@
+"""Builds and exports amortization schedules for annuity loans.
+
+An amortization schedule breaks every period of an annuity loan down into the
+payment, the interest and principal parts of that payment, and the balance
+left afterwards. The schedule is stored column by column in compact `array`
+buffers rather than as a list of row objects, and can be exported to CSV or
+to a simple binary columnar file.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from array import array
+from dataclasses import dataclass, fields
+from typing import BinaryIO, TextIO
+
+from .core import _annuity_payment
+
+#: The magic bytes at the start of a columnar schedule file.
+COLUMNAR_MAGIC = b"LOANCOLS1\n"
+
+
+@dataclass(frozen=True)
+class AmortizationSchedule:
+    """Represents the per-period breakdown of an annuity loan.
+
+    All columns have the same length: one element per period.
+
+    Attributes:
+        period: The period number, starting from 1.
+        payment: The amount paid in the period.
+        interest: The interest part of the payment.
+        principal: The principal part of the payment.
+        balance: The principal left to repay after the payment.
+    """
+
+    period: array[int]
+    payment: array[float]
+    interest: array[float]
+    principal: array[float]
+    balance: array[float]
+
+    def __len__(self) -> int:
+        """Returns the number of periods in the schedule."""
+        return len(self.period)
+
+    def columns(self) -> dict[str, array[int] | array[float]]:
+        """Returns the schedule columns by name, in display order."""
+        return {column.name: getattr(self, column.name) for column in fields(self)}
+
+    def to_csv(self, target: TextIO) -> None:
+        """Writes the schedule as CSV with a header row, rounding amounts to cents."""
+        writer = csv.writer(target, lineterminator="\n")
+        writer.writerow(self.columns())
+        for period, *amounts in zip(*self.columns().values(), strict=True):
+            writer.writerow([period, *(f"{amount:.2f}" for amount in amounts)])
+
+    def to_columnar(self, target: BinaryIO) -> None:
+        """Writes the schedule to a binary columnar file.
+
+        The file starts with `COLUMNAR_MAGIC` and a one-line JSON header that
+        describes the columns, followed by the raw bytes of every column in
+        turn. This keeps the columns contiguous and lets readers load a single
+        column without parsing the others.
+        """
+        columns = self.columns()
+        header = {
+            "rows": len(self),
+            "byteorder": sys.byteorder,
+            "columns": [{"name": name, "typecode": col.typecode} for name, col in columns.items()],
+        }
+        target.write(COLUMNAR_MAGIC)
+        target.write(json.dumps(header).encode() + b"\n")
+        for column in columns.values():
+            target.write(column.tobytes())
+
+    @classmethod
+    def from_columnar(cls, source: BinaryIO) -> AmortizationSchedule:
+        """Reads a schedule written by `to_columnar`.
+
+        Raises:
+            ValueError: If the data is not a columnar schedule file.
+        """
+        if source.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+            raise ValueError("Not a columnar schedule file.")
+        header = json.loads(source.readline())
+
+        columns: dict[str, array[int] | array[float]] = {}
+        for spec in header["columns"]:
+            column = array(spec["typecode"])
+            column.frombytes(source.read(header["rows"] * column.itemsize))
+            if header["byteorder"] != sys.byteorder:
+                column.byteswap()
+            columns[spec["name"]] = column
+        return cls(**columns)  # type: ignore[arg-type]
+
+
+def build_amortization_schedule(
+    interest: float, periods: int, principal: int
+) -> AmortizationSchedule:
+    """Builds the amortization schedule of an annuity loan.
+
+    The monthly payment is the one from `calculate_annuity_payment`. Since
+    it is rounded up, the final payment is reduced to exactly repay the
+    remaining balance, and the loan may be repaid before `periods` ends.
+
+    Args:
+        interest: The monthly interest rate.
+        periods: The number of periods (months) of the loan.
+        principal: The loan principal.
+
+    Returns:
+        The schedule, with one row per period until the balance is zero.
+    """
+    payment, _ = _annuity_payment(interest, periods, principal)
+    schedule = AmortizationSchedule(
+        period=array("q"),
+        payment=array("d"),
+        interest=array("d"),
+        principal=array("d"),
+        balance=array("d"),
+    )
+
+    balance = float(principal)
+    for period in range(1, periods + 1):
+        interest_part = balance * interest
+        amount = float(payment)
+        if period == periods or balance + interest_part <= amount:
+            amount = balance + interest_part
+            principal_part, balance = balance, 0.0
+        else:
+            principal_part = amount - interest_part
+            balance -= principal_part
+
+        schedule.period.append(period)
+        schedule.payment.append(amount)
+        schedule.interest.append(interest_part)
+        schedule.principal.append(principal_part)
+        schedule.balance.append(balance)
+        if not balance:
+            break
+
+    return schedule
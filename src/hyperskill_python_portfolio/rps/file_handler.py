@@ -3,10 +3,62 @@
 from __future__ import annotations
 
 import logging
+import mmap
+import os
+import re
+import secrets
+import stat
+from array import array
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no advisory locks
+    fcntl = None  # type: ignore[assignment]
+
 DEFAULT_RATING_FILE = Path("rating.txt")
 
+#: A function called with a rating file and the scores just saved to it.
+ScoreListener = Callable[[Path, Mapping[str, int]], None]
+
+_score_listeners: list[ScoreListener] = []
+
+# A well-formed `name score` line; anything else is skipped, as in the readers below.
+_RECORD = re.compile(rb"^[ \t]*(\S+)[ \t]+([+-]?\d+)[ \t]*\r?$", re.MULTILINE)
+
+# The range of scores a `RatingIndex` can hold in its signed 64-bit array.
+_MIN_SCORE, _MAX_SCORE = -(2**63), 2**63 - 1
+
+
+@dataclass(frozen=True)
+class RatingIndex:
+    """A compact, read-only view of a whole rating file.
+
+    Scores and the byte offsets of their records are stored in `array('q')`
+    buffers, and each username maps to its position in them.
+
+    Attributes:
+        positions: The position of each username in the arrays.
+        scores: The score of each user, by position.
+        offsets: The byte offset of each user's record in the file, by position.
+    """
+
+    positions: dict[str, int] = field(default_factory=dict)
+    scores: array[int] = field(default_factory=lambda: array("q"))
+    offsets: array[int] = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        """Returns the number of users in the index."""
+        return len(self.scores)
+
+    def get(self, username: str) -> int | None:
+        """Returns the score of a user, or `None` if the user is unknown."""
+        position = self.positions.get(username)
+        return None if position is None else self.scores[position]
+
 
 def get_user_score(username: str, file_path: Path = DEFAULT_RATING_FILE) -> int:
     """Reads a user's score from the rating file.
@@ -35,33 +87,172 @@ def get_user_score(username: str, file_path: Path = DEFAULT_RATING_FILE) -> int:
     raise ValueError(f"Username '{username}' not found in {file_path}")
 
 
+def _lock_path(file_path: Path) -> Path:
+    """Returns the path of the lock file guarding a rating file."""
+    return file_path.with_name(f"{file_path.name}.lock")
+
+
+@contextmanager
+def rating_lock(file_path: Path = DEFAULT_RATING_FILE) -> Iterator[None]:
+    """Holds an exclusive advisory lock on a rating file.
+
+    The lock is taken with `fcntl.flock` on a separate `.lock` file next to
+    the rating file, because the rating file itself is replaced on every
+    write. It only excludes other processes that also take this lock, and it
+    is a no-op on platforms without `fcntl`.
+
+    Args:
+        file_path: The path to the rating file to lock.
+    """
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    with open(_lock_path(file_path), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _create_temp_file(file_path: Path) -> tuple[Path, int]:
+    """Creates a new, uniquely named file next to a file, returning its path and descriptor.
+
+    The file is created with mode 0o666, so the kernel applies the umask,
+    just as for any file created with `open`.
+    """
+    while True:
+        temp_path = file_path.with_name(f".{file_path.name}.{secrets.token_hex(4)}")
+        try:
+            return temp_path, os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+        except FileExistsError:
+            continue
+
+
+def write_snapshot(file_path: Path, scores: Mapping[str, int]) -> None:
+    """Atomically replaces a rating file with the given scores.
+
+    The scores are written to a temporary file in the same directory, synced
+    to disk, and renamed over the target, so readers and crashes only ever
+    observe the complete old file or the complete new one. The new file keeps
+    the permissions of the old one, or gets the default permissions of a new
+    file.
+    """
+    try:
+        mode: int | None = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    temp_path, descriptor = _create_temp_file(file_path)
+    try:
+        with open(descriptor, "w", encoding="utf-8") as file:
+            file.writelines(f"{name} {score}\n" for name, score in scores.items())
+            file.flush()
+            os.fsync(file.fileno())
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
+
+def update_user_scores(updates: Mapping[str, int], file_path: Path = DEFAULT_RATING_FILE) -> None:
+    """Saves or updates the scores of many users in one locked rewrite.
+
+    The read-modify-write cycle runs under `rating_lock`, so concurrent
+    updates from several processes are serialized instead of overwriting
+    each other, and the file is replaced atomically with `write_snapshot`.
+    Afterwards, every function registered with `add_score_listener` is
+    notified of the updates.
+
+    Args:
+        updates: The new score of every user to save.
+        file_path: The path to the file where ratings are stored.
+    """
+    with rating_lock(file_path):
+        scores: dict[str, int] = {}
+        try:
+            with open(file_path, encoding="utf-8") as file:
+                for line in file:
+                    parts = line.strip().split()
+                    if len(parts) == 2:
+                        name, score_str = parts
+                        try:
+                            scores[name] = int(score_str)
+                        except ValueError:
+                            logging.warning(f"Skipping malformed score for {name} in {file_path}")
+        except FileNotFoundError:
+            logging.info(f"Rating file {file_path} not found. A new one will be created.")
+
+        scores.update(updates)
+        write_snapshot(file_path, scores)
+
+    for listener in _score_listeners:
+        listener(file_path, updates)
+
+
+def add_score_listener(listener: ScoreListener) -> None:
+    """Registers a function to be called after every saved score update."""
+    _score_listeners.append(listener)
+
+
+def remove_score_listener(listener: ScoreListener) -> None:
+    """Unregisters a function added with `add_score_listener`."""
+    _score_listeners.remove(listener)
+
+
 def save_user_score(username: str, score: int, file_path: Path = DEFAULT_RATING_FILE) -> None:
     """Saves or updates a user's score in the rating file.
 
     This function reads all existing scores, updates the score for the
     specified user (or adds them if new), and writes the entire file back.
+    It is safe to call from several processes at once; see
+    `update_user_scores`.
 
     Args:
         username: The name of the user whose score is to be saved.
         score: The new score to save for the user.
         file_path: The path to the file where ratings are stored.
     """
-    scores: dict[str, int] = {}
-    try:
-        with open(file_path, encoding="utf-8") as file:
-            for line in file:
-                parts = line.strip().split()
-                if len(parts) == 2:
-                    name, score_str = parts
-                    try:
-                        scores[name] = int(score_str)
-                    except ValueError:
-                        logging.warning(f"Skipping malformed score for {name} in {file_path}")
-    except FileNotFoundError:
-        logging.info(f"Rating file {file_path} not found. A new one will be created.")
+    update_user_scores({username: score}, file_path)
+
+
+def load_ratings(file_path: Path = DEFAULT_RATING_FILE) -> RatingIndex:
+    """Loads a whole rating file into a compact index in a single pass.
+
+    The file is memory-mapped and scanned with one regular expression, so
+    the lines are never split into intermediate Python strings; only the
+    usernames are decoded. Like `get_user_score`, the first record of a user
+    wins and malformed lines are skipped. A user whose first score does not
+    fit in 64 bits is skipped with a warning, later records included.
 
-    scores[username] = score
+    Args:
+        file_path: The path to the file containing user ratings.
+
+    Returns:
+        The index of all users and their scores.
 
-    with open(file_path, "w", encoding="utf-8") as file:
-        for name, s in scores.items():
-            file.write(f"{name} {s}\n")
+    Raises:
+        FileNotFoundError: If the file at `file_path` cannot be found.
+    """
+    index = RatingIndex()
+    with open(file_path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return index  # An empty file cannot be memory-mapped.
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            positions, scores, offsets = index.positions, index.scores, index.offsets
+            out_of_range: set[str] = set()
+            for match in _RECORD.finditer(mapped):
+                name = match.group(1).decode("utf-8")
+                if name in positions or name in out_of_range:
+                    continue
+                score = int(match.group(2))
+                if not _MIN_SCORE <= score <= _MAX_SCORE:
+                    logging.warning(f"Skipping out-of-range score for {name} in {file_path}")
+                    out_of_range.add(name)
+                    continue
+                positions[name] = len(scores)
+                scores.append(score)
+                offsets.append(match.start(1))
+    return index
@@ -2,25 +2,88 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
 
 #: A tuple containing the default game options in winning order.
 DEFAULT_OPTIONS = ("rock", "paper", "scissors")
 
+#: The points a player earns for a win (1), a draw (0) and a loss (-1).
+OUTCOME_POINTS: Mapping[int, int] = MappingProxyType({1: 100, 0: 50, -1: 0})
+
+#: The maximum number of distinct rule sets kept by `create_rules_from_input`.
+RULES_CACHE_SIZE = 128
+
 
 @dataclass(frozen=True)
 class GameRules:
     """Represents the immutable rules of a Rock-Paper-Scissors style game.
 
-    This data-centric class holds the game options and provides a single
-    method to compare choices. Other interactions can be performed directly
-    on the public `options` attribute.
+    This data-centric class holds the game options and provides methods to
+    compare choices. Other interactions can be performed directly on the
+    public `options` attribute.
+
+    On construction, the rules precompute the position of every option and
+    the outcome of every pair of options, so a comparison costs two dictionary
+    lookups, or a single table lookup with `compare_indices`, regardless of
+    the number of options.
 
     Attributes:
         options: A tuple of valid game choices in winning order.
+        indices: The position of each option in `options`, read-only.
+        outcomes: The outcome of every pair of option positions, as returned
+            by `compare_indices`.
     """
 
     options: tuple[str, ...] = DEFAULT_OPTIONS
+    indices: Mapping[str, int] = field(init=False, repr=False, compare=False)
+    outcomes: tuple[tuple[int, ...], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Builds the index map and the outcome table of the options."""
+        indices: dict[str, int] = {}
+        for index, option in enumerate(self.options):
+            indices.setdefault(option, index)
+        object.__setattr__(self, "indices", MappingProxyType(indices))
+
+        # Shifting the circular list of options so that the first player's
+        # choice is in the middle puts every choice it beats on its left, that
+        # is, the `half` options preceding it in the circle.
+        length = len(self.options)
+        half = length // 2
+        outcomes = tuple(
+            tuple(
+                0
+                if p1_index == p2_index
+                else 1
+                if (p2_index - p1_index + half) % length < half
+                else -1
+                for p2_index in range(length)
+            )
+            for p1_index in range(length)
+        )
+        object.__setattr__(self, "outcomes", outcomes)
+
+    def __reduce__(self) -> tuple[type[GameRules], tuple[tuple[str, ...]]]:
+        """Pickles the rules by their options; the lookup tables are rebuilt."""
+        return type(self), (self.options,)
+
+    def compare_indices(self, player_1_index: int, player_2_index: int) -> int:
+        """Compares two choices given by their positions in `options`.
+
+        This is the fast path for simulations that keep choices as indices.
+
+        Args:
+            player_1_index: The position of the first player's choice.
+            player_2_index: The position of the second player's choice.
+
+        Returns:
+             1 if player 1 wins, 0 for a draw, -1 if player 2 wins.
+        """
+        return self.outcomes[player_1_index][player_2_index]
 
     def compare(self, player_1_choice: str, player_2_choice: str) -> int:
         """Compares two choices based on their circular relationship.
@@ -35,39 +98,58 @@ class GameRules:
 
         Returns:
              1 if player 1 wins, 0 for a draw, -1 if player 2 wins.
+
+        Raises:
+            ValueError: If a choice is not one of the options.
         """
         if player_1_choice == player_2_choice:
             return 0
+        try:
+            return self.outcomes[self.indices[player_1_choice]][self.indices[player_2_choice]]
+        except KeyError as e:
+            raise ValueError(f"{e.args[0]!r} is not a valid option") from None
 
-        # The core of the algorithm: determine the winner based on position
-        # in a circular list.
-        length = len(self.options)
-        half = length // 2
 
-        # Find the index of the first player's choice.
-        p1_index = self.options.index(player_1_choice)
+class CacheStats(NamedTuple):
+    """Represents the hit and miss counters of the rule set cache."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int | None
 
-        # Calculate a delta to shift the list so p1_index is at `half`.
-        # This simplifies comparison by putting p1 at a known reference point.
-        delta = half - p1_index
-        p1_shifted_index = (p1_index + delta) % length
-        p2_shifted_index = (self.options.index(player_2_choice) + delta) % length
 
-        return 1 if p1_shifted_index > p2_shifted_index else -1
+@lru_cache(maxsize=RULES_CACHE_SIZE)
+def _rules_for(options: tuple[str, ...]) -> GameRules:
+    """Returns the shared rules of a normalized tuple of options."""
+    return GameRules(options)
 
 
 def create_rules_from_input(options_str: str) -> GameRules:
     """Creates a GameRules instance from a comma-separated string.
 
-    If the input string is empty, default rules are returned.
+    If the input string is empty, default rules are returned. The rules are
+    cached by their normalized options, so every distinct variant builds its
+    lookup tables only once, and equal variants share one immutable instance.
 
     Args:
         options_str: A string of game options, e.g., "rock, paper, scissors".
 
     Returns:
-        A new GameRules instance.
+        A GameRules instance, possibly shared with earlier calls.
     """
     if not options_str:
-        return GameRules()
+        return _rules_for(DEFAULT_OPTIONS)
+
+    return _rules_for(tuple(opt.strip() for opt in options_str.lower().split(",")))
+
+
+def rules_cache_stats() -> CacheStats:
+    """Returns the hit and miss counters of the rule set cache."""
+    info = _rules_for.cache_info()
+    return CacheStats(info.hits, info.misses, info.currsize, info.maxsize)
+
 
-    return GameRules(tuple(opt.strip() for opt in options_str.lower().split(",")))
+def clear_rules_cache() -> None:
+    """Empties the rule set cache and resets its counters."""
+    _rules_for.cache_clear()
@@ -0,0 +1,107 @@
+"""Ranks players by their rating without re-reading and sorting the rating file.
+
+A `Leaderboard` keeps every player in a list sorted by descending score,
+next to a dictionary of the current scores. The best players are a slice of
+the list, and the rank of a player is found by binary search, so neither
+query scans or sorts all players. An update removes the old entry and
+inserts the new one with `bisect`; both only shift pointers within the list.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+
+from .file_handler import (
+    DEFAULT_RATING_FILE,
+    ScoreListener,
+    add_score_listener,
+    load_ratings,
+    remove_score_listener,
+)
+
+#: The number of players shown by `!top` without an explicit count.
+DEFAULT_TOP = 10
+
+
+class Leaderboard:
+    """An incrementally maintained ranking of players by score.
+
+    Players with the same score are ordered by name.
+    """
+
+    def __init__(self, scores: Iterable[tuple[str, int]] = ()) -> None:
+        """Creates a leaderboard from `(username, score)` pairs; later pairs win."""
+        self.scores = dict(scores)
+        self._entries = sorted((-score, name) for name, score in self.scores.items())
+        self._listener: ScoreListener | None = None
+
+    @classmethod
+    def from_file(cls, file_path: Path = DEFAULT_RATING_FILE) -> Leaderboard:
+        """Loads a leaderboard from a rating file and keeps it in sync with it.
+
+        The leaderboard is registered with `add_score_listener`, so every
+        later `save_user_score` to the same file also updates it, until
+        `close` is called. A missing file gives an empty leaderboard.
+        """
+        try:
+            index = load_ratings(file_path)
+        except FileNotFoundError:
+            leaderboard = cls()
+        else:
+            leaderboard = cls(zip(index.positions, index.scores, strict=True))
+
+        watched = file_path.resolve()
+
+        def on_save(saved_path: Path, updates: Mapping[str, int]) -> None:
+            if saved_path.resolve() == watched:
+                leaderboard.update_many(updates)
+
+        add_score_listener(on_save)
+        leaderboard._listener = on_save
+        return leaderboard
+
+    def close(self) -> None:
+        """Stops following the rating file the leaderboard was loaded from."""
+        if self._listener is not None:
+            remove_score_listener(self._listener)
+            self._listener = None
+
+    def __len__(self) -> int:
+        """Returns the number of players on the leaderboard."""
+        return len(self._entries)
+
+    def get(self, username: str) -> int | None:
+        """Returns the score of a player, or `None` if the player is unknown."""
+        return self.scores.get(username)
+
+    def update(self, username: str, score: int) -> None:
+        """Adds a player or changes their score."""
+        previous = self.scores.get(username)
+        if previous == score:
+            return
+        if previous is not None:
+            del self._entries[bisect.bisect_left(self._entries, (-previous, username))]
+        bisect.insort(self._entries, (-score, username))
+        self.scores[username] = score
+
+    def update_many(self, scores: Mapping[str, int]) -> None:
+        """Adds or changes the scores of several players."""
+        for username, score in scores.items():
+            self.update(username, score)
+
+    def top(self, count: int = DEFAULT_TOP) -> list[tuple[str, int]]:
+        """Returns the `(username, score)` pairs of the best players, best first."""
+        return [(name, -score) for score, name in self._entries[:count]]
+
+    def rank(self, username: str) -> int | None:
+        """Returns the rank of a player, or `None` if the player is unknown.
+
+        Players with the same score share the same rank, which is one more
+        than the number of players with a higher score.
+        """
+        score = self.scores.get(username)
+        if score is None:
+            return None
+        return bisect.bisect_left(self._entries, (-score,)) + 1
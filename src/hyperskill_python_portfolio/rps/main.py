@@ -12,56 +12,110 @@ import logging
 import random
 
 from .file_handler import DEFAULT_RATING_FILE, get_user_score
-from .game_logic import GameRules, create_rules_from_input
+from .game_logic import OUTCOME_POINTS, GameRules, create_rules_from_input
+from .leaderboard import DEFAULT_TOP, Leaderboard
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
-def handle_game_turn(user_input: str, current_score: int, rules: GameRules) -> int:
-    """Handles a single user move, compares it, and updates the score.
+def play_turn(
+    user_input: str, rules: GameRules, rng: random.Random | None = None
+) -> tuple[int, str]:
+    """Plays a single user move against a random computer choice.
+
+    This is the console-independent core of `handle_game_turn`, shared with
+    the network server.
 
     Args:
         user_input: The move entered by the user (e.g., "rock").
-        current_score: The user's current score.
         rules: The rules for the current game.
+        rng: The random generator for the computer's choice; defaults to
+            the global one.
 
     Returns:
-        The updated score after the turn.
+        The points earned in the turn and the message describing it.
     """
-    computer_choice = random.choice(rules.options)  # noqa: S311
+    computer_choice = (rng or random).choice(rules.options)
     result = rules.compare(user_input, computer_choice)
 
     match result:
         case 1:
-            print(f"Well done. The computer chose {computer_choice} and failed")
-            return current_score + 100
+            message = f"Well done. The computer chose {computer_choice} and failed"
         case 0:
-            print(f"There is a draw ({user_input})")
-            return current_score + 50
-        case -1:
-            print(f"Sorry, but the computer chose {computer_choice}")
-            return current_score
-    return current_score  # Should be unreachable, but good for type safety
+            message = f"There is a draw ({user_input})"
+        case _:
+            message = f"Sorry, but the computer chose {computer_choice}"
+    return OUTCOME_POINTS[result], message
+
+
+def handle_game_turn(user_input: str, current_score: int, rules: GameRules) -> int:
+    """Handles a single user move, compares it, and updates the score.
+
+    Args:
+        user_input: The move entered by the user (e.g., "rock").
+        current_score: The user's current score.
+        rules: The rules for the current game.
+
+    Returns:
+        The updated score after the turn.
+    """
+    points, message = play_turn(user_input, rules)
+    print(message)
+    return current_score + points
 
 
-def game_loop(initial_score: int, rules: GameRules) -> None:
+def format_top(command: str, leaderboard: Leaderboard) -> str:
+    """Formats the best players for a `!top` or `!top N` command.
+
+    Args:
+        command: The command entered by the user.
+        leaderboard: The leaderboard to query.
+
+    Returns:
+        One line per player with their rank, name and score, or
+        "Invalid input" if the count is not a positive number.
+    """
+    count_str = command.removeprefix("!top").strip() or str(DEFAULT_TOP)
+    if not count_str.isdigit() or int(count_str) == 0:
+        return "Invalid input"
+    top = leaderboard.top(int(count_str))
+    if not top:
+        return "No ratings yet"
+    return "\n".join(f"{rank}. {name} {score}" for rank, (name, score) in enumerate(top, start=1))
+
+
+def game_loop(
+    initial_score: int, rules: GameRules, leaderboard: Leaderboard | None = None
+) -> None:
     """Runs the main interactive game loop.
 
     Args:
         initial_score: The player's starting score.
         rules: The rules for the current game.
+        leaderboard: The leaderboard queried by `!top`; defaults to the one
+            of the rating file.
     """
     score = initial_score
-    while True:
-        user_input = input().strip().lower()
-        if user_input == "!exit":
-            break
-        if user_input == "!rating":
-            print(f"Your rating: {score}")
-        elif user_input in rules.options:
-            score = handle_game_turn(user_input, score, rules)
-        else:
-            print("Invalid input")
+    owned: Leaderboard | None = None
+    try:
+        while True:
+            user_input = input().strip().lower()
+            if user_input == "!exit":
+                break
+            if user_input == "!rating":
+                print(f"Your rating: {score}")
+            elif user_input == "!top" or user_input.startswith("!top "):
+                if leaderboard is None:
+                    leaderboard = owned = Leaderboard.from_file(DEFAULT_RATING_FILE)
+                print(format_top(user_input, leaderboard))
+            elif user_input in rules.options:
+                score = handle_game_turn(user_input, score, rules)
+            else:
+                print("Invalid input")
+    finally:
+        # Stop following the rating file with a leaderboard loaded here.
+        if owned is not None:
+            owned.close()
 
     print("Bye!")
 
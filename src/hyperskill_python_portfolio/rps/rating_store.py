@@ -0,0 +1,347 @@
+"""Pluggable storage backends for player ratings.
+
+The plain `rating.txt` format handled by `file_handler` is simple, but every
+lookup scans the file and every save rewrites it. The stores in this module
+share a small `RatingStore` interface so that larger deployments can switch
+to an indexed backend while keeping the text format for import and export.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import Protocol, Self
+
+from .file_handler import get_user_score, save_user_score, update_user_scores, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+#: File suffixes that select the SQLite backend in `open_rating_store`.
+SQLITE_SUFFIXES = frozenset({".db", ".sqlite", ".sqlite3"})
+
+#: The default number of journaled updates after which the snapshot is rewritten.
+DEFAULT_COMPACT_EVERY = 10_000
+
+#: The default number of buffered updates after which a coalescing store flushes.
+DEFAULT_FLUSH_EVERY = 1_000
+
+_UPSERT = (
+    "INSERT INTO ratings (name, score) VALUES (?, ?) "
+    "ON CONFLICT (name) DO UPDATE SET score = excluded.score"
+)
+
+
+def _parse_record(line: str) -> tuple[str, int] | None:
+    """Parses a `name score` record, returning `None` if it is malformed."""
+    parts = line.split()
+    if len(parts) != 2:
+        return None
+    try:
+        return parts[0], int(parts[1])
+    except ValueError:
+        return None
+
+
+class RatingStore(Protocol):
+    """The interface shared by all rating storage backends."""
+
+    def get(self, username: str) -> int | None:
+        """Returns the score of a user, or `None` if the user is unknown."""
+        ...
+
+    def set(self, username: str, score: int) -> None:
+        """Saves or updates the score of a user."""
+        ...
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """Yields every `(username, score)` pair in the store."""
+        ...
+
+    def close(self) -> None:
+        """Releases any resources held by the store."""
+        ...
+
+
+class _ClosingContext:
+    """Mixin that closes a store when leaving a `with` block."""
+
+    def close(self) -> None:
+        """Releases any resources held by the store."""
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class TextRatingStore(_ClosingContext):
+    """Stores ratings in the plain `rating.txt` format.
+
+    Every lookup scans the file and every update rewrites it, so this store
+    is only suitable for small files. It exists for compatibility with the
+    interactive game and as an import/export format.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        """Creates a store backed by the given text file."""
+        self.file_path = file_path
+
+    def get(self, username: str) -> int | None:
+        """Returns the score of a user, or `None` if the user is unknown."""
+        try:
+            return get_user_score(username, self.file_path)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def set(self, username: str, score: int) -> None:
+        """Saves or updates the score of a user, rewriting the file."""
+        save_user_score(username, score, self.file_path)
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """Yields every well-formed `(username, score)` pair in the file."""
+        try:
+            with open(self.file_path, encoding="utf-8") as file:
+                for line in file:
+                    record = _parse_record(line)
+                    if record is not None:
+                        yield record
+        except FileNotFoundError:
+            return
+
+
+class CoalescingRatingStore(_ClosingContext):
+    """Buffers score updates and writes them to a text file in batches.
+
+    Every `set` only records the score in memory. The buffered scores are
+    merged into the rating file in a single locked rewrite, either once
+    `flush_every` users are pending or on `flush` and `close`. This turns N
+    rewrites of the whole file into one, and, since the merge re-reads the
+    file under `rating_lock`, several processes can share the same file
+    without losing each other's updates.
+
+    Updates still in the buffer are lost if the process dies; use
+    `JournalRatingStore` where every update must be durable.
+    """
+
+    def __init__(self, file_path: Path, flush_every: int | None = DEFAULT_FLUSH_EVERY) -> None:
+        """Creates a store that flushes to the given text file.
+
+        Args:
+            file_path: The rating file in the `rating.txt` format.
+            flush_every: Flush automatically once this many users have
+                pending updates, or only on demand if `None`.
+        """
+        self.file_path = file_path
+        self.flush_every = flush_every
+        self.pending: dict[str, int] = {}
+
+    def get(self, username: str) -> int | None:
+        """Returns the score of a user, including buffered updates."""
+        if username in self.pending:
+            return self.pending[username]
+        return TextRatingStore(self.file_path).get(username)
+
+    def set(self, username: str, score: int) -> None:
+        """Buffers the score of a user, flushing if the buffer is full."""
+        self.pending[username] = score
+        if self.flush_every is not None and len(self.pending) >= self.flush_every:
+            self.flush()
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """Yields every `(username, score)` pair, including buffered updates."""
+        scores = dict(TextRatingStore(self.file_path).items())
+        scores.update(self.pending)
+        yield from scores.items()
+
+    def flush(self) -> None:
+        """Merges all buffered updates into the rating file in one locked rewrite."""
+        if self.pending:
+            update_user_scores(self.pending, self.file_path)
+            self.pending = {}
+
+    def close(self) -> None:
+        """Flushes the buffered updates."""
+        self.flush()
+
+
+class SqliteRatingStore(_ClosingContext):
+    """Stores ratings in an SQLite database indexed by username.
+
+    The usernames form the primary key of a `WITHOUT ROWID` table, so both
+    lookups and in-place updates are O(log N) B-tree operations, regardless
+    of the number of players.
+    """
+
+    def __init__(self, file_path: Path | str) -> None:
+        """Opens (or creates) the database at the given path."""
+        self.connection = sqlite3.connect(file_path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS ratings "
+            "(name TEXT PRIMARY KEY, score INTEGER NOT NULL) WITHOUT ROWID"
+        )
+
+    def get(self, username: str) -> int | None:
+        """Returns the score of a user, or `None` if the user is unknown."""
+        row = self.connection.execute(
+            "SELECT score FROM ratings WHERE name = ?", (username,)
+        ).fetchone()
+        return None if row is None else int(row[0])
+
+    def set(self, username: str, score: int) -> None:
+        """Saves or updates the score of a user in place."""
+        with self.connection:
+            self.connection.execute(_UPSERT, (username, score))
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """Yields every `(username, score)` pair, ordered by username."""
+        yield from self.connection.execute("SELECT name, score FROM ratings ORDER BY name")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self.connection.close()
+
+    def import_text(self, file_path: Path) -> int:
+        """Imports all ratings from a text file in a single transaction.
+
+        Existing users are updated, new ones are added.
+
+        Returns:
+            The number of ratings imported.
+        """
+        with self.connection:
+            cursor = self.connection.executemany(_UPSERT, TextRatingStore(file_path).items())
+        logger.info("Imported %s ratings from %s", cursor.rowcount, file_path)
+        return cursor.rowcount
+
+    def export_text(self, file_path: Path) -> int:
+        """Exports all ratings to a text file in the `rating.txt` format.
+
+        Returns:
+            The number of ratings exported.
+        """
+        count = 0
+        with open(file_path, "w", encoding="utf-8") as file:
+            for name, score in self.items():
+                file.write(f"{name} {score}\n")
+                count += 1
+        return count
+
+
+class JournalRatingStore(_ClosingContext):
+    """Stores ratings as a text snapshot plus an append-only journal.
+
+    All scores are held in memory. Each update appends a single `name score`
+    record to the journal instead of rewriting the snapshot, so a save costs
+    O(1) regardless of the number of players. On startup, the snapshot is
+    loaded and the journal replayed on top of it; a torn record left by a
+    crash is dropped from the journal. `compact` folds the journal into a
+    new snapshot, which is written atomically, and then empties the journal.
+    Replaying a journal over a snapshot that already contains it is
+    harmless, so a crash between those two steps loses nothing.
+
+    The snapshot is a regular `rating.txt` file, readable by `file_handler`.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        journal_path: Path | None = None,
+        compact_every: int | None = DEFAULT_COMPACT_EVERY,
+        sync: bool = False,
+    ) -> None:
+        """Loads the snapshot, replays the journal and opens it for appending.
+
+        Args:
+            file_path: The snapshot file in the `rating.txt` format.
+            journal_path: The journal file; defaults to the snapshot path with
+                a `.journal` suffix appended.
+            compact_every: Compact automatically after this many journaled
+                updates, or never if `None`.
+            sync: Whether to `fsync` the journal after every update.
+        """
+        self.file_path = file_path
+        self.journal_path = journal_path or file_path.with_name(f"{file_path.name}.journal")
+        self.compact_every = compact_every
+        self.sync = sync
+
+        self.scores = dict(TextRatingStore(file_path).items())
+        self.pending = self._replay()
+        self._journal = open(self.journal_path, "a", encoding="utf-8")
+
+    def _replay(self) -> int:
+        """Applies the journal to the loaded scores, returning the record count.
+
+        A final record without a newline was cut off by a crash: it is not
+        applied, and the journal is truncated before it, so the next append
+        starts on a fresh line.
+        """
+        count = offset = 0
+        try:
+            journal = open(self.journal_path, "r+b")
+        except FileNotFoundError:
+            return 0
+        with journal:
+            for line in journal:
+                if not line.endswith(b"\n"):
+                    logger.warning("Truncating torn journal record in %s", self.journal_path)
+                    journal.truncate(offset)
+                    break
+                offset += len(line)
+                record = _parse_record(line.decode("utf-8", errors="replace"))
+                if record is None:
+                    logger.warning("Skipping malformed journal record in %s", self.journal_path)
+                    continue
+                self.scores[record[0]] = record[1]
+                count += 1
+        return count
+
+    def get(self, username: str) -> int | None:
+        """Returns the score of a user, or `None` if the user is unknown."""
+        return self.scores.get(username)
+
+    def set(self, username: str, score: int) -> None:
+        """Saves or updates the score of a user by appending to the journal."""
+        self._journal.write(f"{username} {score}\n")
+        self._journal.flush()
+        if self.sync:
+            os.fsync(self._journal.fileno())
+        self.scores[username] = score
+        self.pending += 1
+        if self.compact_every is not None and self.pending >= self.compact_every:
+            self.compact()
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """Yields every `(username, score)` pair in the store."""
+        yield from list(self.scores.items())
+
+    def compact(self) -> None:
+        """Writes a new snapshot atomically and empties the journal."""
+        write_snapshot(self.file_path, self.scores)
+        self._journal.truncate(0)
+        self.pending = 0
+        logger.info("Compacted %s ratings into %s", len(self.scores), self.file_path)
+
+    def close(self) -> None:
+        """Closes the journal. Pending updates stay journaled until compaction."""
+        self._journal.close()
+
+
+def open_rating_store(file_path: Path) -> TextRatingStore | SqliteRatingStore:
+    """Opens the rating store matching the file suffix.
+
+    Files ending in `.db`, `.sqlite` or `.sqlite3` are opened as SQLite
+    databases; anything else is treated as a text rating file.
+    """
+    if file_path.suffix.lower() in SQLITE_SUFFIXES:
+        return SqliteRatingStore(file_path)
+    return TextRatingStore(file_path)
@@ -0,0 +1,217 @@
+"""Hosts many concurrent Rock-Paper-Scissors games over TCP.
+
+The server speaks the same line protocol as the interactive game on the
+console. A client sends its name and then its game options (an empty line
+for the default rules), and every later line is a move, `!rating` or
+`!exit`. Each session has its own rules and score, and the moves are played
+with the same `play_turn` logic as `main`.
+
+Scores are not written to the rating file on every turn. All sessions share
+one `RatingWriter`, which collects the latest score of every player and
+merges them into the file in a single locked rewrite at a fixed interval.
+
+Usage:
+    python -m hyperskill_python_portfolio.rps.server [--port N] [--rating-file FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import random
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from .file_handler import DEFAULT_RATING_FILE, RatingIndex, load_ratings, update_user_scores
+from .game_logic import create_rules_from_input
+from .main import play_turn
+
+logger = logging.getLogger(__name__)
+
+#: The default TCP port of the server.
+DEFAULT_PORT = 8765
+
+#: The default number of seconds between two flushes of the rating file.
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class RatingWriter:
+    """Collects the scores of all sessions and flushes them in batches.
+
+    The rating file is loaded once at startup. Afterwards, scores are read
+    from memory, and updates are buffered until the next `flush`, which
+    merges all of them into the file with `update_user_scores` in a worker
+    thread, so the event loop is never blocked by file I/O.
+    """
+
+    def __init__(self, file_path: Path = DEFAULT_RATING_FILE) -> None:
+        """Loads the ratings of the given file, if it exists."""
+        self.file_path = file_path
+        try:
+            self.index = load_ratings(file_path)
+        except FileNotFoundError:
+            self.index = RatingIndex()
+        self.scores: dict[str, int] = {}
+        self.pending: dict[str, int] = {}
+
+    def get(self, username: str) -> int:
+        """Returns the latest score of a user, or 0 for a new user."""
+        score = self.scores.get(username, self.index.get(username))
+        return 0 if score is None else score
+
+    def set(self, username: str, score: int) -> None:
+        """Records the latest score of a user until the next flush."""
+        self.scores[username] = score
+        self.pending[username] = score
+
+    async def flush(self) -> None:
+        """Merges the pending scores into the rating file.
+
+        If the write fails, the scores are kept for the next flush, behind
+        any newer scores recorded in the meantime, and the error is raised.
+        """
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, {}
+        try:
+            await asyncio.to_thread(update_user_scores, batch, self.file_path)
+        except BaseException:
+            self.pending = batch | self.pending
+            raise
+        logger.debug("Flushed %s ratings to %s", len(batch), self.file_path)
+
+    async def run(self, interval: float = DEFAULT_FLUSH_INTERVAL) -> None:
+        """Flushes the pending scores every `interval` seconds until cancelled.
+
+        A failed flush is logged and retried at the next interval.
+        """
+        try:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.flush()
+                except OSError:
+                    logger.exception("Cannot write the ratings to %s", self.file_path)
+        finally:
+            await self.flush()
+
+
+class GameServer:
+    """Serves a game session to every connected client."""
+
+    def __init__(self, ratings: RatingWriter, rng: random.Random | None = None) -> None:
+        """Creates a server that keeps the scores in the given writer."""
+        self.ratings = ratings
+        self.rng = rng or random.Random()  # noqa: S311
+
+    async def handle_session(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Plays one game with a connected client until it exits or disconnects."""
+
+        def send(message: str) -> None:
+            writer.write(f"{message}\n".encode())
+
+        try:
+            name = (await reader.readline()).decode().strip()
+            if not name:
+                return
+            send(f"Hello, {name}")
+            score = self.ratings.get(name)
+            rules = create_rules_from_input((await reader.readline()).decode().strip())
+            send("Okay, let's start")
+            await writer.drain()
+
+            while line := await reader.readline():
+                try:
+                    user_input = line.decode().strip().lower()
+                except UnicodeDecodeError:
+                    user_input = ""
+                if user_input == "!exit":
+                    break
+                if user_input == "!rating":
+                    send(f"Your rating: {score}")
+                elif user_input in rules.indices:
+                    points, message = play_turn(user_input, rules, self.rng)
+                    score += points
+                    self.ratings.set(name, score)
+                    send(message)
+                else:
+                    send("Invalid input")
+                await writer.drain()
+
+            send("Bye!")
+            await writer.drain()
+        except ConnectionError:
+            logger.debug("Client disconnected")
+        except ValueError:
+            # A line over the stream limit, or a name or options that are not UTF-8.
+            logger.debug("Closing session after invalid input")
+            with contextlib.suppress(ConnectionError):
+                send("Invalid input")
+                await writer.drain()
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+
+@contextlib.asynccontextmanager
+async def running_server(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    file_path: Path = DEFAULT_RATING_FILE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+) -> AsyncIterator[asyncio.Server]:
+    """Starts a game server and its rating writer for the duration of a block.
+
+    On exit, the server stops accepting clients and the pending ratings are
+    flushed. Pass port 0 to listen on any free port.
+    """
+    ratings = RatingWriter(file_path)
+    flusher = asyncio.create_task(ratings.run(flush_interval))
+    server = await asyncio.start_server(GameServer(ratings).handle_session, host, port)
+    try:
+        async with server:
+            yield server
+    finally:
+        flusher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await flusher
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    file_path: Path = DEFAULT_RATING_FILE,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+) -> None:
+    """Runs the game server until it is cancelled."""
+    async with running_server(host, port, file_path, flush_interval) as server:
+        logger.info("Serving on %s", ", ".join(str(s.getsockname()) for s in server.sockets))
+        await server.serve_forever()
+
+
+def main() -> None:
+    """Starts the game server from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    parser.add_argument("--rating-file", type=Path, default=DEFAULT_RATING_FILE)
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=DEFAULT_FLUSH_INTERVAL,
+        help="Seconds between two writes of the rating file",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, args.rating_file, args.flush_interval))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""Plays headless Rock-Paper-Scissors matches between automated strategies.
+
+Unlike the interactive game in `main`, nothing here reads input or prints:
+a match plays a number of rounds between two strategies under a set of
+`GameRules` and returns aggregate statistics, scored with the same
+`OUTCOME_POINTS` as a human player.
+
+Strategies work with the positions of the options rather than their names,
+so every round is scored with a single lookup in the precomputed outcome
+table of the rules.
+"""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Protocol
+
+from .game_logic import OUTCOME_POINTS, GameRules
+
+
+class Strategy(Protocol):
+    """A player that chooses moves, possibly learning from previous rounds."""
+
+    def choose(self) -> int:
+        """Returns the position of the option to play in the next round."""
+        ...
+
+    def observe(self, own_choice: int, opponent_choice: int) -> None:
+        """Records the choices of both players in the last round."""
+        ...
+
+
+def _counter_moves(rules: GameRules) -> tuple[int, ...]:
+    """Returns, for every option, an option that beats it (or itself if none does)."""
+    size = len(rules.options)
+    return tuple(
+        next((move for move in range(size) if rules.outcomes[move][target] == 1), target)
+        for target in range(size)
+    )
+
+
+class RandomStrategy:
+    """Plays a uniformly random option every round."""
+
+    def __init__(self, rules: GameRules, rng: random.Random) -> None:
+        """Creates a strategy that draws its moves from `rng`."""
+        self.size = len(rules.options)
+        self.rng = rng
+
+    def choose(self) -> int:
+        """Returns a random option."""
+        return self.rng.randrange(self.size)
+
+    def choose_many(self, rounds: int) -> list[int]:
+        """Returns the random options of many rounds at once."""
+        return self.rng.choices(range(self.size), k=rounds)
+
+    def observe(self, own_choice: int, opponent_choice: int) -> None:
+        """Ignores the last round."""
+
+
+class FrequencyStrategy:
+    """Counters the option the opponent has played most often so far."""
+
+    def __init__(self, rules: GameRules, rng: random.Random) -> None:
+        """Creates a strategy that plays randomly until it has seen a move."""
+        self.counters = _counter_moves(rules)
+        self.counts = [0] * len(rules.options)
+        self.favorite = 0
+        self.fallback = RandomStrategy(rules, rng)
+
+    def choose(self) -> int:
+        """Returns the option that beats the opponent's favorite."""
+        if not self.counts[self.favorite]:
+            return self.fallback.choose()
+        return self.counters[self.favorite]
+
+    def observe(self, own_choice: int, opponent_choice: int) -> None:
+        """Counts the opponent's choice, keeping track of the favorite."""
+        self.counts[opponent_choice] += 1
+        if self.counts[opponent_choice] > self.counts[self.favorite]:
+            self.favorite = opponent_choice
+
+
+class MarkovStrategy:
+    """Counters the opponent's most likely reply to their own previous move.
+
+    The strategy learns a first-order Markov chain of the opponent's moves:
+    how often each option followed each other option.
+    """
+
+    def __init__(self, rules: GameRules, rng: random.Random) -> None:
+        """Creates a strategy that plays randomly until it can predict a move."""
+        size = len(rules.options)
+        self.counters = _counter_moves(rules)
+        self.transitions = [[0] * size for _ in range(size)]
+        self.likeliest = [0] * size
+        self.previous: int | None = None
+        self.fallback = RandomStrategy(rules, rng)
+
+    def choose(self) -> int:
+        """Returns the option that beats the predicted move."""
+        if self.previous is None:
+            return self.fallback.choose()
+        predicted = self.likeliest[self.previous]
+        if not self.transitions[self.previous][predicted]:
+            return self.fallback.choose()
+        return self.counters[predicted]
+
+    def observe(self, own_choice: int, opponent_choice: int) -> None:
+        """Records the transition from the opponent's previous move."""
+        if self.previous is not None:
+            row = self.transitions[self.previous]
+            row[opponent_choice] += 1
+            if row[opponent_choice] > row[self.likeliest[self.previous]]:
+                self.likeliest[self.previous] = opponent_choice
+        self.previous = opponent_choice
+
+
+#: A function that creates a strategy for a set of rules and a random generator.
+StrategyFactory = Callable[[GameRules, random.Random], Strategy]
+
+#: The built-in strategies by name.
+STRATEGIES: Mapping[str, StrategyFactory] = MappingProxyType(
+    {"random": RandomStrategy, "frequency": FrequencyStrategy, "markov": MarkovStrategy}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class MatchResult:
+    """Represents the aggregate statistics of a match, from player 1's view.
+
+    Attributes:
+        rounds: The number of rounds played.
+        wins: The rounds won by player 1.
+        draws: The rounds that ended in a draw.
+        losses: The rounds won by player 2.
+    """
+
+    rounds: int
+    wins: int
+    draws: int
+    losses: int
+
+    @property
+    def score_1(self) -> int:
+        """Returns the points earned by player 1."""
+        return (
+            self.wins * OUTCOME_POINTS[1]
+            + self.draws * OUTCOME_POINTS[0]
+            + self.losses * OUTCOME_POINTS[-1]
+        )
+
+    @property
+    def score_2(self) -> int:
+        """Returns the points earned by player 2."""
+        return (
+            self.losses * OUTCOME_POINTS[1]
+            + self.draws * OUTCOME_POINTS[0]
+            + self.wins * OUTCOME_POINTS[-1]
+        )
+
+    @property
+    def win_rate(self) -> float:
+        """Returns the share of rounds won by player 1."""
+        return self.wins / self.rounds if self.rounds else 0.0
+
+
+def play_match(
+    rules: GameRules, player_1: Strategy, player_2: Strategy, rounds: int
+) -> MatchResult:
+    """Plays a number of rounds between two strategies.
+
+    When both players are `RandomStrategy`, their moves do not depend on
+    the history, so all of them are drawn in bulk and the outcomes tallied
+    in a single pass.
+
+    Args:
+        rules: The rules of the game.
+        player_1: The strategy of the first player.
+        player_2: The strategy of the second player.
+        rounds: The number of rounds to play.
+
+    Returns:
+        The statistics of the match.
+
+    Raises:
+        ValueError: If the number of rounds is negative.
+    """
+    if rounds < 0:
+        raise ValueError("The number of rounds must be non-negative.")
+
+    outcomes = rules.outcomes
+    # Exact types: a subclass may override `choose` or `observe`.
+    if type(player_1) is RandomStrategy and type(player_2) is RandomStrategy:
+        tally = Counter(
+            map(rules.compare_indices, player_1.choose_many(rounds), player_2.choose_many(rounds))
+        )
+        return MatchResult(rounds=rounds, wins=tally[1], draws=tally[0], losses=tally[-1])
+
+    # Indexed by outcome: draws at 0, wins at 1 and losses at -1, the last item.
+    counts = [0, 0, 0]
+    choose_1, observe_1 = player_1.choose, player_1.observe
+    choose_2, observe_2 = player_2.choose, player_2.observe
+    for _ in range(rounds):
+        choice_1, choice_2 = choose_1(), choose_2()
+        counts[outcomes[choice_1][choice_2]] += 1
+        observe_1(choice_1, choice_2)
+        observe_2(choice_2, choice_1)
+    return MatchResult(rounds=rounds, wins=counts[1], draws=counts[0], losses=counts[-1])
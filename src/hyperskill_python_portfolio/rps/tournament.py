@@ -0,0 +1,209 @@
+"""Runs round-robin tournaments between Rock-Paper-Scissors strategies.
+
+Every pair of strategies plays one match of a fixed number of rounds, and
+each strategy collects the points of all its matches, as in the interactive
+game. The matches are independent, so they can be spread over a pool of
+worker processes.
+
+Each match seeds its own random generators from the tournament seed and the
+names of its players, so the results are reproducible and do not depend on
+the number of workers or on the order in which the matches finish.
+
+Usage:
+    python -m hyperskill_python_portfolio.rps.tournament [--rounds N] [--workers N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import combinations
+from pathlib import Path
+
+from .game_logic import GameRules, create_rules_from_input
+from .rating_store import RatingStore, open_rating_store
+from .simulation import STRATEGIES, MatchResult, StrategyFactory, play_match
+
+#: The default number of rounds per match.
+DEFAULT_ROUNDS = 10_000
+
+#: A pair of strategy names that play a match, player 1 first.
+Pairing = tuple[str, str]
+
+
+@dataclass(slots=True)
+class Standing:
+    """Represents the running totals of a strategy in a tournament.
+
+    Attributes:
+        name: The name of the strategy.
+        score: The points earned in all matches.
+        wins: The rounds won.
+        draws: The rounds drawn.
+        losses: The rounds lost.
+    """
+
+    name: str
+    score: int = 0
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+
+    def record(self, score: int, wins: int, draws: int, losses: int) -> None:
+        """Adds the points and rounds of one match to the totals."""
+        self.score += score
+        self.wins += wins
+        self.draws += draws
+        self.losses += losses
+
+
+def match_rng(seed: int, pairing: Pairing, player: int) -> random.Random:
+    """Returns the random generator of one player in one match.
+
+    String seeds are hashed with SHA-512, so the generator is the same in
+    every process, regardless of `PYTHONHASHSEED`.
+    """
+    return random.Random(f"{seed}:{pairing[0]}:{pairing[1]}:{player}")  # noqa: S311
+
+
+def _play_pairing(
+    rules: GameRules,
+    strategies: Mapping[str, StrategyFactory],
+    rounds: int,
+    seed: int,
+    pairing: Pairing,
+) -> MatchResult:
+    """Plays the match of one pairing."""
+    player_1 = strategies[pairing[0]](rules, match_rng(seed, pairing, 1))
+    player_2 = strategies[pairing[1]](rules, match_rng(seed, pairing, 2))
+    return play_match(rules, player_1, player_2, rounds)
+
+
+#: The rules and strategies of the current worker process.
+_worker_rules = GameRules()
+_worker_strategies: Mapping[str, StrategyFactory] = STRATEGIES
+
+
+def _init_worker(rules: GameRules, strategies: dict[str, StrategyFactory]) -> None:
+    """Sets the rules of a worker once, instead of sending them with every match."""
+    global _worker_rules, _worker_strategies
+    _worker_rules = rules
+    _worker_strategies = strategies
+
+
+def _play_in_worker(rounds: int, seed: int, pairing: Pairing) -> MatchResult:
+    """Plays the match of one pairing inside a worker process."""
+    return _play_pairing(_worker_rules, _worker_strategies, rounds, seed, pairing)
+
+
+def play_pairings(
+    rules: GameRules,
+    pairings: Iterable[Pairing],
+    rounds: int,
+    seed: int = 0,
+    workers: int = 1,
+    strategies: Mapping[str, StrategyFactory] = STRATEGIES,
+) -> Iterator[tuple[Pairing, MatchResult]]:
+    """Lazily plays a match for every pairing, in a pool if `workers` > 1.
+
+    Yields:
+        Every pairing with the result of its match, in input order.
+    """
+    pairings = list(pairings)
+    if workers <= 1:
+        play = partial(_play_pairing, rules, strategies, rounds, seed)
+        yield from zip(pairings, map(play, pairings), strict=True)
+        return
+
+    with ProcessPoolExecutor(
+        workers, initializer=_init_worker, initargs=(rules, dict(strategies))
+    ) as pool:
+        chunk_size = max(1, len(pairings) // (4 * workers))
+        results = pool.map(partial(_play_in_worker, rounds, seed), pairings, chunksize=chunk_size)
+        yield from zip(pairings, results, strict=True)
+
+
+def run_tournament(
+    rules: GameRules,
+    names: Iterable[str] | None = None,
+    rounds: int = DEFAULT_ROUNDS,
+    seed: int = 0,
+    workers: int = 1,
+    store: RatingStore | None = None,
+    strategies: Mapping[str, StrategyFactory] = STRATEGIES,
+) -> list[Standing]:
+    """Plays a round-robin tournament and ranks the strategies.
+
+    Args:
+        rules: The rules of the game.
+        names: The strategies to enter, by name; defaults to all of them.
+        rounds: The number of rounds per match.
+        seed: The tournament seed, from which every match is seeded.
+        workers: The number of worker processes.
+        store: A rating store that receives the running score of both
+            players after every match.
+        strategies: The available strategies by name.
+
+    Returns:
+        The standings, from the highest score to the lowest.
+
+    Raises:
+        ValueError: If a strategy name is unknown.
+    """
+    names = list(strategies if names is None else dict.fromkeys(names))
+    unknown = [name for name in names if name not in strategies]
+    if unknown:
+        raise ValueError(f"Unknown strategies: {', '.join(unknown)}")
+
+    standings = {name: Standing(name) for name in names}
+    for pairing, result in play_pairings(
+        rules, combinations(names, 2), rounds, seed, workers, strategies
+    ):
+        first, second = standings[pairing[0]], standings[pairing[1]]
+        first.record(result.score_1, result.wins, result.draws, result.losses)
+        second.record(result.score_2, result.losses, result.draws, result.wins)
+        if store is not None:
+            store.set(first.name, first.score)
+            store.set(second.name, second.score)
+
+    return sorted(standings.values(), key=lambda standing: (-standing.score, standing.name))
+
+
+def main() -> None:
+    """Runs a tournament from the command line and prints the standings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "strategies", nargs="*", help=f"Strategies to enter (default: {', '.join(STRATEGIES)})"
+    )
+    parser.add_argument("--options", default="", help="Comma-separated game options")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Rounds per match")
+    parser.add_argument("--seed", type=int, default=0, help="Tournament seed")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--rating-file", type=Path, help="Rating store to stream the scores to")
+    args = parser.parse_args()
+
+    rules = create_rules_from_input(args.options)
+    store = open_rating_store(args.rating_file) if args.rating_file else None
+    try:
+        standings = run_tournament(
+            rules, args.strategies or None, args.rounds, args.seed, args.workers, store
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        if store is not None:
+            store.close()
+
+    for rank, standing in enumerate(standings, start=1):
+        print(
+            f"{rank}. {standing.name}: {standing.score} "
+            f"({standing.wins} won, {standing.draws} drawn, {standing.losses} lost)"
+        )
+
+
+if __name__ == "__main__":
+    main()
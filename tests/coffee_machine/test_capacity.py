@@ -0,0 +1,144 @@
+"""Unit tests for the capacity queries."""
+
+from __future__ import annotations
+
+import itertools
+import random
+import unittest
+from unittest.mock import patch
+
+from hyperskill_python_portfolio.coffee_machine import capacity
+from hyperskill_python_portfolio.coffee_machine.capacity import best_mix, max_servings
+from hyperskill_python_portfolio.coffee_machine.models import RECIPES, CoffeeRecipe, Inventory
+
+CAPACITY_PATH = "hyperskill_python_portfolio.coffee_machine.capacity"
+
+
+def _brute_force(inventory: Inventory) -> int:
+    """Returns the best revenue by trying every combination of drinks."""
+    stock = (inventory.water, inventory.milk, inventory.beans, inventory.cups)
+    limits = max_servings(inventory).values()
+    best = 0
+    for counts in itertools.product(*(range(limit + 1) for limit in limits)):
+        used = [0, 0, 0, 0]
+        for count, recipe in zip(counts, RECIPES.values(), strict=True):
+            used[0] += count * recipe.water_ml
+            used[1] += count * recipe.milk_ml
+            used[2] += count * recipe.beans_g
+            used[3] += count * recipe.cups
+        if all(u <= s for u, s in zip(used, stock, strict=True)):
+            revenue = sum(
+                count * recipe.price_usd
+                for count, recipe in zip(counts, RECIPES.values(), strict=True)
+            )
+            best = max(best, revenue)
+    return best
+
+
+class TestCapacity(unittest.TestCase):
+    """Test suite for max_servings and best_mix."""
+
+    def setUp(self) -> None:
+        """Set up the stock of a default machine."""
+        self.inventory = Inventory(water=400, milk=540, beans=120, cups=9)
+
+    def test_max_servings(self) -> None:
+        """Test the servings of each drink on its own."""
+        self.assertEqual(max_servings(self.inventory), {"1": 1, "2": 1, "3": 2})
+
+    def test_best_mix(self) -> None:
+        """Test that the best mix of the default stock is two cappuccinos."""
+        mix = best_mix(self.inventory)
+        self.assertEqual(dict(mix.counts), {"1": 0, "2": 0, "3": 2})
+        self.assertEqual(mix.revenue, 12)
+
+    def test_best_mix_matches_brute_force(self) -> None:
+        """Test that the best mix earns as much as the best of all combinations."""
+        rng = random.Random(7)  # noqa: S311
+        for _ in range(100):
+            inventory = Inventory(
+                water=rng.randrange(2000),
+                milk=rng.randrange(600),
+                beans=rng.randrange(120),
+                cups=rng.randrange(10),
+            )
+            mix = best_mix(inventory)
+            with self.subTest(inventory=inventory):
+                self.assertEqual(mix.revenue, _brute_force(inventory))
+                self.assertEqual(
+                    mix.revenue,
+                    sum(RECIPES[key].price_usd * count for key, count in mix.counts.items()),
+                )
+
+    def test_best_mix_matches_brute_force_on_larger_stocks(self) -> None:
+        """Test the best mix on stocks of hundreds of servings against a search of all mixes."""
+        espresso, latte, cappuccino = RECIPES.values()
+        rng = random.Random(11)  # noqa: S311
+        for _ in range(10):
+            inventory = Inventory(
+                water=rng.randrange(60_000),
+                milk=rng.randrange(30_000),
+                beans=rng.randrange(4_000),
+                cups=rng.randrange(200),
+            )
+            best = 0
+            # Fix the espressos and lattes; the cappuccinos take what is left.
+            for espressos in range(inventory.cups + 1):
+                for lattes in range(inventory.cups - espressos + 1):
+                    left = Inventory(
+                        water=inventory.water - espressos * 250 - lattes * 350,
+                        milk=inventory.milk - lattes * 75,
+                        beans=inventory.beans - espressos * 16 - lattes * 20,
+                        cups=inventory.cups - espressos - lattes,
+                    )
+                    if min(left.water, left.milk, left.beans, left.cups) < 0:
+                        continue
+                    revenue = espressos * espresso.price_usd + lattes * latte.price_usd
+                    best = max(best, revenue + max_servings(left)["3"] * cappuccino.price_usd)
+            with self.subTest(inventory=inventory):
+                self.assertEqual(best_mix(inventory).revenue, best)
+
+    def test_best_mix_search_does_not_grow_with_stock(self) -> None:
+        """Test that huge stocks are solved in as few search steps as small ones."""
+        capacity._best_mix.cache_clear()
+        steps = []
+        for scale in (1, 10**3, 10**6):
+            inventory = Inventory(
+                water=400 * scale, milk=540 * scale, beans=120 * scale, cups=9 * scale
+            )
+            # Every search node computes the servings of its item once.
+            with patch(f"{CAPACITY_PATH}._servings", wraps=capacity._servings) as servings:
+                mix = best_mix(inventory)
+            self.assertEqual(mix.revenue, 12 * scale)
+            steps.append(servings.call_count)
+        self.assertEqual(steps, [steps[0]] * 3)
+
+        rng = random.Random(5)  # noqa: S311
+        for _ in range(50):
+            inventory = Inventory(
+                water=rng.randrange(10**6),
+                milk=rng.randrange(10**6),
+                beans=rng.randrange(10**5),
+                cups=rng.randrange(10**4),
+            )
+            with patch(f"{CAPACITY_PATH}._servings", wraps=capacity._servings) as servings:
+                best_mix(inventory)
+            with self.subTest(inventory=inventory):
+                self.assertLessEqual(servings.call_count, 100)
+
+    def test_empty_stock(self) -> None:
+        """Test that an empty machine makes nothing."""
+        self.assertEqual(best_mix(Inventory()).revenue, 0)
+        self.assertEqual(set(max_servings(Inventory()).values()), {0})
+
+    def test_recipe_without_needs(self) -> None:
+        """Test that a recipe consuming nothing is rejected."""
+        free = {"0": CoffeeRecipe("air", 0, 0, 0, 1, cups=0)}
+        with self.assertRaises(ValueError):
+            max_servings(self.inventory, free)
+        with self.assertRaises(ValueError):
+            best_mix(self.inventory, free)
+
+
+if __name__ == "__main__":
+    unittest.main()
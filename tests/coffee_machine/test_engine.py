@@ -0,0 +1,73 @@
+"""Unit tests for the headless CoffeeEngine."""
+
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from hyperskill_python_portfolio.coffee_machine.engine import (
+    Buy,
+    CoffeeEngine,
+    Fill,
+    Filled,
+    OutOfStock,
+    Rejected,
+    Sold,
+    Take,
+    Withdrawn,
+    parse_command,
+)
+from hyperskill_python_portfolio.coffee_machine.machine import CoffeeMachine
+from hyperskill_python_portfolio.coffee_machine.models import CoffeeRecipe
+
+
+class TestCoffeeEngine(unittest.TestCase):
+    """Test suite for the CoffeeEngine."""
+
+    def setUp(self) -> None:
+        """Create a fresh machine and engine for test isolation."""
+        self.machine = CoffeeMachine(water=400, milk=540, beans=120, cups=9, money=550)
+        self.engine = CoffeeEngine(self.machine)
+
+    def test_replays_a_session_without_output(self) -> None:
+        """Test that every command yields the matching event, in order."""
+        commands = [Buy("1"), Buy("2"), Fill(water=1000), Buy("2"), Buy("9"), Take()]
+
+        with patch("sys.stdout") as fake_out:
+            events = list(self.engine.run(commands))
+            fake_out.write.assert_not_called()
+
+        self.assertEqual(
+            events,
+            [
+                Sold("espresso", 4),
+                OutOfStock("latte", "water"),
+                Filled(1000, 0, 0, 0),
+                Sold("latte", 7),
+                Rejected(Buy("9"), "Unknown recipe: '9'"),
+                Withdrawn(561),
+            ],
+        )
+        self.assertEqual(self.machine.water, 800)  # 400 - 250 + 1000 - 350
+        self.assertEqual(self.machine.money, 0)
+
+    def test_serves_the_menu_of_the_machine(self) -> None:
+        """Test that the engine defaults to the machine's own menu."""
+        menu = {"a": CoffeeRecipe("americano", 300, 0, 16, 5)}
+        machine = CoffeeMachine(400, 540, 120, 9, 550, recipes=menu)
+        engine = CoffeeEngine(machine)
+
+        self.assertEqual(engine.apply(Buy("a")), Sold("americano", 5))
+        self.assertEqual(engine.apply(Buy("1")), Rejected(Buy("1"), "Unknown recipe: '1'"))
+
+    def test_parse_command(self) -> None:
+        """Test parsing of the transaction log format."""
+        self.assertEqual(parse_command("buy 3"), Buy("3"))
+        self.assertEqual(parse_command("fill 1 2 3 4\n"), Fill(1, 2, 3, 4))
+        self.assertEqual(parse_command(" take "), Take())
+        with self.assertRaises(ValueError):
+            parse_command("refill")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Unit tests for the Fleet simulator."""
+
+from __future__ import annotations
+
+import random
+import unittest
+
+from hyperskill_python_portfolio.coffee_machine.fleet import Fleet
+from hyperskill_python_portfolio.coffee_machine.machine import CoffeeMachine
+from hyperskill_python_portfolio.coffee_machine.models import RECIPES, Inventory
+
+
+class TestFleet(unittest.TestCase):
+    """Test suite for the Fleet."""
+
+    def test_orders_match_individual_machines(self) -> None:
+        """Test that a fleet serves and refuses exactly like separate machines."""
+        start = Inventory(water=1200, milk=540, beans=120, cups=9, money=550)
+        fleet = Fleet.uniform(5, start)
+        machines = [CoffeeMachine(1200, 540, 120, 9, 550) for _ in range(5)]
+        rng = random.Random(42)  # noqa: S311
+        orders = [(rng.randrange(5), rng.choice("123")) for _ in range(200)]
+
+        report = fleet.apply_orders([m for m, _ in orders], [c for _, c in orders])
+
+        shortages: dict[int, str] = {}
+        for machine, choice in orders:
+            missing = machines[machine].buy(RECIPES[choice])
+            if missing is not None:
+                shortages.setdefault(machine, missing)
+        for index, machine in enumerate(machines):
+            self.assertEqual(fleet.inventory(index), machine.inventory)
+        self.assertEqual(report.shortages, shortages)
+        self.assertEqual(sum(report.served) + sum(report.refused), 200)
+        self.assertEqual(report.stocked_out(), sorted(shortages))
+
+    def test_fill_restocks_a_single_machine(self) -> None:
+        """Test that a refill lets a stocked-out machine serve again."""
+        fleet = Fleet.uniform(2, Inventory(water=250, beans=16, cups=1))
+        self.assertEqual(list(fleet.apply_orders([0, 0], ["1", "1"]).refused), [1, 0])
+
+        fleet.fill(0, Inventory(water=250, beans=16, cups=1))
+        report = fleet.apply_orders([0], ["1"])
+        self.assertEqual(list(report.served), [1, 0])
+        self.assertEqual(fleet.money[0], 8)
+
+    def test_rejects_invalid_batches(self) -> None:
+        """Test that malformed batches are rejected before any order is applied."""
+        fleet = Fleet.uniform(2, Inventory(water=1000, beans=100, cups=5))
+        with self.assertRaises(ValueError):
+            fleet.apply_orders([0, 0], ["1"])
+        with self.assertRaises(ValueError):
+            fleet.apply_orders([0, 0], ["1", "mocha"])
+        with self.assertRaises(ValueError):
+            fleet.apply_orders([0, -1], ["1", "1"])
+        with self.assertRaises(ValueError):
+            fleet.apply_orders([0, 2], ["1", "1"])
+        for machine in range(2):
+            self.assertEqual(fleet.inventory(machine), Inventory(water=1000, beans=100, cups=5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Unit tests for the event-sourced Ledger."""
+
+from __future__ import annotations
+
+import itertools
+import tempfile
+import unittest
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from hyperskill_python_portfolio.coffee_machine.ledger import Ledger
+from hyperskill_python_portfolio.coffee_machine.machine import CoffeeMachine
+from hyperskill_python_portfolio.coffee_machine.models import RECIPES, Inventory
+
+
+class TestLedger(unittest.TestCase):
+    """Test suite for the Ledger."""
+
+    def setUp(self) -> None:
+        """Create a temporary ledger directory and a deterministic clock."""
+        self.directory = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.ticks = itertools.count(1)
+
+    def open_ledger(self) -> Ledger:
+        """Open the ledger with a snapshot every 3 entries."""
+        ledger = Ledger(self.directory, snapshot_every=3, clock=lambda: float(next(self.ticks)))
+        self.addCleanup(ledger.close)
+        return ledger
+
+    def test_machine_is_restored_from_snapshot_and_tail(self) -> None:
+        """Test that every operation is logged and survives a restart."""
+        ledger = self.open_ledger()
+        machine = CoffeeMachine(2000, 540, 120, 9, 550, ledger=ledger)
+        machine.buy(RECIPES["1"])
+        machine.fill(water=100, cups=1)
+        machine.buy(RECIPES["2"])
+        with patch("sys.stdout", new=StringIO()):
+            for user_input in ("take", "buy", "3"):
+                machine.process_input(user_input)
+        ledger.close()
+
+        ledger = self.open_ledger()
+        self.assertEqual(ledger.seq, 6)
+        self.assertEqual(len(list(ledger.snapshots())), 2)
+        self.assertEqual(CoffeeMachine.from_ledger(ledger).inventory, machine.inventory)
+        self.assertEqual(
+            [entry.kind for entry in ledger.entries()],
+            ["open", "sold:espresso", "fill", "sold:latte", "take", "sold:cappuccino"],
+        )
+
+    def test_state_at_reconstructs_the_past(self) -> None:
+        """Test point-in-time reconstruction between snapshots."""
+        ledger = self.open_ledger()
+        machine = CoffeeMachine(2000, 540, 120, 9, 550, ledger=ledger)
+        for _ in range(4):
+            machine.buy(RECIPES["1"])  # At times 2, 3, 4 and 5.
+
+        self.assertEqual(ledger.state_at(0.5), Inventory())
+        self.assertEqual(ledger.state_at(1), Inventory(2000, 540, 120, 9, 550))
+        self.assertEqual(ledger.state_at(4.5), Inventory(2000 - 750, 540, 120 - 48, 6, 562))
+
+    def test_torn_entry_is_dropped_on_recovery(self) -> None:
+        """Test that a partially written last entry does not break recovery."""
+        CoffeeMachine(400, 540, 120, 9, 550, ledger=self.open_ledger()).take()
+        with open(self.directory / "ledger.jsonl", "ab") as log:
+            log.write(b'{"seq": 3, "ti')
+
+        ledger = self.open_ledger()
+        self.assertEqual(ledger.state, Inventory(400, 540, 120, 9, 0))
+        ledger.record("fill", Inventory(cups=1))
+        self.assertEqual(len(list(ledger.entries())), 3)
+
+    def test_restart_reads_only_the_last_snapshot(self) -> None:
+        """Test recovery from a long snapshot file, ending in a torn snapshot."""
+        ledger = Ledger(self.directory, snapshot_every=1)
+        machine = CoffeeMachine(400, 540, 120, 9, 550, ledger=ledger)
+        for _ in range(200):
+            machine.fill(cups=1)
+        ledger.close()
+        with open(self.directory / "snapshots.jsonl", "ab") as snapshots:
+            snapshots.write(b'{"seq": 202, "ti')
+
+        with patch.object(Ledger, "snapshots", side_effect=AssertionError("full scan")):
+            ledger = self.open_ledger()
+        self.assertEqual(ledger.seq, 201)
+        self.assertEqual(ledger.pending, 0)
+        self.assertEqual(ledger.state, machine.inventory)
+
+    def test_machine_must_match_existing_ledger(self) -> None:
+        """Test that a machine cannot silently diverge from its ledger."""
+        ledger = self.open_ledger()
+        CoffeeMachine(400, 540, 120, 9, 550, ledger=ledger)
+        ledger.close()
+        with self.assertRaises(ValueError):
+            CoffeeMachine(1, 1, 1, 1, 1, ledger=self.open_ledger())
+
+
+if __name__ == "__main__":
+    unittest.main()
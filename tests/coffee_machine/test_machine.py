@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import tempfile
 import unittest
 from io import StringIO
+from pathlib import Path
 from unittest.mock import patch
 
 from hyperskill_python_portfolio.coffee_machine.machine import CoffeeMachine
-from hyperskill_python_portfolio.coffee_machine.models import State
+from hyperskill_python_portfolio.coffee_machine.models import RECIPES, State, load_recipes
+
+MENU = """
+[recipes.a]
+name = "americano"
+water_ml = 300
+milk_ml = 0
+beans_g = 16
+price_usd = 5
+
+[recipes.f]
+name = "flat white"
+water_ml = 150
+milk_ml = 120
+beans_g = 18
+price_usd = 8
+"""
 
 
 class TestCoffeeMachine(unittest.TestCase):
@@ -98,6 +116,71 @@ class TestCoffeeMachine(unittest.TestCase):
         self.assertEqual(self.machine.state, State.SHUTDOWN)
         self.assertFalse(self.machine.is_running)
 
+    def test_back_and_unknown_actions(self) -> None:
+        """Test that back returns to the menu and unknown actions change nothing."""
+        self.machine.process_input("buy")
+        self.machine.process_input("back")
+        self.assertEqual(self.machine.state, State.MAIN_MENU)
+
+        self.machine.process_input("1")
+        self.machine.process_input("back")
+        self.assertEqual(self.machine.state, State.MAIN_MENU)
+        self.assertEqual(self.machine.water, 400)
+
+    def test_invalid_selection(self) -> None:
+        """Test that an unknown recipe choice returns to the main menu."""
+        self.machine.process_input("buy")
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            self.machine.process_input("4")
+            self.assertEqual(fake_out.getvalue().strip(), "Invalid selection. Please try again.")
+        self.assertEqual(self.machine.state, State.MAIN_MENU)
+
+
+class TestRecipes(unittest.TestCase):
+    """Test suite for menus loaded from recipe files."""
+
+    def setUp(self) -> None:
+        """Create a temporary directory for recipe files."""
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "recipes.toml"
+
+    def test_default_menu(self) -> None:
+        """Test that the built-in menu is the classic one, in order."""
+        self.assertEqual(list(RECIPES), ["1", "2", "3"])
+        self.assertEqual(RECIPES["2"].name, "latte")
+        self.assertEqual(RECIPES["2"].cups, 1)
+
+    def test_custom_menu(self) -> None:
+        """Test a machine that serves a menu loaded from a file."""
+        self.path.write_text(MENU, encoding="utf-8")
+        machine = CoffeeMachine(400, 540, 120, 9, 550, recipes=load_recipes(self.path))
+
+        machine.process_input("buy")
+        self.assertEqual(
+            machine.prompt,
+            "What do you want to buy? a - americano, f - flat white, back - to main menu: ",
+        )
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            machine.process_input("f")
+            self.assertEqual(
+                fake_out.getvalue().strip(), "I have enough resources, making you a coffee!"
+            )
+        self.assertEqual(machine.milk, 420)
+        self.assertEqual(machine.money, 558)
+
+    def test_invalid_menus(self) -> None:
+        """Test that empty menus and malformed recipes are rejected."""
+        for text in (
+            "",
+            '[recipes.a]\nname = "americano"\n',
+            MENU + "colour = 'black'\n",
+            MENU.replace("300", '"300"'),
+        ):
+            self.path.write_text(text, encoding="utf-8")
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                load_recipes(self.path)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from math import isnan
+
+import pytest
+
+from hyperskill_python_portfolio.loancalc.batch import (
+    batch_annuity_interest,
+    batch_annuity_payment,
+    batch_annuity_periods,
+    batch_annuity_principal,
+    batch_diff,
+)
+from hyperskill_python_portfolio.loancalc.core import (
+    calculate_annuity_interest,
+    calculate_annuity_payment,
+    calculate_annuity_periods,
+    calculate_annuity_principal,
+    calculate_diff,
+)
+
+INTERESTS = [1 / 120, 5.6 / 1200, 7.8 / 1200, 0.5 / 1200]
+PERIODS = [12, 120, 360, 600]
+PRINCIPALS = [1000000, 800018, 500000, 250000]
+PAYMENTS = [87916, 8722, 23000, 3497]
+
+
+def test_batch_annuity_payment_matches_scalar() -> None:
+    res = batch_annuity_payment(INTERESTS, PERIODS, PRINCIPALS)
+    expected = list(map(calculate_annuity_payment, INTERESTS, PERIODS, PRINCIPALS))
+    assert res.payment is not None
+    assert list(res.payment) == [r.payment for r in expected]
+    assert list(res.overpayment) == [r.overpayment for r in expected]
+
+
+def test_batch_annuity_principal_matches_scalar() -> None:
+    res = batch_annuity_principal(INTERESTS, PERIODS, PAYMENTS)
+    expected = list(map(calculate_annuity_principal, INTERESTS, PERIODS, PAYMENTS))
+    assert res.principal is not None
+    assert list(res.principal) == [r.principal for r in expected]
+    assert list(res.overpayment) == [r.overpayment for r in expected]
+
+
+def test_batch_annuity_periods_matches_scalar() -> None:
+    res = batch_annuity_periods(INTERESTS, PRINCIPALS, PAYMENTS)
+    expected = list(map(calculate_annuity_periods, INTERESTS, PRINCIPALS, PAYMENTS))
+    assert res.periods is not None
+    assert list(res.periods) == [r.periods for r in expected]
+    assert list(res.overpayment) == [r.overpayment for r in expected]
+
+
+def test_batch_diff_matches_scalar() -> None:
+    res = batch_diff(INTERESTS, PERIODS, PRINCIPALS)
+    expected = list(map(calculate_diff, INTERESTS, PERIODS, PRINCIPALS))
+    assert list(res.overpayment) == [r.overpayment for r in expected]
+    assert res.payment is None
+
+
+def test_batch_annuity_interest_matches_scalar() -> None:
+    res = batch_annuity_interest(PRINCIPALS, PERIODS, PAYMENTS)
+    expected = list(map(calculate_annuity_interest, PRINCIPALS, PERIODS, PAYMENTS))
+    assert res.interest is not None
+    assert res.iterations is not None
+    assert list(res.interest) == [r.interest for r in expected]
+    assert list(res.overpayment) == [r.overpayment for r in expected]
+    assert all(0 < n < 10 for n in res.iterations)
+
+
+def test_batch_annuity_interest_marks_unsolvable_quotes() -> None:
+    res = batch_annuity_interest([1000, 1000], [12, 12], [100, 50])
+    assert res.interest is not None
+    assert res.iterations is not None
+    assert not isnan(res.interest[0])
+    assert isnan(res.interest[1])
+    assert res.iterations[1] == 0
+
+
+def test_batch_rejects_mismatched_lengths() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        batch_annuity_payment(INTERESTS, PERIODS[:2], PRINCIPALS)
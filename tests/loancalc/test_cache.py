@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from hyperskill_python_portfolio.loancalc.cache import LoanCache
+from hyperskill_python_portfolio.loancalc.core import (
+    calculate_annuity_payment,
+    calculate_annuity_periods,
+    calculate_annuity_principal,
+)
+from hyperskill_python_portfolio.loancalc.portfolio import price_loans
+
+
+def test_cached_results_match_core() -> None:
+    cache = LoanCache()
+    for _ in range(2):
+        assert cache.calculate_annuity_payment(1 / 120, 12, 1000000) == calculate_annuity_payment(
+            1 / 120, 12, 1000000
+        )
+        assert cache.calculate_annuity_principal(
+            5.6 / 1200, 120, 8722
+        ) == calculate_annuity_principal(5.6 / 1200, 120, 8722)
+        assert cache.calculate_annuity_periods(
+            7.8 / 1200, 500000, 23000
+        ) == calculate_annuity_periods(7.8 / 1200, 500000, 23000)
+
+
+def test_cache_counts_hits_and_misses() -> None:
+    cache = LoanCache()
+    cache.calculate_annuity_payment(1 / 120, 12, 1000000)
+    cache.calculate_annuity_payment(1 / 120, 12, 1000000)
+    cache.calculate_annuity_payment(1 / 120, 12, 2000000)
+
+    stats = cache.stats()
+    assert stats["annuity_payment"].hits == 1
+    assert stats["annuity_payment"].misses == 2
+    # Both principals share the compound factor of the same rate and term.
+    assert stats["compound_factor"].hits == 1
+    assert stats["compound_factor"].misses == 1
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = LoanCache(maxsize=2)
+    for principal in (1000, 2000, 3000, 1000):
+        cache.calculate_annuity_payment(0.01, 12, principal)
+
+    stats = cache.stats()["annuity_payment"]
+    assert stats.size == 2
+    assert stats.misses == 4
+
+
+def test_cache_clear_resets_counters() -> None:
+    cache = LoanCache()
+    cache.calculate_annuity_payment(1 / 120, 12, 1000000)
+    cache.clear()
+    assert all(stats.hits == stats.misses == stats.size == 0 for stats in cache.stats().values())
+
+
+def test_price_loans_with_cache_kernels() -> None:
+    loans = [{"type": "diff", "principal": 1000000, "periods": 10, "interest": 10}] * 3
+    cache = LoanCache()
+
+    results = list(price_loans(loans, cache.kernels))
+
+    assert results == list(price_loans(loans))
+    assert cache.stats()["diff_overpayment"].hits == 2
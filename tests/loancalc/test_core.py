@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pytest
+
 from hyperskill_python_portfolio.loancalc.core import (
+    calculate_annuity_interest,
     calculate_annuity_payment,
     calculate_annuity_periods,
     calculate_annuity_principal,
     calculate_diff,
+    calculate_diff_summary,
+    iter_diff_payments,
+    solve_annuity_interest,
 )
+from hyperskill_python_portfolio.loancalc.models import RateSolution
+
+CORE_PATH = "hyperskill_python_portfolio.loancalc.core"
 
 
 def test_annuity_payment() -> None:
@@ -37,3 +48,59 @@ def test_diff() -> None:
     assert len(res.payments) == 10
     assert res.payments[0] > res.payments[-1]
     assert res.overpayment == sum(res.payments) - 1000000
+
+
+def test_iter_diff_payments_is_lazy_and_matches_diff() -> None:
+    """Tests that the streamed schedule equals the materialized one."""
+    payments = iter_diff_payments(10 / 1200, 10, 1000000)
+    assert next(payments) == calculate_diff(10 / 1200, 10, 1000000).payments[0]
+    assert [*payments] == calculate_diff(10 / 1200, 10, 1000000).payments[1:]
+
+
+def test_diff_summary_is_within_rounding_of_schedule() -> None:
+    """Tests that the closed-form overpayment bounds the rounded schedule total."""
+    for periods in (1, 10, 360, 10000):
+        exact = calculate_diff_summary(10 / 1200, periods, 1000000).overpayment
+        rounded = calculate_diff(10 / 1200, periods, 1000000).overpayment
+        assert exact <= rounded <= exact + periods - 1
+
+
+def test_annuity_result_is_slotted_without_schedule() -> None:
+    """Tests that annuity results carry no per-instance dict or payments list."""
+    res = calculate_annuity_payment(1 / 120, 12, 1000000)
+    assert not hasattr(res, "__dict__")
+    assert res.payments == ()
+
+
+def test_annuity_interest_recovers_the_rate() -> None:
+    """Tests that the rate solver inverts the annuity payment calculation."""
+    rate = 5.6 / 1200
+    payment = calculate_annuity_payment(rate, 120, 800000).payment
+    assert payment is not None
+    res = calculate_annuity_interest(800000, 120, payment)
+    assert res.interest == pytest.approx(rate, rel=1e-3)
+    assert res.overpayment == payment * 120 - 800000
+
+
+def test_annuity_interest_rejects_unconverged_rate() -> None:
+    """Tests that a rate the solver did not converge on is not returned."""
+    unconverged = RateSolution(rate=0.01, iterations=100, converged=False)
+    with (
+        patch(f"{CORE_PATH}.solve_annuity_interest", return_value=unconverged),
+        pytest.raises(ValueError, match="did not converge"),
+    ):
+        calculate_annuity_interest(800000, 120, 8722)
+
+
+def test_solve_annuity_interest_converges_quickly() -> None:
+    """Tests the convergence instrumentation of the rate solver."""
+    solution = solve_annuity_interest(1000000, 12, 87916)
+    assert solution.converged
+    assert solution.iterations < 10
+    assert solve_annuity_interest(1200, 12, 100).rate == 0
+
+
+def test_solve_annuity_interest_rejects_insufficient_payments() -> None:
+    """Tests that payments below the principal have no non-negative rate."""
+    with pytest.raises(ValueError, match="non-negative rate"):
+        solve_annuity_interest(1000, 12, 50)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 from argparse import Namespace
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from hyperskill_python_portfolio.loancalc.handlers import handle_annuity, handle_diff
+from hyperskill_python_portfolio.loancalc.handlers import (
+    handle_annuity,
+    handle_batch,
+    handle_diff,
+)
 from hyperskill_python_portfolio.loancalc.models import LoanResult
 
 # Corrected paths to include the full package namespace
@@ -13,7 +18,12 @@ BASE_PATH = "hyperskill_python_portfolio.loancalc.handlers"
 CALCULATE_ANNUITY_PAYMENT_PATH = f"{BASE_PATH}.calculate_annuity_payment"
 CALCULATE_ANNUITY_PRINCIPAL_PATH = f"{BASE_PATH}.calculate_annuity_principal"
 CALCULATE_ANNUITY_PERIODS_PATH = f"{BASE_PATH}.calculate_annuity_periods"
-CALCULATE_DIFF_PATH = f"{BASE_PATH}.calculate_diff"
+ITER_DIFF_PAYMENTS_PATH = f"{BASE_PATH}.iter_diff_payments"
+RUN_PORTFOLIO_PATH = f"{BASE_PATH}.run_portfolio"
+
+
+def _batch_args(path: Path | str) -> Namespace:
+    return Namespace(path=str(path), format=None, workers=1, chunk_size=100, cache_size=0)
 
 
 def test_handle_annuity_calculates_payment() -> None:
@@ -50,6 +60,17 @@ def test_handle_annuity_calculates_principal() -> None:
     assert result_string == expected_string
 
 
+def test_handle_annuity_calculates_interest() -> None:
+    # Arrange: the interest rate is the omitted argument
+    args = Namespace(principal=500000, periods=360, payment=3497, interest=None)
+
+    # Act
+    result_string = handle_annuity(args)
+
+    # Assert
+    assert result_string == "Your annual interest rate = 7.50%!\nOverpayment = 758920"
+
+
 def test_handle_annuity_invalid_args_exits() -> None:
     # Arrange: All arguments are provided, which is an error
     args = Namespace(payment=3500, periods=360, interest=7.5, principal=500000)
@@ -61,27 +82,35 @@ def test_handle_annuity_invalid_args_exits() -> None:
     assert e.value.code == 1
 
 
-def test_handle_diff_calculates_payments() -> None:
+def test_handle_diff_streams_payments(capsys: pytest.CaptureFixture[str]) -> None:
     # Arrange
-    args = Namespace(principal=500000, periods=12, interest=10, payment=None)
-    mock_payments = [43750, 43403, 43056]  # Sample payments
-    mock_result = LoanResult(payments=mock_payments, overpayment=27083)
+    args = Namespace(principal=100000, periods=3, interest=10, payment=None)
+    mock_payments = iter([43750, 43403, 43056])  # Sample payments
 
-    with patch(CALCULATE_DIFF_PATH, return_value=mock_result) as mock_calculate:
+    with patch(ITER_DIFF_PAYMENTS_PATH, return_value=mock_payments) as mock_iter:
         # Act
         result_string = handle_diff(args)
 
-    # Assert
+    # Assert: payments are written directly, the summary is returned
     expected_interest = 10 / (12 * 100)
-    mock_calculate.assert_called_once_with(expected_interest, 12, 500000)
+    mock_iter.assert_called_once_with(expected_interest, 3, 100000)
 
-    expected_string = (
-        "Month 1: payment is 43750\n"
-        "Month 2: payment is 43403\n"
-        "Month 3: payment is 43056\n\n"
-        "Overpayment = 27083"
+    assert capsys.readouterr().out == (
+        "Month 1: payment is 43750\nMonth 2: payment is 43403\nMonth 3: payment is 43056\n"
     )
-    assert result_string == expected_string
+    assert result_string == "\nOverpayment = 30209"
+
+
+def test_handle_diff_summary_only_skips_schedule(capsys: pytest.CaptureFixture[str]) -> None:
+    # Arrange
+    args = Namespace(principal=1000000, periods=10, interest=10, payment=None, summary_only=True)
+
+    # Act
+    result_string = handle_diff(args)
+
+    # Assert: nothing is streamed, only the closed-form overpayment is returned
+    assert capsys.readouterr().out == ""
+    assert result_string == "Overpayment = 45834"
 
 
 def test_handle_diff_with_payment_arg_exits() -> None:
@@ -93,3 +122,34 @@ def test_handle_diff_with_payment_arg_exits() -> None:
         handle_diff(args)
     assert e.type is SystemExit
     assert e.value.code == 1
+
+
+def test_handle_batch_reports_unreadable_portfolio(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit) as e:
+        handle_batch(_batch_args(tmp_path / "missing.csv"))
+    assert e.value.code == 1
+    assert "Cannot read portfolio" in capsys.readouterr().err
+
+
+def test_handle_batch_stops_quietly_on_broken_pipe(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    # Arrange: the reader of the output goes away, e.g., `loancalc batch big.csv | head`
+    portfolio = tmp_path / "loans.csv"
+    portfolio.write_text("id,type,principal,payment,periods,interest\n", encoding="utf-8")
+
+    with (
+        patch(RUN_PORTFOLIO_PATH, side_effect=BrokenPipeError) as mock_run,
+        patch("sys.stdout", new=MagicMock()),
+        patch(f"{BASE_PATH}.os") as mock_os,
+        pytest.raises(SystemExit) as e,
+    ):
+        handle_batch(_batch_args(portfolio))
+
+    # Assert: the error is not reported as a read error, and stdout is silenced
+    mock_run.assert_called_once()
+    mock_os.dup2.assert_called_once()
+    assert e.value.code == 1
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+from io import StringIO
+
+import pytest
+
+from hyperskill_python_portfolio.loancalc.portfolio import (
+    detect_format,
+    price_loan,
+    price_loans,
+    price_loans_parallel,
+    run_portfolio,
+)
+
+
+def test_price_loan_calculates_missing_annuity_field() -> None:
+    loan = {"type": "annuity", "principal": "500000", "periods": "360", "interest": "7.5"}
+    result = price_loan(loan)
+    assert result["payment"] == 3497
+    assert result["overpayment"] == 758920
+    assert "error" not in result
+
+
+def test_price_loan_reports_invalid_record_as_error() -> None:
+    loan = {"type": "annuity", "principal": 500000, "payment": 3500, "interest": 7.5, "periods": 1}
+    result = price_loan(loan)
+    assert result["error"] == (
+        "Exactly one of principal, payment, periods, or interest must be omitted."
+    )
+
+
+def test_price_loan_solves_annuity_interest() -> None:
+    loan = {"type": "annuity", "principal": 500000, "payment": 3497, "periods": 360}
+    result = price_loan(loan)
+    assert result["interest"] == pytest.approx(7.5, abs=0.01)
+    assert result["overpayment"] == 758920
+
+
+def test_price_loan_rejects_unknown_type() -> None:
+    result = price_loan({"type": "balloon", "interest": 5})
+    assert "Unknown loan type" in result["error"]
+
+
+def test_run_portfolio_streams_csv_rows_in_order() -> None:
+    source = StringIO(
+        "id,type,principal,payment,periods,interest\n"
+        "a,annuity,500000,,360,7.5\n"
+        "b,diff,1000000,,12,10\n"
+    )
+    target = StringIO()
+
+    count = run_portfolio(source, target, "csv")
+
+    assert count == 2
+    assert target.getvalue().splitlines() == [
+        "id,type,principal,payment,periods,interest,overpayment,error",
+        "a,annuity,500000,3497,360,7.5,758920,",
+        "b,diff,1000000,,12,10,54172,",
+    ]
+
+
+def test_run_portfolio_adds_solved_interest_column() -> None:
+    source = StringIO("type,principal,payment,periods\nannuity,500000,3497,360\n")
+    target = StringIO()
+
+    run_portfolio(source, target, "csv")
+
+    header, row = target.getvalue().splitlines()
+    assert header == "type,principal,payment,periods,interest,overpayment,error"
+    record = dict(zip(header.split(","), row.split(","), strict=True))
+    assert float(record["interest"]) == pytest.approx(7.5, abs=0.01)
+    assert record["overpayment"] == "758920"
+    assert record["error"] == ""
+
+
+def test_run_portfolio_streams_jsonl_lines() -> None:
+    source = StringIO(
+        '{"type": "annuity", "payment": 3500, "periods": 360, "interest": 7.5}\n\nx\n'
+    )
+    target = StringIO()
+
+    count = run_portfolio(source, target, "jsonl")
+
+    results = [json.loads(line) for line in target.getvalue().splitlines()]
+    assert count == 2
+    assert results[0]["principal"] == 500561
+    assert results[1] == {"error": "Line 3: Expecting value"}
+
+
+def test_run_portfolio_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError, match="Unsupported"):
+        run_portfolio(StringIO(), StringIO(), "xml")
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [("loans.csv", "csv"), ("loans.JSONL", "jsonl"), ("-", "csv")],
+)
+def test_detect_format(path: str, expected: str) -> None:
+    assert detect_format(path) == expected
+
+
+def test_price_loans_parallel_preserves_input_order() -> None:
+    loans = [
+        {"type": "annuity", "principal": 1000 * n, "periods": 12, "interest": 5}
+        for n in range(1, 50)
+    ]
+
+    results = list(price_loans_parallel(loans, workers=2, chunk_size=3))
+
+    assert results == list(price_loans(loans))
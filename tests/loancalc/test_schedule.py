@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from io import BytesIO, StringIO
+from math import isclose
+
+import pytest
+
+from hyperskill_python_portfolio.loancalc.core import calculate_annuity_payment
+from hyperskill_python_portfolio.loancalc.schedule import (
+    AmortizationSchedule,
+    build_amortization_schedule,
+)
+
+
+def test_schedule_repays_the_principal() -> None:
+    schedule = build_amortization_schedule(7.5 / 1200, 360, 500000)
+    payment = calculate_annuity_payment(7.5 / 1200, 360, 500000).payment
+
+    assert len(schedule) == 360
+    assert list(schedule.period) == list(range(1, 361))
+    assert schedule.payment[0] == payment
+    assert schedule.payment[-1] < payment
+    assert schedule.balance[-1] == 0
+    assert isclose(sum(schedule.principal), 500000)
+
+
+def test_schedule_stops_once_repaid() -> None:
+    schedule = build_amortization_schedule(6 / 1200, 360, 100)
+
+    assert len(schedule) < 360
+    assert schedule.balance[-1] == 0
+
+
+def test_schedule_to_csv() -> None:
+    target = StringIO()
+    build_amortization_schedule(1 / 120, 12, 1000000).to_csv(target)
+
+    lines = target.getvalue().splitlines()
+    assert lines[0] == "period,payment,interest,principal,balance"
+    assert lines[1] == "1,87916.00,8333.33,79582.67,920417.33"
+    assert len(lines) == 13
+
+
+def test_schedule_columnar_round_trip() -> None:
+    schedule = build_amortization_schedule(5.6 / 1200, 120, 800000)
+    buffer = BytesIO()
+
+    schedule.to_columnar(buffer)
+    buffer.seek(0)
+
+    assert AmortizationSchedule.from_columnar(buffer) == schedule
+
+
+def test_from_columnar_rejects_other_files() -> None:
+    with pytest.raises(ValueError, match="Not a columnar"):
+        AmortizationSchedule.from_columnar(BytesIO(b"period,payment\n"))
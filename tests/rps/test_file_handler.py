@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hyperskill_python_portfolio.rps.file_handler import (
+    get_user_score,
+    load_ratings,
+    save_user_score,
+)
+
+
+def test_load_ratings_indexes_every_user(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    rating_file.write_bytes(b"alice 100\nmalformed\nbob -5\r\n  carol  350 \nalice 999\n")
+
+    index = load_ratings(rating_file)
+
+    assert len(index) == 3
+    assert index.get("alice") == get_user_score("alice", rating_file) == 100
+    assert index.get("bob") == -5
+    assert index.get("carol") == 350
+    assert index.get("dave") is None
+    assert rating_file.read_bytes()[index.offsets[index.positions["bob"]] :].startswith(b"bob")
+
+
+def test_load_ratings_handles_empty_file(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    rating_file.touch()
+    assert len(load_ratings(rating_file)) == 0
+
+
+def test_load_ratings_skips_scores_beyond_64_bits(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    rating_file = tmp_path / "rating.txt"
+    rating_file.write_text(f"alice {2**64}\nbob {2**63 - 1}\nalice 5\n", encoding="utf-8")
+
+    index = load_ratings(rating_file)
+
+    assert index.get("alice") is None
+    assert index.get("bob") == 2**63 - 1
+    assert "out-of-range score for alice" in caplog.text
+
+
+def test_load_ratings_requires_existing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        load_ratings(tmp_path / "missing.txt")
+
+
+def _save_scores(rating_file: Path, writer: int) -> None:
+    for n in range(20):
+        save_user_score(f"user{writer}-{n}", n, rating_file)
+
+
+def test_concurrent_saves_do_not_lose_updates(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    with ProcessPoolExecutor(4) as pool:
+        list(pool.map(_save_scores, [rating_file] * 4, range(4)))
+
+    assert len(load_ratings(rating_file)) == 80
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file permissions")
+def test_save_keeps_file_permissions(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    rating_file.write_text("alice 100\n", encoding="utf-8")
+    rating_file.chmod(0o644)
+
+    save_user_score("bob", 50, rating_file)
+
+    assert stat.S_IMODE(rating_file.stat().st_mode) == 0o644
+    assert rating_file.read_text(encoding="utf-8") == "alice 100\nbob 50\n"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file permissions")
+def test_save_creates_file_with_default_permissions(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    umask = os.umask(0o022)
+    try:
+        # Changing the umask, even briefly, would race with other threads.
+        with patch("os.umask", side_effect=AssertionError("umask changed")):
+            save_user_score("alice", 100, rating_file)
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(rating_file.stat().st_mode) == 0o644
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["rating.txt", "rating.txt.lock"]
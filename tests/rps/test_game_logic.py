@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from hyperskill_python_portfolio.rps.game_logic import GameRules
+import copy
+import pickle
+
+import pytest
+
+from hyperskill_python_portfolio.rps.game_logic import (
+    GameRules,
+    clear_rules_cache,
+    create_rules_from_input,
+    rules_cache_stats,
+)
 
 
 def test_classic_rock_paper_scissors() -> None:
@@ -13,3 +23,60 @@ def test_classic_rock_paper_scissors() -> None:
     assert options.compare("rock", "rock") == 0
     # Computer wins
     assert options.compare("rock", "paper") == -1
+
+
+#: What every option beats in rock-paper-scissors-lizard-Spock.
+RPSLS_BEATS = {
+    "rock": {"scissors", "lizard"},
+    "paper": {"rock", "spock"},
+    "scissors": {"paper", "lizard"},
+    "lizard": {"spock", "paper"},
+    "spock": {"scissors", "rock"},
+}
+
+
+def test_outcome_table_matches_rock_paper_scissors_lizard_spock() -> None:
+    rules = GameRules(("rock", "spock", "paper", "lizard", "scissors"))
+    for p1_index, p1_choice in enumerate(rules.options):
+        for p2_index, p2_choice in enumerate(rules.options):
+            if p1_choice == p2_choice:
+                expected = 0
+            elif p2_choice in RPSLS_BEATS[p1_choice]:
+                expected = 1
+            else:
+                expected = -1
+            assert rules.compare_indices(p1_index, p2_index) == expected
+            assert rules.compare(p1_choice, p2_choice) == expected
+
+
+def test_every_option_beats_half_of_the_others() -> None:
+    rules = GameRules(("rock", "gun", "lightning", "devil", "dragon", "water", "air"))
+    assert all(sum(row) == 0 for row in rules.outcomes)
+    assert all(row.count(1) == 3 for row in rules.outcomes)
+
+
+def test_rules_survive_pickle_and_deepcopy() -> None:
+    rules = GameRules(("rock", "gun", "lightning"))
+    for copied in (pickle.loads(pickle.dumps(rules)), copy.deepcopy(rules)):  # noqa: S301
+        assert copied == rules
+        assert copied.indices == rules.indices
+        assert copied.compare("gun", "rock") == 1
+        with pytest.raises(TypeError):
+            copied.indices["air"] = 3  # type: ignore[index]
+
+
+def test_compare_rejects_unknown_choice() -> None:
+    with pytest.raises(ValueError, match="'lizard' is not a valid option"):
+        GameRules().compare("rock", "lizard")
+
+
+def test_create_rules_from_input_shares_cached_rules() -> None:
+    clear_rules_cache()
+
+    rules = create_rules_from_input("Rock, Gun,Lightning")
+    assert rules.options == ("rock", "gun", "lightning")
+    assert create_rules_from_input("rock,gun, lightning") is rules
+    assert create_rules_from_input("") is create_rules_from_input("") == GameRules()
+
+    stats = rules_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 2, 2)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hyperskill_python_portfolio.rps.file_handler import save_user_score
+from hyperskill_python_portfolio.rps.game_logic import GameRules
+from hyperskill_python_portfolio.rps.leaderboard import Leaderboard
+from hyperskill_python_portfolio.rps.main import format_top, game_loop
+
+
+def test_leaderboard_ranks_players_by_score() -> None:
+    leaderboard = Leaderboard([("alice", 300), ("bob", 500), ("carol", 300), ("dave", 100)])
+
+    assert leaderboard.top(3) == [("bob", 500), ("alice", 300), ("carol", 300)]
+    assert [leaderboard.rank(name) for name in ("bob", "alice", "carol", "dave")] == [1, 2, 2, 4]
+    assert leaderboard.rank("erin") is None
+
+    leaderboard.update("dave", 600)
+    leaderboard.update("bob", 200)
+    assert leaderboard.top() == [("dave", 600), ("alice", 300), ("carol", 300), ("bob", 200)]
+    assert leaderboard.rank("bob") == 4
+    assert len(leaderboard) == 4
+
+
+def test_leaderboard_follows_saved_scores(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    rating_file.write_text("alice 300\nbob 500\n", encoding="utf-8")
+    leaderboard = Leaderboard.from_file(rating_file)
+    try:
+        save_user_score("alice", 900, rating_file)
+        save_user_score("carol", 1000, tmp_path / "other.txt")
+    finally:
+        leaderboard.close()
+    save_user_score("bob", 0, rating_file)
+
+    assert leaderboard.top(2) == [("alice", 900), ("bob", 500)]
+    assert leaderboard.get("carol") is None
+    assert leaderboard.get("bob") == 500
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"),
+    [
+        ("!top", "1. bob 500\n2. alice 300"),
+        ("!top 1", "1. bob 500"),
+        ("!top 0", "Invalid input"),
+        ("!top many", "Invalid input"),
+    ],
+)
+def test_format_top(command: str, expected: str) -> None:
+    assert format_top(command, Leaderboard([("alice", 300), ("bob", 500)])) == expected
+
+
+def test_game_loop_closes_the_leaderboard_it_loads(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    rating_file = tmp_path / "rating.txt"
+    rating_file.write_text("alice 300\n", encoding="utf-8")
+
+    with (
+        patch("hyperskill_python_portfolio.rps.main.DEFAULT_RATING_FILE", rating_file),
+        patch("builtins.input", side_effect=["!top", "!exit"]),
+        patch.object(Leaderboard, "close", autospec=True, side_effect=Leaderboard.close) as close,
+    ):
+        game_loop(0, GameRules())
+
+    close.assert_called_once()
+    assert capsys.readouterr().out == "1. alice 300\nBye!\n"
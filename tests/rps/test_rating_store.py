@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from hyperskill_python_portfolio.rps.rating_store import (
+    CoalescingRatingStore,
+    JournalRatingStore,
+    RatingStore,
+    SqliteRatingStore,
+    TextRatingStore,
+    open_rating_store,
+)
+
+
+@pytest.fixture(params=["rating.txt", "rating.db"])
+def store(request: pytest.FixtureRequest, tmp_path: Path) -> RatingStore:
+    return open_rating_store(tmp_path / request.param)
+
+
+def test_store_saves_and_updates_scores(store: RatingStore) -> None:
+    assert store.get("alice") is None
+
+    store.set("alice", 100)
+    store.set("bob", 50)
+    store.set("alice", 250)
+
+    assert store.get("alice") == 250
+    assert sorted(store.items()) == [("alice", 250), ("bob", 50)]
+    store.close()
+
+
+def test_open_rating_store_selects_backend_by_suffix(tmp_path: Path) -> None:
+    assert isinstance(open_rating_store(tmp_path / "rating.txt"), TextRatingStore)
+    with open_rating_store(tmp_path / "rating.sqlite") as store:
+        assert isinstance(store, SqliteRatingStore)
+
+
+def test_sqlite_store_imports_and_exports_text(tmp_path: Path) -> None:
+    source = tmp_path / "rating.txt"
+    source.write_text("alice 100\nmalformed\nbob 50\n", encoding="utf-8")
+    target = tmp_path / "exported.txt"
+
+    with SqliteRatingStore(tmp_path / "rating.db") as store:
+        assert store.import_text(source) == 2
+        assert store.get("bob") == 50
+        assert store.export_text(target) == 2
+
+    assert target.read_text(encoding="utf-8") == "alice 100\nbob 50\n"
+
+
+def test_journal_store_replays_updates_after_restart(tmp_path: Path) -> None:
+    snapshot = tmp_path / "rating.txt"
+    snapshot.write_text("alice 100\nbob 50\n", encoding="utf-8")
+
+    with JournalRatingStore(snapshot, compact_every=None) as store:
+        store.set("alice", 200)
+        store.set("carol", 150)
+    # Simulate a crash in the middle of writing a record.
+    with open(store.journal_path, "a", encoding="utf-8") as journal:
+        journal.write("dave")
+
+    assert snapshot.read_text(encoding="utf-8") == "alice 100\nbob 50\n"
+    with JournalRatingStore(snapshot, compact_every=None) as store:
+        assert dict(store.items()) == {"alice": 200, "bob": 50, "carol": 150}
+        assert store.pending == 2
+
+
+def test_journal_store_drops_torn_record_before_appending(tmp_path: Path) -> None:
+    snapshot = tmp_path / "rating.txt"
+    with JournalRatingStore(snapshot, compact_every=None) as store:
+        store.set("alice", 123)
+    # A crash cut the last record short, leaving a well-formed prefix.
+    with open(store.journal_path, "a", encoding="utf-8") as journal:
+        journal.write("alice 12")
+
+    with JournalRatingStore(snapshot, compact_every=None) as store:
+        assert store.get("alice") == 123
+        store.set("bob", 5)
+    assert store.journal_path.read_text(encoding="utf-8") == "alice 123\nbob 5\n"
+
+    with JournalRatingStore(snapshot, compact_every=None) as store:
+        assert dict(store.items()) == {"alice": 123, "bob": 5}
+
+
+def test_journal_store_compacts_into_snapshot(tmp_path: Path) -> None:
+    snapshot = tmp_path / "rating.txt"
+
+    with JournalRatingStore(snapshot, compact_every=3) as store:
+        for score in (10, 20, 30):
+            store.set("alice", score)
+        store.set("bob", 5)
+
+        assert store.pending == 1
+        assert snapshot.read_text(encoding="utf-8") == "alice 30\n"
+        assert store.journal_path.read_text(encoding="utf-8") == "bob 5\n"
+
+        store.compact()
+
+    assert snapshot.read_text(encoding="utf-8") == "alice 30\nbob 5\n"
+    assert store.journal_path.read_text(encoding="utf-8") == ""
+    assert sorted(tmp_path.iterdir()) == sorted([snapshot, store.journal_path])
+
+
+def test_coalescing_store_flushes_buffered_updates(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    rating_file.write_text("alice 100\n", encoding="utf-8")
+
+    with CoalescingRatingStore(rating_file, flush_every=3) as store:
+        store.set("bob", 50)
+        store.set("alice", 200)
+        assert store.get("alice") == 200
+        assert rating_file.read_text(encoding="utf-8") == "alice 100\n"
+
+        store.set("carol", 150)
+        assert rating_file.read_text(encoding="utf-8") == "alice 200\nbob 50\ncarol 150\n"
+
+        store.set("dave", 10)
+    assert TextRatingStore(rating_file).get("dave") == 10
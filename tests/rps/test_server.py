@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from hyperskill_python_portfolio.rps.file_handler import get_user_score, update_user_scores
+from hyperskill_python_portfolio.rps.server import RatingWriter, running_server
+
+
+async def _play(rating_file: Path) -> list[str]:
+    async with running_server("127.0.0.1", 0, rating_file, flush_interval=60) as server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"alice\nrock,paper,scissors\nrock\nlizard\n!rating\n!exit\n")
+        lines = [line.decode().rstrip("\n") async for line in reader]
+        writer.close()
+        await writer.wait_closed()
+    return lines
+
+
+def test_server_plays_a_session_and_flushes_the_rating(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    rating_file.write_text("alice 1000\nbob 50\n", encoding="utf-8")
+
+    hello, start, turn, invalid, rating, bye = asyncio.run(_play(rating_file))
+
+    assert (hello, start, invalid, bye) == (
+        "Hello, alice",
+        "Okay, let's start",
+        "Invalid input",
+        "Bye!",
+    )
+    score = int(rating.removeprefix("Your rating: "))
+    expected = {"Well done": 1100, "There is a draw": 1050, "Sorry": 1000}
+    assert score == next(points for prefix, points in expected.items() if turn.startswith(prefix))
+    assert get_user_score("alice", rating_file) == score
+    assert get_user_score("bob", rating_file) == 50
+
+
+def test_failed_flush_keeps_the_batch_behind_newer_scores(tmp_path: Path) -> None:
+    ratings = RatingWriter(tmp_path / "rating.txt")
+    ratings.set("alice", 100)
+    ratings.set("bob", 50)
+
+    def fail(updates: dict[str, int], file_path: Path) -> None:
+        ratings.set("alice", 200)  # A turn played while the write was running.
+        raise OSError("No space left on device")
+
+    with patch("hyperskill_python_portfolio.rps.server.update_user_scores", fail):
+        with pytest.raises(OSError, match="No space"):
+            asyncio.run(ratings.flush())
+
+    assert ratings.pending == {"alice": 200, "bob": 50}
+
+
+def test_flusher_survives_a_failed_write(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+    ratings = RatingWriter(rating_file)
+    ratings.set("alice", 100)
+    writes = iter([OSError("Resource temporarily unavailable"), None])
+
+    def flaky(updates: dict[str, int], file_path: Path) -> None:
+        if (error := next(writes)) is not None:
+            raise error
+        update_user_scores(updates, file_path)
+
+    async def run() -> None:
+        flusher = asyncio.create_task(ratings.run(interval=0.01))
+        while not rating_file.exists():
+            await asyncio.sleep(0.01)
+        flusher.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flusher
+
+    with patch("hyperskill_python_portfolio.rps.server.update_user_scores", flaky):
+        asyncio.run(asyncio.wait_for(run(), timeout=5))
+
+    assert get_user_score("alice", rating_file) == 100
+
+
+async def _send_raw(rating_file: Path, data: bytes) -> list[str]:
+    async with running_server("127.0.0.1", 0, rating_file, flush_interval=60) as server:
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(data)
+        lines = [line.decode().rstrip("\n") async for line in reader]
+        writer.close()
+        await writer.wait_closed()
+    return lines
+
+
+def test_server_rejects_undecodable_and_overlong_lines(tmp_path: Path) -> None:
+    rating_file = tmp_path / "rating.txt"
+
+    lines = asyncio.run(_send_raw(rating_file, b"alice\n\n\xff\xfe\n!exit\n"))
+    assert lines == ["Hello, alice", "Okay, let's start", "Invalid input", "Bye!"]
+
+    lines = asyncio.run(_send_raw(rating_file, b"alice\n\n" + b"x" * 100_000 + b"\n"))
+    assert lines == ["Hello, alice", "Okay, let's start", "Invalid input"]
+
+    lines = asyncio.run(_send_raw(rating_file, b"\xff\n"))
+    assert lines == ["Invalid input"]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from hyperskill_python_portfolio.rps.game_logic import GameRules
+from hyperskill_python_portfolio.rps.simulation import (
+    FrequencyStrategy,
+    MarkovStrategy,
+    RandomStrategy,
+    play_match,
+)
+
+
+def _rng(seed: int) -> random.Random:
+    return random.Random(seed)  # noqa: S311
+
+
+class _Constant:
+    """Always plays the same option."""
+
+    def __init__(self, choice: int) -> None:
+        self.choice = choice
+
+    def choose(self) -> int:
+        return self.choice
+
+    def observe(self, own_choice: int, opponent_choice: int) -> None:
+        pass
+
+
+class _Cycle:
+    """Plays the options in order, over and over."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.next = 0
+
+    def choose(self) -> int:
+        choice, self.next = self.next, (self.next + 1) % self.size
+        return choice
+
+    def observe(self, own_choice: int, opponent_choice: int) -> None:
+        pass
+
+
+def test_match_is_scored_like_the_interactive_game() -> None:
+    rules = GameRules()
+    # Paper (1) always beats rock (0).
+    result = play_match(rules, _Constant(1), _Constant(0), rounds=10)
+
+    assert (result.wins, result.draws, result.losses) == (10, 0, 0)
+    assert (result.score_1, result.score_2) == (1000, 0)
+    assert result.win_rate == 1.0
+
+
+def test_frequency_strategy_counters_favorite_move() -> None:
+    rules = GameRules()
+    result = play_match(rules, FrequencyStrategy(rules, _rng(1)), _Constant(2), 100)
+    assert result.wins >= 99
+
+
+def test_markov_strategy_learns_a_cycle() -> None:
+    rules = GameRules()
+    result = play_match(rules, MarkovStrategy(rules, _rng(1)), _Cycle(3), 300)
+    assert result.wins >= 290
+
+
+def test_random_match_is_reproducible_and_balanced() -> None:
+    rules = GameRules()
+
+    def play() -> tuple[int, int, int]:
+        result = play_match(
+            rules,
+            RandomStrategy(rules, _rng(1)),
+            RandomStrategy(rules, _rng(2)),
+            30_000,
+        )
+        return result.wins, result.draws, result.losses
+
+    outcome = play()
+    assert outcome == play()
+    assert sum(outcome) == 30_000
+    assert all(9_000 < count < 11_000 for count in outcome)
+
+
+def test_random_strategy_subclass_plays_its_own_moves() -> None:
+    class AlwaysPaper(RandomStrategy):
+        def choose(self) -> int:
+            return 1
+
+    rules = GameRules()
+    players = (AlwaysPaper(rules, _rng(1)), AlwaysPaper(rules, _rng(2)))
+    result = play_match(rules, *players, rounds=50)
+    assert (result.wins, result.draws, result.losses) == (0, 50, 0)
+
+
+def test_match_rejects_negative_rounds() -> None:
+    rules = GameRules()
+    with pytest.raises(ValueError, match="non-negative"):
+        play_match(rules, _Constant(0), _Constant(0), -1)
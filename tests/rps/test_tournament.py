@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from hyperskill_python_portfolio.rps.game_logic import GameRules
+from hyperskill_python_portfolio.rps.rating_store import TextRatingStore
+from hyperskill_python_portfolio.rps.tournament import run_tournament
+
+
+def test_tournament_is_reproducible_across_worker_counts(tmp_path: Path) -> None:
+    rules = GameRules()
+    serial = run_tournament(rules, rounds=500, seed=7)
+    store = TextRatingStore(tmp_path / "rating.txt")
+    parallel = run_tournament(rules, rounds=500, seed=7, workers=2, store=store)
+
+    assert serial == parallel
+    assert [standing.score for standing in serial] == sorted(
+        (standing.score for standing in serial), reverse=True
+    )
+    assert dict(store.items()) == {standing.name: standing.score for standing in serial}
+
+
+def test_tournament_plays_every_pair_once() -> None:
+    standings = run_tournament(GameRules(), ["random", "markov", "frequency"], rounds=100)
+    # Each of the three strategies plays two matches of 100 rounds.
+    assert all(s.wins + s.draws + s.losses == 200 for s in standings)
+
+
+def test_tournament_rejects_unknown_strategy() -> None:
+    with pytest.raises(ValueError, match="Unknown strategies: oracle"):
+        run_tournament(GameRules(), ["random", "oracle"])